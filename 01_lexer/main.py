@@ -153,8 +153,31 @@ def t_error(t):
 
 lexer = ply.lex.lex()
 
+COMMENT = re.compile(r"\.{3,3}([\s\S]*?)\.{3,3}")
+DOTS = re.compile(r"\.{3,3}")
+
+def comment_free_blocks(infile, size=1 << 20):
+    '''Read a file in blocks of about size characters, with the comments
+       removed. Blocks end at a line end outside comments, so no token (or
+       comment) is split between two blocks.'''
+    lines = []
+    length = 0
+    open_comment = False
+    for line in infile:
+        lines.append(line)
+        length += len(line)
+        #comments start and end at every other ... (like COMMENT.sub does)
+        if len(DOTS.findall(line)) % 2:
+            open_comment = not open_comment
+        if length >= size and not open_comment:
+            yield COMMENT.sub("", "".join(lines))
+            lines = []
+            length = 0
+    if lines:
+        yield COMMENT.sub("", "".join(lines))
+
 if __name__ == '__main__':
-    import argparse, codecs
+    import argparse
     parser = argparse.ArgumentParser()
     group = parser.add_mutually_exclusive_group()
     group.add_argument('--who', action='store_true', help='who wrote this' )
@@ -166,15 +189,16 @@ if __name__ == '__main__':
     elif ns.file is None:
         parser.print_help()
     else:
-        with codecs.open( ns.file, 'r', encoding='utf-8' ) as INFILE:
-            data = INFILE.read() 
-            
-        #pre eliminate comments 
-        data = re.sub(r"\.{3,3}([\s\S]*?)\.{3,3}","",data)
-        lexer.input( data )
-
-        while True:
-            token = lexer.token()
-            if token is None:
-                break
-            print( token )
+        #the file is lexed in blocks, so that the whole file is never in
+        #memory; lexpos counts from the start of the comment-free text
+        offset = 0
+        with open( ns.file, 'r', encoding='utf-8', newline='' ) as INFILE:
+            for data in comment_free_blocks(INFILE):
+                lexer.input( data )
+                while True:
+                    token = lexer.token()
+                    if token is None:
+                        break
+                    token.lexpos += offset
+                    print( token )
+                offset += len(data)
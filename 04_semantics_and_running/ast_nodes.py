@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+
+# The abstract syntax tree node built by the parser in main.py.
+#
+# Nodes use __slots__ instead of an attribute dictionary, and store their
+# node type as a small integer "kind" (nodetype is still available as a
+# string). The sign of a factor (-x) is an explicit flag instead of a
+# ('-', value) tuple in the value.
+
+# All node types, the kind of a node is its index in this tuple
+
+NODE_TYPES = (
+    "program",
+    "function_or_variable_definition_list",
+    "variable_definition_list",
+    "definition_function",
+    "definition_subroutine",
+    "definition_sheet",
+    "definition_range",
+    "definition_scalar",
+    "func",
+    "sub",
+    "return",
+    "formals",
+    "scalar",
+    "range",
+    "sheet",
+    "sheet_init_size",
+    "sheet_init_list",
+    "sheet_row",
+    "decimal",
+    "statement_list",
+    "print_sheet",
+    "print_range",
+    "print_scalar",
+    "if",
+    "if_else",
+    "while",
+    "for",
+    "info_string",
+    "range_list",
+    "arguments",
+    "subroutine_call",
+    "cell_ref_assignment",
+    "sheet_assignment",
+    "range_assign",
+    "scalar_assignment",
+    "range_expr",
+    "int",
+    "cell_ref",
+    "dollar",
+    "coordinate",
+    "scalar_expr",
+    "compare",
+    "simple_expr",
+    "oper",
+    "term",
+    "cell_length",
+    "function_call",
+)
+
+KINDS = {nodetype: kind for kind, nodetype in enumerate(NODE_TYPES)}
+
+class Node:
+    __slots__ = ('kind', 'value', 'negative', 'lineno', 'children_', 'symdata')
+
+    def __init__(self, type=None, value=None, lineno=0):
+        self.setType(type)
+        self.setValue(value)
+        # True for a negated factor, eg -x
+        self.negative = False
+        self.lineno = lineno
+        self.children_ = []
+        # set by the semantic checks for definitions
+        self.symdata = None
+
+    def addChild(self, node):
+        self.children_.append(node)
+
+    def insertFirstChild(self, child):
+        self.children_.insert(0,child)
+
+    def setValue(self, value):
+        self.value = value
+
+    def setType(self, type):
+        self.kind = KINDS[type]
+
+    def assignChildren(self, children):
+        self.children_ = children
+
+    @property
+    def nodetype(self):
+        return NODE_TYPES[self.kind]
@@ -0,0 +1,1140 @@
+#!/usr/bin/env python3
+#
+
+# Microbenchmarks of the interpreter's building blocks.
+#
+# usage: bench.py BENCHMARK [options]
+#
+# Each benchmark generates its own (large) SheetScript program, so no input
+# files are needed. Timings are the best of --repeat runs.
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+def load_main():
+    '''Import main.py, hiding the table generation messages of PLY'''
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        import main
+    return main
+
+def ident(i, prefix):
+    '''A lower case identifier for number i (identifiers can't contain digits)'''
+    s = ""
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 26)
+        s = chr(ord('a') + r) + s
+    return prefix + s
+
+def generate_program(variables=2000, subroutines=200, statements=45000, seed=1):
+    '''Source of a generated program: scalar definitions, subroutines, and a
+       mix of assignments, ifs, subroutine calls and cell assignments'''
+    rnd = random.Random(seed)
+    lines = ["sheet AA = 10 * 10"]
+    for i in range(variables):
+        lines.append(f"scalar {ident(i, 'v')} = {i}.0 * 2.0 + 1.0")
+    for i in range(subroutines):
+        p, l = ident(i, 'p'), ident(i, 'l')
+        lines.append(f"subroutine {ident(i, 'Sub')}[ {p} : scalar ] is")
+        lines.append(f"  scalar {l} = {p} + 1.0")
+        lines.append(f"  print_scalar {l}")
+        lines.append("end")
+    for i in range(statements):
+        a = ident(rnd.randrange(variables), 'v')
+        b = ident(rnd.randrange(variables), 'v')
+        kind = i % 4
+        if kind == 0:
+            lines.append(f"{a} := {b} * 2.0 + {a} / 3.0 - AA'B2")
+        elif kind == 1:
+            lines.append(f"if {a} < {b} then\n  {a} := {b}\nendif")
+        elif kind == 2 and subroutines:
+            lines.append(f"{ident(rnd.randrange(subroutines), 'Sub')}[ {a} + 1.0 ]")
+        else:
+            lines.append(f"AA'C3 := {a} - {b}")
+    return "\n".join(lines) + "\n"
+
+def best_time(func, repeat):
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def report(rows, baseline=None):
+    '''Print (name, seconds) rows, with the speedup against the first row'''
+    base = rows[0][1] if baseline is None else baseline
+    for name, seconds in rows:
+        print(f"  {name:<40} {seconds*1000:10.1f} ms  {base/seconds:6.2f}x")
+
+# Traversal: computing the children of every node of a large tree
+
+def legacy_get_childvars(node, child_prefix="child_", children_prefix="children_"):
+    '''get_childvars before the child schema cache: scans all attributes of
+       the node and builds label strings on every call'''
+    import tree_print
+    childvars = []
+    if hasattr(node, "__dict__"):
+        attributes = vars(node).items()
+    else:
+        # __slots__ nodes (ast_nodes.Node)
+        attributes = [(name, getattr(node, name)) for name in tree_print.slot_names(type(node))]
+    for name,val in attributes:
+        if name.startswith(child_prefix):
+            label = name[len(child_prefix):]
+            childvars.append((label, val))
+        elif name.startswith(children_prefix):
+            label = name[len(children_prefix):]
+            if val is None:
+                childvars.append((label+"[NONE stored instead of a list!!!]", None))
+            elif not val:
+                childvars.append((label+"[EMPTY]", None))
+            else:
+                childvars.extend([(label+"["+str(i)+"]", child) for (i, child) in enumerate(val)])
+    return childvars
+
+def bench_traversal(ns):
+    import tree_print
+    main = load_main()
+    tree = main.parser.parse(generate_program(statements=ns.statements), lexer=main.lexer)
+
+    def walk_labels(get_childvars):
+        def walk():
+            stack = [tree]
+            count = 0
+            while stack:
+                node = stack.pop()
+                count += 1
+                for name, child in get_childvars(node):
+                    if child:
+                        stack.append(child)
+            return count
+        return walk
+
+    def walk_fast():
+        stack = [tree]
+        while stack:
+            stack.extend(tree_print.child_nodes(stack.pop()))
+
+    nodes = walk_labels(legacy_get_childvars)()
+    print(f"traversal of {nodes} nodes")
+    report([
+        ("attribute scan on every call (before)", best_time(walk_labels(legacy_get_childvars), ns.repeat)),
+        ("cached schema, get_childvars", best_time(walk_labels(tree_print.get_childvars), ns.repeat)),
+        ("cached schema, child_nodes", best_time(walk_fast, ns.repeat)),
+    ])
+
+# Nodes: memory used by the syntax tree, per node
+
+class LegacyNode:
+    '''The syntax tree node before ast_nodes.Node: attributes in a __dict__,
+       the node type as a string and the sign of factors in the value'''
+    def __init__(self, type=None, value=None):
+        self.nodetype = type
+        self.value = value
+        self.children_ = []
+
+# Node types that p_factor gave a ('+', value) or ('-', value) value
+FACTOR_TYPES = ("decimal", "scalar", "cell_ref", "function_call", "cell_length")
+
+def copy_tree(tree, make_node):
+    '''Copy a syntax tree, make_node(node) creates a copy without children'''
+    root = make_node(tree)
+    stack = [(tree, root)]
+    count = 0
+    while stack:
+        node, copy = stack.pop()
+        count += 1
+        for child in node.children_:
+            if hasattr(child, "nodetype"):
+                child_copy = make_node(child)
+                stack.append((child, child_copy))
+            else:
+                child_copy = child
+            copy.children_.append(child_copy)
+    return root, count
+
+def traced_bytes(func):
+    '''Memory allocated by func() and still in use, and its result'''
+    import gc, tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+def bench_nodes(ns):
+    from ast_nodes import Node, KINDS
+    main = load_main()
+    tree = main.parser.parse(generate_program(statements=ns.statements), lexer=main.lexer)
+
+    def legacy(node):
+        value = node.value
+        if node.nodetype in FACTOR_TYPES:
+            value = ('-' if node.negative else '+', value)
+        return LegacyNode(node.nodetype, value)
+
+    def slotted(node):
+        copy = Node(node.nodetype, node.value, node.lineno)
+        copy.negative = node.negative
+        return copy
+
+    legacy_size, (legacy_tree, count) = traced_bytes(lambda: copy_tree(tree, legacy))
+    slotted_size, (slotted_tree, count) = traced_bytes(lambda: copy_tree(tree, slotted))
+    print(f"syntax tree of {count} nodes (including child lists and sign tuples)")
+    for name, size in [("dict nodes, sign tuples (before)", legacy_size),
+                       ("__slots__ nodes, kind and sign flag", slotted_size)]:
+        print(f"  {name:<40} {size/2**20:8.1f} MiB  {size/count:6.1f} bytes/node")
+
+    # count the decimal nodes, comparing type strings (before) and kinds
+    def walk_legacy():
+        stack = [legacy_tree]
+        decimals = 0
+        while stack:
+            node = stack.pop()
+            if node.nodetype == "decimal":
+                decimals += 1
+            stack.extend(node.children_)
+        return decimals
+
+    def walk_slotted():
+        stack = [slotted_tree]
+        decimals = 0
+        while stack:
+            node = stack.pop()
+            if node.kind == K_DECIMAL:
+                decimals += 1
+            stack.extend(node.children_)
+        return decimals
+
+    K_DECIMAL = KINDS["decimal"]
+    report([
+        ("walk, dict nodes, nodetype (before)", best_time(walk_legacy, ns.repeat)),
+        ("walk, __slots__ nodes, kind", best_time(walk_slotted, ns.repeat)),
+    ])
+
+# Flat: the struct-of-arrays syntax tree of flat_ast.py
+
+def bench_flat(ns):
+    import flat_ast
+    import tree_print
+    from ast_nodes import Node
+    main = load_main()
+    source = generate_program(statements=ns.statements)
+    tree = main.parser.parse(source, lexer=main.lexer)
+
+    node_size, _ = traced_bytes(lambda: copy_tree(tree, lambda node: Node(node.nodetype, node.value)))
+    flat_size, flat = traced_bytes(lambda: flat_ast.FlatTree.from_node(tree))
+    data = flat.to_bytes()
+    print(f"syntax tree of {len(flat)} nodes, {len(flat.values)} distinct values")
+    print(f"  {'Node objects':<40} {node_size/2**20:8.1f} MiB  {node_size/len(flat):6.1f} bytes/node")
+    print(f"  {'flat arrays':<40} {flat_size/2**20:8.1f} MiB  {flat_size/len(flat):6.1f} bytes/node")
+    print(f"  {'flat, serialized':<40} {len(data)/2**20:8.1f} MiB  {len(data)/len(flat):6.1f} bytes/node")
+
+    def printed(treeprint, tree):
+        def run():
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                treeprint(tree)
+            return output.getvalue()
+        return run
+
+    # the tree dump of main.py, from the parser's Nodes or from the flat tree
+    # of a parse cache hit
+    print_nodes, print_flat = printed(tree_print.treeprint, tree), printed(flat_ast.treeprint, flat)
+    if print_nodes() != print_flat():
+        raise SystemExit("the flat tree prints differently")
+    print("printing the tree (tree_print.treeprint, flat_ast.treeprint)")
+    report([
+        ("Node objects", best_time(print_nodes, ns.repeat)),
+        ("flat arrays", best_time(print_flat, ns.repeat)),
+    ])
+    print("getting a Node tree")
+    report([
+        ("lex and parse", best_time(lambda: main.parser.parse(source, lexer=main.lexer), ns.repeat)),
+        ("from_bytes and to_node", best_time(lambda: flat_ast.FlatTree.from_bytes(data).to_node(), ns.repeat)),
+        ("from_node (flattening)", best_time(lambda: flat_ast.FlatTree.from_node(tree), ns.repeat)),
+    ])
+
+# Parse cache: getting the syntax tree of an unchanged program
+
+def bench_parse_cache(ns):
+    import parse_cache
+    import tempfile
+    main = load_main()
+    source = generate_program(statements=ns.statements)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        key = parse_cache.cache_key(source, main.GRAMMAR_SIGNATURE)
+        parse_cache.store_tree(cache_dir, key, main.parser.parse(source, lexer=main.lexer))
+        size = os.path.getsize(parse_cache.cache_path(cache_dir, key))
+        print(f"cache entry of {len(source)/2**20:.1f} MiB source: {size/2**20:.1f} MiB")
+        report([
+            ("lex and parse", best_time(lambda: main.parser.parse(source, lexer=main.lexer), ns.repeat)),
+            ("cache hit", best_time(lambda: parse_cache.load_tree(cache_dir, key), ns.repeat)),
+        ])
+
+# Startup: time from starting main.py to the output of the first statement
+
+STARTUP_PROGRAM = "scalar x = 1.0\nprint_scalar !first! x\n"
+
+def time_to_first_statement(directory, program):
+    '''Seconds from starting main.py in directory until the first statement
+       of program has printed its output'''
+    import subprocess
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "main.py", "--no-cache", "--engine=closure",
+                                "-f", program], cwd=directory, text=True,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    for line in process.stdout:
+        if line.startswith("first"):
+            elapsed = time.perf_counter() - start
+            break
+    else:
+        raise RuntimeError("main.py did not run the program")
+    process.communicate()
+    return elapsed
+
+def bench_startup(ns):
+    import glob
+    import ply_tables
+    import shutil
+    import subprocess
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        # a copy of the interpreter without tables or bytecode caches
+        for path in glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.py")):
+            if not os.path.basename(path).startswith((ply_tables.LEXTAB, ply_tables.PARSETAB)):
+                shutil.copy(path, directory)
+        program = os.path.join(directory, "first.sheet")
+        with open(program, "w") as f:
+            f.write(STARTUP_PROGRAM)
+
+        def remove_tables():
+            for name in (ply_tables.LEXTAB, ply_tables.PARSETAB):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(os.path.join(directory, name + ".py"))
+
+        def cold():
+            remove_tables()
+            return time_to_first_statement(directory, program)
+
+        rows = [("tables generated at start", min(cold() for i in range(ns.repeat)))]
+        rows.append(("precompiled tables", min(time_to_first_statement(directory, program)
+                                               for i in range(ns.repeat))))
+        report(rows)
+
+        # many processes starting at the same time without tables: all of
+        # them must run the program, and the tables must end up complete
+        remove_tables()
+        processes = [subprocess.Popen([sys.executable, "main.py", "--no-cache", "-f", program],
+                                      cwd=directory, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True)
+                     for i in range(ns.parallel)]
+        failed = sum("first1.0" not in process.communicate()[0] for process in processes)
+        print(f"{ns.parallel} parallel cold starts: {failed} failed")
+        print(f"  {'precompiled tables after them':<40} {time_to_first_statement(directory, program)*1000:10.1f} ms")
+
+# Lexer: the PLY lexer and combined_lexer.py
+
+LEXER_SAMPLES = [
+    "if a != b then print_scalar !x...c...y! a-1.0 ...multi\nline... _r A1b Ab AB abc1\n",
+    "x:=y..z $ # <= >= < > { } ' : , / * + ( ) [ ] 12 -3 4.5 SS'A10 _range\n\n\t end\n",
+    "a := 1 ! b",  # illegal character
+    "print_scalar !no end\n!",
+    "scalar x = 1.0\nprint_scalar !x! x  ",  # blanks at the end, no newline
+    "scalar x = 1.0\t \n \t",
+]
+
+def lex_all(lexer, data, chunk_size=None):
+    '''(type, value, lineno, lexpos) of all tokens, or the error message.
+       With chunk_size, the lexer gets the data in chunks of that size, like
+       --stream reads it.'''
+    lexer.lineno = 1
+    if chunk_size is None:
+        lexer.input(data)
+    else:
+        lexer.input_chunks(data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+    tokens = []
+    try:
+        while True:
+            token = lexer.token()
+            if token is None:
+                return tokens
+            tokens.append((token.type, token.value, token.lineno, token.lexpos))
+    except Exception as e:
+        return tokens + [str(e)]
+
+def bench_lexer(ns):
+    import combined_lexer
+    main = load_main()
+    combined = combined_lexer.CombinedLexer(main.reserved)
+
+    # both lexers must give the same tokens
+    program = generate_program(statements=2000)
+    for data in LEXER_SAMPLES + [program]:
+        expected = lex_all(main.lexer, data)
+        if expected != lex_all(combined, data):
+            raise SystemExit("different tokens for " + repr(data[:60]))
+        for chunk_size in (1, 7, 4096):
+            if expected != lex_all(combined, data, chunk_size):
+                raise SystemExit(f"different tokens in chunks of {chunk_size} for " + repr(data[:60]))
+    print(f"same tokens for {len(LEXER_SAMPLES) + 1} sources, also in chunks")
+
+    source = generate_program(statements=ns.statements)
+    source *= max(1, int(ns.megabytes * 2**20 / len(source)))
+    megabytes = len(source.encode("utf-8")) / 2**20
+
+    def count(lexer):
+        def run():
+            lexer.input(source)
+            for token in iter(lexer.token, None):
+                pass
+        return run
+
+    rows = [("PLY lexer", best_time(count(main.lexer), ns.repeat)),
+            ("combined regexp lexer", best_time(count(combined), ns.repeat))]
+    print(f"lexing {megabytes:.1f} MB")
+    report(rows)
+    for name, seconds in rows:
+        print(f"  {name:<40} {megabytes/seconds:10.1f} MB/s")
+
+# Stream: peak memory of lexing files of growing size
+
+STREAM_LEXERS = {
+    "read whole file, PLY lexer (before)": """
+import codecs
+with codecs.open(path, 'r', encoding='utf-8') as f:
+    data = f.read()
+lexer = main.lexer
+lexer.input(data)
+""",
+    "streamed, combined lexer": """
+import combined_lexer
+lexer = combined_lexer.CombinedLexer(main.reserved)
+lexer.input_chunks(combined_lexer.read_chunks(path))
+""",
+}
+
+def peak_memory(setup, path):
+    '''Peak memory (MiB) of a process lexing path with the setup code'''
+    import subprocess
+    code = ("import bench, resource, sys\nmain = bench.load_main()\npath = sys.argv[1]\n"
+            + setup + "for token in iter(lexer.token, None):\n    pass\n"
+            "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n")
+    output = subprocess.run([sys.executable, "-c", code, path], check=True, text=True,
+                            stdout=subprocess.PIPE,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    return int(output.split()[-1]) / 1024
+
+def bench_stream(ns):
+    import tempfile
+    source = generate_program(statements=ns.statements)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big.sheet")
+        for megabytes in (ns.megabytes / 4, ns.megabytes):
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(max(1, int(megabytes * 2**20 / len(source)))):
+                    f.write(source)
+            size = os.path.getsize(path) / 2**20
+            print(f"peak memory lexing {size:.1f} MiB")
+            for name, setup in STREAM_LEXERS.items():
+                print(f"  {name:<40} {peak_memory(setup, path):8.1f} MiB")
+
+# Tokens: storing the lexer output
+
+class ListLexer:
+    '''Gives the parser the tokens of a list'''
+    def __init__(self, tokens):
+        self.token = iter(tokens + [None]).__next__
+    def input(self, data):
+        pass
+
+def bench_tokens(ns):
+    import token_buffer
+    main = load_main()
+    source = generate_program(statements=ns.statements)
+
+    def lex_list():
+        main.lexer.lineno = 1
+        main.lexer.input(source)
+        return list(iter(main.lexer.token, None))
+
+    def lex_buffer():
+        main.lexer.lineno = 1
+        main.lexer.input(source)
+        return token_buffer.TokenBuffer(main.tokens).extend(main.lexer)
+
+    list_size, tokens = traced_bytes(lex_list)
+    buffer_size, buffer = traced_bytes(lex_buffer)
+    count = len(tokens)
+    print(f"{count} tokens, {len(buffer.strings)} distinct strings, {len(buffer.numbers)} numbers")
+    for name, size in [("list of LexTokens", list_size), ("token buffer", buffer_size)]:
+        print(f"  {name:<40} {size/2**20:8.1f} MiB  {size/count:6.1f} bytes/token")
+
+    print("parsing the stored tokens")
+    report([
+        ("list of LexTokens", best_time(lambda: main.parser.parse(lexer=ListLexer(tokens)), ns.repeat)),
+        ("token buffer", best_time(lambda: main.parser.parse(lexer=token_buffer.BufferLexer(buffer)), ns.repeat)),
+    ])
+
+# Incremental: parsing a large program again after a small edit
+
+def same_program(a, b):
+    '''Whether two incremental.Programs have the same tokens and tree'''
+    def state(program):
+        flat = program.flat_tree()
+        tokens = program.tokens
+        return ([list(column) for column in flat.columns()],
+                [(type(value), value) for value in flat.values],
+                [list(column) for column in tokens.columns()[2:]],
+                [tokens.token_value(i) for i in range(len(tokens))],
+                list(program.item_start))
+    return state(a) == state(b)
+
+def same_tree(program, main):
+    '''Whether an incremental.Program has the tree (and line numbers) that
+       main.py's parser gives'''
+    import flat_ast
+    main.lexer.lineno = 1
+    flat = flat_ast.FlatTree.from_node(main.parser.parse(program.text, lexer=main.lexer))
+    mine = program.flat_tree()
+    return ([list(column) for column in flat.columns()] == [list(column) for column in mine.columns()]
+            and [(type(value), value) for value in flat.values]
+            == [(type(value), value) for value in mine.values])
+
+INCREMENTAL_EDITS = ["", "x", "\n", "+ 1.0", "...", "va := vb\n", "scalar zz = 1.0\n",
+                     "if va < vb then\n", "endif\n", "... comment ...\n", "Suba[ va ]\n"]
+
+def random_edit(text, rnd):
+    '''(offset, removed, inserted) at a random place of text'''
+    offset = rnd.randrange(len(text) + 1)
+    if rnd.randrange(2):
+        # whole lines
+        offset = text.rfind("\n", 0, offset) + 1
+        end = text.find("\n", offset) + 1 or len(text)
+        removed = rnd.choice([0, end - offset])
+    else:
+        removed = min(rnd.choice([0, 1, 2, 5]), len(text) - offset)
+    return offset, removed, rnd.choice(INCREMENTAL_EDITS)
+
+def bench_incremental(ns):
+    import incremental
+    main = load_main()
+    grammar = incremental.Grammar(main)
+
+    # edits must give the tokens and tree of a full parse, and the tree of
+    # main.py's parser, or the same error
+    rnd = random.Random(1)
+    program = incremental.Program(grammar, generate_program(
+        variables=20, subroutines=5, statements=60, seed=3))
+    compared = errors = 0
+    for i in range(1000):
+        offset, removed, inserted = random_edit(program.text, rnd)
+        edit = (offset, removed, inserted)
+        text = program.text[:offset] + inserted + program.text[offset + removed:]
+        try:
+            reference = incremental.Program(grammar, text)
+        except Exception as e:
+            reference = e
+        try:
+            program.edit(offset, removed, inserted)
+        except Exception as e:
+            if not isinstance(reference, Exception) or repr(e) != repr(reference):
+                raise SystemExit(f"different error for edit {edit!r}: {e!r}, not {reference!r}")
+            errors += 1
+            continue
+        if isinstance(reference, Exception) or not same_program(program, reference):
+            raise SystemExit(f"different result for edit {edit!r}")
+        if not same_tree(program, main):
+            raise SystemExit(f"not the tree of main.py after edit {edit!r}")
+        compared += 1
+    print(f"same tokens and tree as a full parse after {compared} of 1000 random edits, "
+          f"the same error after the other {errors}")
+
+    # 4 statements take 6 lines
+    source = generate_program(statements=ns.lines * 2 // 3)
+    print(f"{source.count(chr(10))} lines, {len(source) / 2**20:.1f} MiB")
+    start = time.perf_counter()
+    program = incremental.Program(grammar, source)
+    full = time.perf_counter() - start
+
+    # a statement in the middle of the program, "va := vb * 2.0 + ..."
+    offset = source.index(" * 2.0 + ", len(source) // 2) + 3
+    def change_number():
+        for digit in "42":
+            program.edit(offset, 1, digit)
+    def add_line():
+        program.edit(offset, 0, "1.0 +\n")
+        program.edit(offset, 6, "")
+    rows = [("full parse", full),
+            ("edit a number", best_time(change_number, ns.repeat) / 2),
+            ("add a line (and remove it)", best_time(add_line, ns.repeat) / 2)]
+    report(rows)
+
+    print("checking the result against a full parse")
+    if not same_program(program, incremental.Program(grammar, program.text)) or not same_tree(program, main):
+        raise SystemExit("different result")
+
+# Optimize: a loop full of constant expressions, with and without the
+# optimization pass
+
+OPTIMIZE_PROGRAM = """scalar i = 0.0
+scalar x = 0.0
+while i < {iterations}.0 do
+  x := x * 1.0 + 2.0 * 3.0 / 4.0 - 0.5 * 2.0
+  if 1.0 < 2.0 then
+    i := i + 1.0 * 1.0
+  else
+    print_scalar !never! i
+  endif
+done
+print_scalar !x! x
+"""
+
+def engines(main):
+    '''run_program(tree, semdata) of each engine'''
+    import pycodegen
+    def python(tree, semdata):
+        pycodegen.run_code(pycodegen.compile_source(pycodegen.generate_source(tree, semdata), "bench"),
+                           semdata.caches)
+    return {"tree": main.run_program, "closure": main.closure_engine.run_program,
+            "vm": main.bytecode_vm.run_program, "python": python}
+
+def bench_optimize(ns):
+    import optimizer
+    main = load_main()
+    source = OPTIMIZE_PROGRAM.format(iterations=ns.statements // 2)
+
+    def run(engine, optimize):
+        main.lexer.lineno = 1
+        tree = main.parser.parse(source, lexer=main.lexer)
+        semdata = main.new_semdata()
+        main.semantic_checks(tree, semdata)
+        if optimize:
+            tree = optimizer.optimize(tree)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            engine(tree, semdata)
+        return output.getvalue()
+
+    print(f"{ns.statements // 2} iterations of a loop")
+    for name, engine in engines(main).items():
+        if run(engine, True) != run(engine, False):
+            raise SystemExit(f"different output with the {name} engine")
+        report([(f"{name}, as parsed", best_time(lambda: run(engine, False), ns.repeat)),
+                (f"{name}, optimized", best_time(lambda: run(engine, True), ns.repeat))])
+
+# Calls: a loop calling subroutines with parameters and locals
+
+CALLS_PROGRAM = """scalar i = 0.0
+scalar total = 0.0
+subroutine Add[ x : scalar, y : scalar ] is
+  scalar s = x + y
+  total := total + s
+end
+subroutine Step[ n : scalar ] is
+  scalar m = n * 2.0
+  Add[ n, m ]
+  Add[ m, 1.0 ]
+end
+while i < {iterations}.0 do
+  Step[ i ]
+  i := i + 1.0
+done
+print_scalar !total! total
+"""
+
+# Operands are evaluated left to right, a call after a variable that
+# assigns it does not change the value the variable had
+CALL_ORDER_PROGRAM = """scalar x = 1.0
+function Fx[ ] return scalar is
+  x := 5.0
+  return 2.0
+end
+print_scalar !sum! x + Fx[ ]
+x := 1.0
+print_scalar !cmp! x < Fx[ ]
+x := 1.0
+print_scalar !chain! x < 3.0 < Fx[ ] + x
+"""
+
+def run_checked(main, source, engine, caches=None):
+    '''Output of running source with engine, after the semantic checks'''
+    main.lexer.lineno = 1
+    tree = main.parser.parse(source, lexer=main.lexer)
+    semdata = main.new_semdata()
+    semdata.caches = caches
+    main.semantic_checks(tree, semdata)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        engine(tree, semdata)
+    return output.getvalue()
+
+def bench_calls(ns):
+    main = load_main()
+    iterations = ns.statements // 2
+    source = CALLS_PROGRAM.format(iterations=iterations)
+    print(f"{iterations} iterations, {3 * iterations} subroutine calls")
+    for name, engine in engines(main).items():
+        if run_checked(main, CALL_ORDER_PROGRAM, engine) != "sum3.0\ncmp1.0\nchain1.0\n":
+            raise SystemExit(f"the {name} engine evaluates operands out of order")
+    outputs = set()
+    rows = []
+    for name, engine in engines(main).items():
+        outputs.add(run_checked(main, source, engine))
+        rows.append((name, best_time(lambda: run_checked(main, source, engine), ns.repeat)))
+    if len(outputs) != 1:
+        raise SystemExit("the engines give different output")
+    report(rows)
+
+# Recursion: deep and branching recursive function calls
+
+RECURSION_PROGRAM = """function Sum[ n : scalar ] return scalar is
+  if n = 0.0 then
+    return 0.0
+  endif
+  return n + Sum[ n - 1.0 ]
+end
+function Fib[ n : scalar ] return scalar is
+  if n < 2.0 then
+    return n
+  endif
+  return Fib[ n - 1.0 ] + Fib[ n - 2.0 ]
+end
+print_scalar !sum! Sum[ {depth}.0 ]
+print_scalar !fib! Fib[ 18.0 ]
+"""
+
+def bench_recursion(ns):
+    main = load_main()
+    source = RECURSION_PROGRAM.format(depth=ns.depth)
+    # shallow recursion runs on every engine
+    shallow = RECURSION_PROGRAM.format(depth=100)
+    if len({run_checked(main, shallow, engine) for engine in engines(main).values()}) != 1:
+        raise SystemExit("the engines give different output at recursion depth 100")
+    print(f"recursion depth {ns.depth}, and 8361 calls of Fib")
+    outputs = set()
+    rows = []
+    for name, engine in engines(main).items():
+        try:
+            outputs.add(run_checked(main, source, engine))
+        except RecursionError:
+            # the engines that make Python calls
+            print(f"  {name:<40} RecursionError")
+            continue
+        rows.append((name, best_time(lambda: run_checked(main, source, engine), ns.repeat)))
+    if len(outputs) != 1:
+        raise SystemExit("the engines give different output")
+    report(rows)
+
+# Memo: a pure function called again and again with the same arguments, and
+# a recursive one
+
+MEMO_PROGRAM = """scalar i = 0.0
+scalar j = 0.0
+scalar total = 0.0
+function Price[ n : scalar ] return scalar is
+  scalar p = 1.0
+  scalar k = 0.0
+  while k < n do
+    p := p * 1.1
+    k := k + 1.0
+  done
+  return p
+end
+function Fib[ n : scalar ] return scalar is
+  if n < 2.0 then
+    return n
+  endif
+  return Fib[ n - 1.0 ] + Fib[ n - 2.0 ]
+end
+while j < {iterations}.0 do
+  i := 0.0
+  while i < 20.0 do
+    total := total + Price[ i ]
+    i := i + 1.0
+  done
+  j := j + 1.0
+done
+print_scalar !total! total
+print_scalar !fib! Fib[ 20.0 ]
+"""
+
+def bench_memo(ns):
+    import memo
+    main = load_main()
+    iterations = ns.statements // 40
+    source = MEMO_PROGRAM.format(iterations=iterations)
+    print(f"{20 * iterations} calls of Price (20 different arguments), Fib[ 20.0 ]")
+    for name, engine in engines(main).items():
+        if run_checked(main, source, engine) != run_checked(main, source, engine, memo.Caches()):
+            raise SystemExit(f"different output with the {name} engine")
+        report([(name, best_time(lambda: run_checked(main, source, engine), ns.repeat)),
+                (f"{name}, memoized", best_time(lambda: run_checked(main, source, engine, memo.Caches()),
+                                                ns.repeat))])
+
+# Aggregates: the sum of a column of a sheet with the built-in Sum, and with
+# one cell_ref per cell (cell references can't be computed, so that is what
+# a program without Sum has to do)
+
+AGGREGATE_PROGRAM = """sheet S = 1 * 999
+scalar i = 0.0
+scalar total = 0.0
+S'A1 := 1.5
+S'A500 := 2.5
+S'A999 := -0.5
+while i < {iterations}.0 do
+  total := {column}
+  i := i + 1.0
+done
+print_scalar !total! total
+"""
+
+def bench_aggregates(ns):
+    main = load_main()
+    iterations = ns.statements // 100
+    cells = " + ".join("S'A" + str(row) for row in range(1, 1000))
+    sources = [("cell by cell", AGGREGATE_PROGRAM.format(iterations=iterations, column=cells)),
+               ("Sum", AGGREGATE_PROGRAM.format(iterations=iterations, column="Sum[ range S'A1..S'A999 ]"))]
+    print(f"{iterations} sums of a column of 999 cells")
+    for name, engine in engines(main).items():
+        outputs = set(run_checked(main, source, engine) for label, source in sources)
+        if len(outputs) != 1:
+            raise SystemExit(f"different output with the {name} engine")
+        report([(f"{name}, {label}", best_time(lambda: run_checked(main, source, engine), ns.repeat))
+                for label, source in sources])
+
+# Ranges: range variables are views of their sheet, their memory doesn't
+# depend on the number of cells
+
+RANGES_PROGRAM = """sheet BIG = 702 * 999
+{ranges}BIG'A1 := 1.5
+print_scalar !first! BIG'A1
+"""
+
+def bench_ranges(ns):
+    main = load_main()
+    corners = [("a column", "BIG'A1..BIG'A999"), ("a row", "BIG'A1..BIG'ZZ1")]
+
+    def kept_bytes(count, corner):
+        ranges = "".join(f"range {ident(i, '_r')} = range {corner}\n" for i in range(count))
+        source = RANGES_PROGRAM.format(ranges=ranges)
+        main.lexer.lineno = 1
+        tree = main.parser.parse(source, lexer=main.lexer)
+        semdata = main.new_semdata()
+        main.semantic_checks(tree, semdata)
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                main.run_program(tree, semdata)
+            return semdata.frames[0]
+        return traced_bytes(run)
+
+    print("memory kept by range variables aliasing a sheet of 702 * 999 cells")
+    base, _ = kept_bytes(0, None)
+    rows = []
+    for label, corner in corners:
+        for count in (1, 10, 100):
+            size, frame = kept_bytes(count, corner)
+            views = [value for value in frame if value is not None and value.base is not None]
+            copies = sum(value.nbytes for value in views)
+            rows.append((f"{count:3} ranges of {label}", (size - base) / count,
+                         copies / count))
+    for label, view, copy in rows:
+        print(f"{label:25} {view:10.0f} bytes per range, {copy:12.0f} as copies")
+
+# Storage: the memory of a sheet of a million cells and the time of the
+# built-in functions of its ranges, with the default and typed storage
+
+def bench_storage(ns):
+    import numpy
+    import runtime
+    rnd = random.Random(1)
+    side = 1000
+    tenths = [[rnd.randrange(-99999, 100000) for col in range(side)] for row in range(side)]
+    storages = [("default", None), ("float", "float"), ("fixed", "fixed")]
+
+    def make(storage):
+        # Decimals with one decimal, as the arithmetic of the program makes them
+        rows = [[runtime.decimal_tenths(count) for count in row] for row in tenths]
+        return runtime.new_sheet(rows, storage)
+
+    print(f"a sheet of {side} * {side} cells")
+    sheets = {}
+    for label, storage in storages:
+        size, sheets[label] = traced_bytes(lambda: make(storage))
+        print(f"  {label:<10} {sheets[label].dtype.name:>8} {size / (side * side / 1e6) / 1e6:8.1f} MB per million cells")
+
+    # each built-in function once over every column and every row
+    sums = {}
+    for name, aggregate in runtime.AGGREGATES.items():
+        rows = []
+        for label, storage in storages:
+            sheet = sheets[label]
+            ranges = [sheet[:, col:col + 1] for col in range(side)] + [sheet[row:row + 1, :] for row in range(side)]
+            if name == "Sum":
+                sums[label] = [str(round(aggregate(values), 1)) for values in ranges]
+            # the products of float cells overflow to inf
+            with numpy.errstate(over='ignore', invalid='ignore'):
+                rows.append((f"{name}, {label}", best_time(lambda: [aggregate(values) for values in ranges],
+                                                           ns.repeat)))
+        print(f"{name} of {2 * side} ranges of {side} cells")
+        report(rows)
+    if len(set(map(tuple, sums.values()))) != 1:
+        raise SystemExit("the sums differ")
+
+# Sparse: a sheet of 10000 * 10000 cells of which a program writes a few
+# thousand, as a dense array and as a sparse sheet
+
+SPARSE_PROGRAM = """sheet BIG = 10000 * 10000
+range _col = range BIG'A1..BIG'A999
+range _far = range BIG'A1..BIG'A999[9000, 9000]
+{writes}for _far do
+  $ := 2.5
+done
+print_scalar !sum! Sum[ _col ] + Sum[ _far ] + Sum[ range BIG'A1..BIG'ZZ1 ]
+"""
+
+def bench_sparse(ns):
+    import runtime
+    main = load_main()
+    rnd = random.Random(1)
+    count = min(ns.statements, 5000)
+    writes = "".join(f"BIG'{ident(rnd.randrange(702), '').upper()}{rnd.randrange(1, 1000)} := {rnd.randrange(100)}.5\n"
+                     for i in range(count))
+    source = SPARSE_PROGRAM.format(writes=writes)
+    main.lexer.lineno = 1
+    tree = main.parser.parse(source, lexer=main.lexer)
+    semdata = main.new_semdata()
+    main.semantic_checks(tree, semdata)
+
+    def run():
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main.run_program(tree, semdata)
+        return output.getvalue(), semdata.frames[0]
+
+    print(f"a sheet of 10000 * 10000 cells, {count} cell writes and 999 through a range")
+    outputs = set()
+    rows = []
+    default = runtime.SPARSE_CELLS
+    try:
+        for label, cells in (("dense", float("inf")), ("sparse", default)):
+            runtime.SPARSE_CELLS = cells
+            size, (output, frame) = traced_bytes(run)
+            outputs.add(output)
+            rows.append((f"{label}, {size / 1e6:.1f} MB", best_time(run, ns.repeat)))
+    finally:
+        runtime.SPARSE_CELLS = default
+    report(rows)
+    if len(outputs) != 1:
+        raise SystemExit("the dense and sparse sheets give different output")
+
+# Mmap: the sparse program with its sheet in memory, in a new file (as
+# --dump makes it) and in the file of the previous run (--mmap)
+
+def bench_mmap(ns):
+    import shutil
+    import tempfile
+    from runtime import SheetFiles, parse_storage
+    main = load_main()
+    rnd = random.Random(1)
+    count = min(ns.statements, 5000)
+    writes = "".join(f"BIG'{ident(rnd.randrange(702), '').upper()}{rnd.randrange(1, 1000)} := {rnd.randrange(100)}.5\n"
+                     for i in range(count))
+    source = SPARSE_PROGRAM.format(writes=writes)
+    main.lexer.lineno = 1
+    tree = main.parser.parse(source, lexer=main.lexer)
+    directory = tempfile.mkdtemp()
+    file = os.path.join(directory, "big.npy")
+
+    def run(sheet_files):
+        semdata = main.new_semdata()
+        semdata.storage = parse_storage(['float'])
+        semdata.sheet_files = sheet_files
+        main.semantic_checks(tree, semdata)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main.run_program(tree, semdata)
+        return output.getvalue(), semdata.frames[0]
+
+    print(f"a sheet of 10000 * 10000 float cells, {count} cell writes and 999 through a range")
+    outputs = set()
+    rows = []
+    try:
+        for label, sheet_files in (("in memory", {}), ("new file", {"BIG": SheetFiles(dump=file)}),
+                                   ("reopened file", {"BIG": SheetFiles(mmap=file)})):
+            size, (output, frame) = traced_bytes(lambda: run(sheet_files))
+            outputs.add(output)
+            rows.append((f"{label}, {size / 1e6:.1f} MB", best_time(lambda: run(sheet_files), ns.repeat)))
+            del frame
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    report(rows)
+    if len(outputs) != 1:
+        raise SystemExit("the sheets in memory and in files give different output")
+
+# Load: filling a sheet of a million cells from a .csv and a .npy file,
+# against parsing and running a sheet_init_list
+
+def bench_load(ns):
+    import shutil
+    import tempfile
+    import numpy
+    import runtime
+    main = load_main()
+    rnd = random.Random(1)
+    side = 1000
+    tenths = numpy.array([[rnd.randrange(-99999, 100000) for col in range(side)] for row in range(side)])
+    directory = tempfile.mkdtemp()
+    csv = os.path.join(directory, "cells.csv")
+    npy = os.path.join(directory, "cells.npy")
+    numpy.savetxt(csv, tenths / 10, fmt="%.1f", delimiter=",")
+    numpy.save(npy, tenths / 10)
+
+    # an init list of 10000 cells, parsed, checked and run
+    rows, columns = 100, 100
+    source = "sheet S = {" + "\n".join(", ".join(f"{value / 10:.1f}" for value in row[:columns])
+                                        for row in tenths[:rows].tolist()) + "}\nprint_scalar !a! S'A1\n"
+    def init_list():
+        main.lexer.lineno = 1
+        tree = main.parser.parse(source, lexer=main.lexer)
+        semdata = main.new_semdata()
+        main.semantic_checks(tree, semdata)
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.run_program(tree, semdata)
+
+    print(f"filling a sheet of {side} * {side} cells")
+    sums = set()
+    results = []
+    try:
+        seconds = best_time(init_list, ns.repeat) * (side * side) / (rows * columns)
+        results.append((f"init list, per {side * side} cells", seconds))
+        for storage in (None, 'float', 'fixed', 'decimal'):
+            for file in (csv, npy):
+                def load():
+                    sheet = runtime.zero_sheet(side, side, storage, runtime.SheetFiles(load=file))
+                    return str(round(runtime.AGGREGATES['Sum'](sheet), 1))
+                sums.add(load())
+                results.append((f"{os.path.basename(file)}, {storage or 'default'} storage",
+                                best_time(load, ns.repeat)))
+        # integer tables (of other tools) are values, and the float64 dump
+        # of a fixed storage sheet has its values
+        ints = os.path.join(directory, "ints.npy")
+        numpy.save(ints, tenths // 10)
+        dump = os.path.join(directory, "dump.npy")
+        runtime.dump_tenths(runtime.zero_sheet(side, side, 'fixed', runtime.SheetFiles(load=npy)), dump)
+        for storage in (None, 'float', 'fixed', 'decimal'):
+            for file, expected in ((ints, float((tenths // 10).sum())), (dump, tenths.sum() / 10)):
+                sheet = runtime.zero_sheet(side, side, storage, runtime.SheetFiles(load=file))
+                if str(round(runtime.AGGREGATES['Sum'](sheet), 1)) != str(round(expected, 1)):
+                    raise SystemExit(f"{os.path.basename(file)} loads wrong values into "
+                                     f"{storage or 'default'} storage")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    report(results)
+    if len(sums) != 1:
+        raise SystemExit("the loaded sheets differ")
+
+# Numeric: arithmetic in while loops with floats, with Decimals, and with
+# Decimals and fixed storage
+
+NUMERIC_PROGRAM = """sheet S = 3 * 1
+scalar i = 0.0
+scalar x = 1.5
+scalar y = 0.0
+scalar z = 0.0
+while i < {iterations}.0 do
+  x := x * 0.5 + 1.5
+  y := y + x / 3.0 - 0.2
+  z := (y - x) * 2.0 / 3.0 + (x > y)
+  S'B1 := S'B1 + z / 10.0
+  i := i + 1.0
+done
+print_scalar !y! y
+print_scalar !z! z
+print_sheet !S! S
+"""
+
+def bench_numeric(ns):
+    import numeric
+    import optimizer
+    from runtime import parse_storage
+    main = load_main()
+    iterations = ns.statements // 5
+    source = NUMERIC_PROGRAM.format(iterations=iterations)
+
+    def run(engine, mode):
+        main.lexer.lineno = 1
+        tree = main.parser.parse(source, lexer=main.lexer)
+        semdata = main.new_semdata()
+        semdata.numeric = mode
+        semdata.storage = parse_storage(None, mode.storages[0])
+        main.semantic_checks(tree, semdata)
+        tree = optimizer.optimize(numeric.convert(tree, mode), mode)
+        mode.activate()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            engine(tree, semdata)
+        return output.getvalue()
+
+    accelerated = "C" if numeric.ACCELERATED else "Python"
+    print(f"{iterations} iterations of a loop, {accelerated} decimal module")
+    outputs = {label: set() for label in numeric.MODES}
+    for name, engine in engines(main).items():
+        rows = []
+        for label, mode in numeric.MODES.items():
+            outputs[label].add(run(engine, mode))
+            rows.append((f"{name}, {label}", best_time(lambda: run(engine, mode), ns.repeat)))
+        report(rows)
+    for label, output in outputs.items():
+        if len(output) != 1:
+            raise SystemExit(f"the engines give different output in {label} mode")
+
+BENCHMARKS = {
+    'aggregates': bench_aggregates,
+    'ranges': bench_ranges,
+    'storage': bench_storage,
+    'sparse': bench_sparse,
+    'mmap': bench_mmap,
+    'load': bench_load,
+    'numeric': bench_numeric,
+    'memo': bench_memo,
+    'calls': bench_calls,
+    'recursion': bench_recursion,
+    'flat': bench_flat,
+    'incremental': bench_incremental,
+    'lexer': bench_lexer,
+    'parse_cache': bench_parse_cache,
+    'startup': bench_startup,
+    'stream': bench_stream,
+    'tokens': bench_tokens,
+    'nodes': bench_nodes,
+    'optimize': bench_optimize,
+    'traversal': bench_traversal,
+}
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    arg_parser.add_argument('--statements', type=int, default=45000,
+                            help='number of statements in the generated program')
+    arg_parser.add_argument('--repeat', type=int, default=5,
+                            help='number of runs, the best time is reported')
+    arg_parser.add_argument('--lines', type=int, default=100000,
+                            help='approximate number of lines of the program (incremental)')
+    arg_parser.add_argument('--megabytes', type=float, default=4,
+                            help='size of the source to lex (lexer, stream)')
+    arg_parser.add_argument('--depth', type=int, default=20000,
+                            help='depth of recursion (recursion)')
+    arg_parser.add_argument('--parallel', type=int, default=20,
+                            help='number of processes started at once (startup)')
+    ns = arg_parser.parse_args()
+    BENCHMARKS[ns.benchmark](ns)
@@ -0,0 +1,749 @@
+#!/usr/bin/env python3
+#
+
+# Register based bytecode VM: an alternative to the tree walking interpreter
+# (eval_node/execute in main.py).
+#
+# The code generator turns the checked syntax tree into a flat array of
+# instructions. Every instruction has the same width: an opcode and three
+# integer operands. Operands refer to registers, constants, or jump targets.
+#
+# The registers are, in this order:
+#  - the global variables, at the slots the semantic checks gave them
+#  - the return value of the last function call
+#  - the temporaries of the main program (expression values)
+#  - a window for each called subroutine and function: its frame (the
+#    parameters and locals, at their slots) followed by its temporaries
+#  - one register per constant of the constant pool
+# Variables and constants are thus used directly by their register, without
+# a load.
+#
+# CALL saves the window of the callee on a stack and puts the arguments into
+# it, RET restores the window. A recursive call so keeps the registers of the
+# calls under it, and the VM needs no Python recursion for calls. A call of a
+# memoized function (see memo.py) that hits its cache skips all that and
+# just sets register ret.
+#
+# The VM gives the same results as the tree walker: both use the helpers in
+# runtime.py.
+
+from array import array
+
+import memo
+from runtime import AGGREGATES, range_slices, shift_range, start_for, new_sheet, zero_sheet, \
+    load_cell, store_cell, print_scalar, print_sheet, print_range
+
+# Opcodes. The operand columns are a, b, c; r[x] is register x and k[x] is
+# constant x
+
+HALT      = 0   #                      stop
+LOADK     = 1   # a, b                 r[a] = k[b]
+MOVE      = 2   # a, b                 r[a] = r[b]
+ROUND     = 3   # a, b                 r[a] = round(r[b], 1)
+NEG       = 4   # a, b                 r[a] = -r[b]
+ADD       = 5   # a, b, c              r[a] = r[b] + r[c]
+SUB       = 6   # a, b, c              r[a] = r[b] - r[c]
+MUL       = 7   # a, b, c              r[a] = r[b] * r[c]
+DIV       = 8   # a, b, c              r[a] = r[b] / r[c]
+EQ        = 9   # a, b, c              r[a] = 1.0 if r[b] = r[c] else 0.0
+                #                      (of the numeric mode)
+NE        = 10  # a, b, c              ... !=
+LT        = 11  # a, b, c              ... <
+GT        = 12  # a, b, c              ... >
+LE        = 13  # a, b, c              ... <=
+GE        = 14  # a, b, c              ... >=
+JMP       = 15  # a                    jump to a
+JMPZ      = 16  # a, b                 if r[a] == 0.0 jump to b
+GETCELL   = 17  # a, b, c              r[a] = r[b][k[c]] (k[c] is (row, col),
+                #                      or slices for a range)
+SETCELL   = 18  # a, b, c              r[a][k[b]] = r[c]
+NEWSHEET  = 19  # a, b, c              r[a] = sheet of k[c] = (rows, cols,
+                #                      storage, files), cell values from
+                #                      r[b], r[b+1], ...
+ZEROSHEET = 20  # a, b                 r[a] = zero sheet, k[b] = (cols, rows,
+                #                      storage, files)
+PRINTS    = 21  # a, b                 print_scalar(k[a], r[b])
+PRINTSH   = 22  # a, b                 print_sheet(k[a], r[b])
+CALL      = 23  # a, b, c              call the code at a, k[c] = (base, size,
+                #                      nargs, cache) is its window and its
+                #                      FunctionCache (or None), the arguments
+                #                      are r[b], r[b+1], ...
+RET       = 24  #                      return from a call
+RETV      = 25  # a, b                 r[b] = r[a], return from a call
+AGGREGATE = 26  # a, b, c              r[a] = built-in function k[c] of the
+                #                      range r[b]
+SHIFT     = 27  # a, b, c              r[a] = range r[b] shifted by k[c] =
+                #                      (columns, rows)
+PRINTR    = 28  # a, b                 print_range(k[a], r[b])
+FORPREP   = 29  # a, b, c              start a for loop over the ranges r[b],
+                #                      r[b+1], ..., their cells go to the
+                #                      registers k[c], r[a] = round iterator
+FORNEXT   = 30  # a, b, c              r[c] = next round of r[a], or jump to
+                #                      b after the last one
+GETITEM   = 31  # a, b, c              r[a] = r[b][r[c]]
+SETITEM   = 32  # a, b, c              r[a][r[b]] = r[c]
+LOADCELL  = 33  # a, b, c              r[a] = load_cell(r[b], r[c])
+STORECELL = 34  # a, b, c              store_cell(r[a], r[b], r[c])
+
+# Programs with typed storage of sheets (see runtime.py) read and write
+# cells with LOADCELL and STORECELL instead of GETCELL, SETCELL, GETITEM and
+# SETITEM
+
+OPNAMES = ['HALT', 'LOADK', 'MOVE', 'ROUND', 'NEG', 'ADD', 'SUB', 'MUL',
+           'DIV', 'EQ', 'NE', 'LT', 'GT', 'LE', 'GE', 'JMP', 'JMPZ',
+           'GETCELL', 'SETCELL', 'NEWSHEET', 'ZEROSHEET', 'PRINTS', 'PRINTSH',
+           'CALL', 'RET', 'RETV', 'AGGREGATE', 'SHIFT', 'PRINTR', 'FORPREP',
+           'FORNEXT', 'GETITEM', 'SETITEM', 'LOADCELL', 'STORECELL']
+
+ARITHMETIC_OPS = {'+': ADD, '-': SUB, '*': MUL, '/': DIV}
+COMPARE_OPS = {'=': EQ, '!=': NE, '<': LT, '>': GT, '<=': LE, '>=': GE}
+
+VARIABLE_TYPES = ("scalar", "sheet", "range")
+
+def calls_routine(node):
+    '''Whether the expression node calls a subroutine or function (not a
+       built-in one)'''
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.nodetype == "function_call" and node.children_[0].symdata.symtype != "builtin":
+            return True
+        stack.extend(child for child in node.children_ if hasattr(child, "nodetype"))
+    return False
+
+# Width of an instruction in the code array: opcode, a, b, c
+WIDTH = 4
+
+class Program:
+    '''A compiled program
+
+       code: array of instructions, WIDTH integers each
+       consts: constant pool
+       names: name of each register before the constants
+       ret: the register of return values
+       labels: subroutine or function name of each entry address
+       one, zero: the values of comparisons'''
+
+    def __init__(self, code, consts, names, ret, labels, one=1.0, zero=0.0):
+        self.code = code
+        self.consts = consts
+        self.names = names
+        self.ret = ret
+        self.labels = labels
+        self.one = one
+        self.zero = zero
+
+    def registers(self):
+        '''Initial register file: variables and temporaries, constants'''
+        return [None] * len(self.names) + list(self.consts)
+
+    def register_name(self, x):
+        nvars = len(self.names)
+        if x < nvars:
+            return self.names[x]
+        return "k" + str(x - nvars)
+
+# Register numbers during code generation: variables are numbered from 0
+# upwards, temporaries from -1 downwards (remapped by
+# CodeGenerator.place_temps) and constants from CONST_BASE upwards (remapped
+# by CodeGenerator.finish)
+
+CONST_BASE = 1 << 30
+
+class CodeGenerator:
+    '''Generate a Program from a checked syntax tree
+
+       semdata: the SemData filled by the semantic checks, whose addresses
+       give the registers of the variables'''
+
+    def __init__(self, semdata):
+        self.caches = semdata.caches
+        self.typed = semdata.storage is not None
+        self.one, self.zero = semdata.numeric.one, semdata.numeric.zero
+        self.code = array('l')
+        self.consts = []
+        self.const_index = {}
+        self.names = [None] * semdata.global_size
+        self.ret = len(self.names)
+        self.names.append("ret")
+        # the subroutine or function generated (None for the main program)
+        # and the first register of its window
+        self.routine = None
+        self.base = 0
+        # temporaries are allocated from a stack, the top is reset to the
+        # floor after each statement (the temporaries of the for loops
+        # around the statement are under the floor)
+        self.temp_top = 0
+        self.temp_floor = 0
+        self.max_temps = 0
+        # subroutines and functions to generate: (definition node, list of
+        # CALL instructions to patch with its address and window)
+        self.pending = {}
+        self.labels = {}
+
+    # Helpers
+
+    def emit(self, op, a=0, b=0, c=0):
+        '''Append an instruction, returns its address'''
+        address = len(self.code)
+        self.code.extend((op, a, b, c))
+        return address
+
+    def patch(self, address, operand, value):
+        self.code[address + operand] = value
+
+    def here(self):
+        return len(self.code)
+
+    def const(self, value):
+        # Decimal('1.0') == 1.0 == Decimal('1.00') and -0.0 == 0.0, so the
+        # key is the type and the repr
+        key = (type(value), repr(value))
+        index = self.const_index.get(key)
+        if index is None:
+            index = len(self.consts)
+            self.consts.append(value)
+            self.const_index[key] = index
+        return index
+
+    def register(self, symdata):
+        '''Register of a variable'''
+        return self.base_register(symdata.depth, symdata.slot)
+
+    def base_register(self, depth, slot):
+        if depth == 0:
+            return slot
+        return self.base + slot
+
+    def temp(self):
+        '''Allocate a temporary register'''
+        index = self.temp_top
+        self.temp_top += 1
+        self.max_temps = max(self.max_temps, self.temp_top)
+        return -1 - index
+
+    def const_register(self, value):
+        return CONST_BASE + self.const(value)
+
+    # Expressions
+
+    def expr(self, node, target=None):
+        '''Generate code evaluating node, returns the register holding the
+           value. Variables and literals are used from their own register
+           unless a target register is given.'''
+        negative, value = node.negative, node.value
+        nodetype = node.nodetype
+
+        if nodetype == "range_expr":
+            return self.range(node, target)
+        if nodetype in VARIABLE_TYPES and not negative and target is None:
+            return self.register(node.symdata)
+        if nodetype == "decimal" and target is None:
+            return self.const_register(-value if negative else value)
+
+        if target is None:
+            target = self.temp()
+
+        if nodetype == "decimal":
+            self.emit(LOADK, target, self.const(-value if negative else value))
+            return target
+
+        if nodetype in VARIABLE_TYPES:
+            source = self.register(node.symdata)
+        elif nodetype == "term" or nodetype == "simple_expr":
+            source = self.arithmetic(node, target)
+        elif nodetype == "scalar_expr":
+            source = self.comparison(node, target)
+        elif nodetype == "cell_ref" and node.children_[0].nodetype == "dollar":
+            cells = node.children_[0].symdata
+            self.emit(LOADCELL if self.typed else GETITEM, target, self.register(cells),
+                      self.base_register(cells.depth, cells.index))
+            source = target
+        elif nodetype == "cell_ref":
+            sheet = self.register(node.children_[0].symdata)
+            col, row = node.children_[1].value[:2]
+            if self.typed:
+                self.emit(LOADCELL, target, sheet, self.const_register((row, col)))
+            else:
+                self.emit(GETCELL, target, sheet, self.const((row, col)))
+            source = target
+        elif nodetype == "function_call" and node.children_[0].symdata.symtype == "builtin":
+            values = self.expr(node.children_[1].children_[0])
+            self.emit(AGGREGATE, target, values, self.const(node.value))
+            source = target
+        elif nodetype == "function_call":
+            self.call(node)
+            source = self.ret
+        else:
+            # not (yet) evaluated by the interpreter, see eval_node
+            self.emit(LOADK, target, self.const(0.0))
+            source = target
+
+        if negative:
+            self.emit(NEG, target, source)
+        elif source != target:
+            self.emit(MOVE, target, source)
+        return target
+
+    def range(self, node, target):
+        '''Generate code evaluating a range_expr, like expr'''
+        children = node.children_
+        if children[0].nodetype == "cell_ref":
+            start, end = children[:2]
+            shifts = children[2:]
+        else:
+            # a range variable or [ Function[...] ]
+            shifts = children[1:]
+            if not shifts:
+                return self.expr(children[0], target)
+        if target is None:
+            target = self.temp()
+        if children[0].nodetype != "cell_ref":
+            source = self.expr(children[0])
+        elif start.children_[0].nodetype == "sheet":
+            sheet = self.register(start.children_[0].symdata)
+            index = range_slices(start.children_[1].value[:2], end.children_[1].value[:2])
+            self.emit(GETCELL, target, sheet, self.const(index))
+            source = target
+        else:
+            # range $..$, not evaluated by the interpreter
+            self.emit(LOADK, target, self.const(0.0))
+            return target
+        # range_expr[columns, rows]
+        for i in range(0, len(shifts), 2):
+            self.emit(SHIFT, target, source, self.const((shifts[i].value, shifts[i+1].value)))
+            source = target
+        return target
+
+    def operand(self, node, later):
+        '''Generate operand node, like expr. A variable is copied if one of
+           the later operands calls a subroutine or function, which may
+           assign it, so that it keeps the value it had when evaluated.'''
+        if node.nodetype in VARIABLE_TYPES and any(map(calls_routine, later)):
+            return self.expr(node, self.temp())
+        return self.expr(node)
+
+    def arithmetic(self, node, target):
+        nodes = node.children_
+        left = self.operand(nodes[0], nodes[2::2])
+        for i in range(1, len(nodes), 2):
+            right = self.expr(nodes[i+1])
+            self.emit(ARITHMETIC_OPS[nodes[i].value], target, left, right)
+            left = target
+        return target
+
+    def comparison(self, node, target):
+        nodes = node.children_
+        # like the tree walker, all operands are evaluated before comparing
+        children = nodes[0::2]
+        operands = [self.operand(child, children[i+1:]) for i, child in enumerate(children)]
+        operators = [op.value for op in nodes[1::2]]
+        if len(operators) == 1:
+            self.emit(COMPARE_OPS[operators[0]], target, operands[0], operands[1])
+            return target
+        false_jumps = []
+        for i, op in enumerate(operators):
+            self.emit(COMPARE_OPS[op], target, operands[i], operands[i+1])
+            false_jumps.append(self.emit(JMPZ, target))
+        self.emit(LOADK, target, self.const(self.one))
+        end_jump = self.emit(JMP)
+        for jump in false_jumps:
+            self.patch(jump, 2, self.here())
+        self.emit(LOADK, target, self.const(self.zero))
+        self.patch(end_jump, 1, self.here())
+        return target
+
+    def sheet_init(self, node, target):
+        if node.nodetype == "sheet_init_size":
+            self.emit(ZEROSHEET, target, self.const(tuple(node.value) + (node.symdata.storage,
+                                                                          node.symdata.files)))
+            return
+        rows = node.children_
+        cells = [cell for row in rows for cell in row.children_]
+        first = self.temp_top
+        registers = [self.temp() for cell in cells]
+        for register, cell in zip(registers, cells):
+            self.expr(cell, register)
+        shape = (len(rows), len(rows[0].children_) if rows else 0, node.symdata.storage, node.symdata.files)
+        self.emit(NEWSHEET, target, -1 - first, self.const(shape))
+
+    # Statements
+
+    def block(self, statement_list):
+        for statement in statement_list:
+            self.temp_top = self.temp_floor
+            self.statement(statement)
+
+    def statement(self, node):
+        nodetype = node.nodetype
+
+        if nodetype == "print_scalar":
+            value = self.expr(node.children_[1])
+            self.emit(PRINTS, self.const(node.children_[0].value), value)
+
+        elif nodetype == "scalar_assignment":
+            variable = self.register(node.children_[0].symdata)
+            value = self.expr(node.children_[1])
+            self.emit(ROUND, variable, value)
+
+        elif nodetype == "if":
+            condition = self.expr(node.children_[0])
+            jump = self.emit(JMPZ, condition)
+            self.block(node.children_[1].children_)
+            self.patch(jump, 2, self.here())
+
+        elif nodetype == "if_else":
+            condition = self.expr(node.children_[0])
+            else_jump = self.emit(JMPZ, condition)
+            self.block(node.children_[1].children_)
+            end_jump = self.emit(JMP)
+            self.patch(else_jump, 2, self.here())
+            self.block(node.children_[2].children_)
+            self.patch(end_jump, 1, self.here())
+
+        elif nodetype == "while":
+            start = self.here()
+            self.temp_top = self.temp_floor
+            condition = self.expr(node.children_[0])
+            exit_jump = self.emit(JMPZ, condition)
+            self.block(node.children_[1].children_)
+            self.emit(JMP, start)
+            self.patch(exit_jump, 2, self.here())
+
+        elif nodetype == "print_sheet":
+            sheet = self.register(node.children_[1].symdata)
+            self.emit(PRINTSH, self.const(node.children_[0].value), sheet)
+
+        elif nodetype == "cell_ref_assignment":
+            value = self.expr(node.children_[1])
+            cell_ref = node.children_[0]
+            if cell_ref.children_[0].nodetype == "dollar":
+                cells = cell_ref.children_[0].symdata
+                self.emit(STORECELL if self.typed else SETITEM, self.register(cells),
+                          self.base_register(cells.depth, cells.index), value)
+            else:
+                sheet = self.register(cell_ref.children_[0].symdata)
+                col, row = cell_ref.children_[1].value[:2]
+                if self.typed:
+                    self.emit(STORECELL, sheet, self.const_register((row, col)), value)
+                else:
+                    self.emit(SETCELL, sheet, self.const((row, col)), value)
+
+        elif nodetype == "print_range":
+            value = self.expr(node.children_[1])
+            self.emit(PRINTR, self.const(node.children_[0].value), value)
+
+        elif nodetype == "range_assign":
+            self.expr(node.children_[1], self.register(node.children_[0].symdata))
+
+        elif nodetype == "for":
+            self.for_loop(node)
+
+        elif nodetype == "subroutine_call":
+            self.call(node)
+
+        elif nodetype == "return":
+            value = self.expr(node.children_[0])
+            if self.routine is None:
+                # return in the main program ends it
+                self.emit(HALT)
+            elif self.routine.nodetype == "definition_function":
+                self.emit(RETV, value, self.ret)
+            else:
+                self.emit(RET)
+
+        # other statements are not (yet) executed by the interpreter, see
+        # execute
+
+    def for_loop(self, node):
+        loop = node.symdata
+        ranges = node.children_[0].children_
+        first = self.temp_top
+        registers = [self.temp() for range_expr in ranges]
+        for register, range_expr in zip(registers, ranges):
+            self.expr(range_expr, register)
+        iterator = self.temp()
+        cells = tuple(self.register(symdata) for symdata in loop.ranges)
+        index = self.register(loop)
+        prefix = (self.routine.value + "." if self.routine is not None else "") + "for@" + str(node.lineno)
+        self.names[index] = prefix + ".i"
+        for i, register in enumerate(cells):
+            self.names[register] = prefix + "." + str(i)
+        self.emit(FORPREP, iterator, -1 - first, self.const(cells))
+        start = self.emit(FORNEXT, iterator, 0, index)
+        # the iterator lives until the end of the loop
+        floor, self.temp_floor = self.temp_floor, self.temp_top
+        self.block(node.children_[1].children_)
+        self.temp_floor = floor
+        self.emit(JMP, start)
+        self.patch(start, 2, self.here())
+
+    def call(self, node):
+        '''Generate a call, a function leaves its value in register ret'''
+        definition = node.children_[0].symdata.defnode
+        arguments = node.children_[1].children_ if len(node.children_) > 1 else []
+        # evaluate all arguments (into consecutive registers) before binding
+        # any of them
+        first = self.temp_top
+        registers = [self.temp() for arg in arguments]
+        for register, arg in zip(registers, arguments):
+            self.expr(arg, register)
+        call = self.emit(CALL, 0, -1 - first if arguments else 0)
+        self.pending.setdefault(id(definition), (definition, []))[1].append(call)
+
+    def definitions(self, definition_list):
+        for definition in definition_list:
+            self.temp_top = self.temp_floor
+            if definition.nodetype == "definition_scalar":
+                variable = self.register(definition.symdata)
+                value = self.expr(definition.children_[0])
+                self.emit(ROUND, variable, value)
+            elif definition.nodetype == "definition_sheet":
+                variable = self.register(definition.symdata)
+                if len(definition.children_) > 1:
+                    self.sheet_init(definition.children_[1], variable)
+            elif definition.nodetype == "definition_range":
+                if definition.children_[0] is not None:
+                    self.expr(definition.children_[0], self.register(definition.symdata))
+
+    def place_temps(self, start, prefix):
+        '''Give the temporaries of the code from address start registers
+           after all registers so far'''
+        first = len(self.names)
+        self.names += [prefix + "t" + str(i) for i in range(self.max_temps)]
+        code = self.code
+        for pc in range(start, len(code), WIDTH):
+            for operand in REGISTER_OPERANDS.get(code[pc], ()):
+                x = code[pc + operand]
+                if x < 0:
+                    code[pc + operand] = first - 1 - x
+        self.temp_top = self.max_temps = 0
+
+    def routine_body(self, definition):
+        '''Generate a subroutine or function with its window, returns the
+           window as (base, size, number of parameters, cache)'''
+        self.routine = definition
+        self.base = len(self.names)
+        start = self.here()
+        self.labels[start] = definition.value
+        frame = [None] * definition.symdata.frame_size
+        formals = definition.children_[1]
+        nargs = len(formals.children_) if formals is not None else 0
+        for variable in (formals.children_ if formals is not None else []) + definition.children_[-2].children_:
+            frame[variable.symdata.slot] = definition.value + "." + variable.value
+        self.names += frame
+        self.definitions(definition.children_[-2].children_)
+        self.block(definition.children_[-1].children_)
+        if definition.nodetype == "definition_function":
+            # a function that ends without return gives 0.0
+            self.emit(RETV, self.const_register(self.zero), self.ret)
+        else:
+            self.emit(RET)
+        self.place_temps(start, definition.value + ".")
+        return start, (self.base, len(self.names) - self.base, nargs, definition.symdata.cache)
+
+    def subroutines(self):
+        '''Generate the bodies of all called subroutines and functions after
+           the main program, and patch the calls to them'''
+        done = {}
+        while self.pending:
+            key, (definition, calls) = self.pending.popitem()
+            if key not in done:
+                address, window = self.routine_body(definition)
+                done[key] = address, self.const(window)
+            for call in calls:
+                self.patch(call, 1, done[key][0])
+                self.patch(call, 3, done[key][1])
+
+    def program(self, tree):
+        memo.attach(tree, self.caches)
+        for definition in tree.children_[0].children_:
+            if definition.nodetype in ("definition_scalar", "definition_sheet", "definition_range"):
+                self.names[definition.symdata.slot] = definition.value
+        self.definitions(tree.children_[0].children_)
+        self.block(tree.children_[1].children_)
+        self.emit(HALT)
+        self.place_temps(0, "")
+        self.subroutines()
+        return self.finish()
+
+    def finish(self):
+        '''Renumber the constant registers to follow the others'''
+        nvars = len(self.names)
+        code = self.code
+        for pc in range(0, len(code), WIDTH):
+            for operand in REGISTER_OPERANDS.get(code[pc], ()):
+                x = code[pc + operand]
+                if x >= CONST_BASE:
+                    code[pc + operand] = nvars + x - CONST_BASE
+        return Program(code, self.consts, self.names, self.ret, self.labels, self.one, self.zero)
+
+# Operands (1 = a, 2 = b, 3 = c) of each opcode referring to registers
+
+REGISTER_OPERANDS = {
+    LOADK: (1,), MOVE: (1, 2), ROUND: (1, 2), NEG: (1, 2),
+    ADD: (1, 2, 3), SUB: (1, 2, 3), MUL: (1, 2, 3), DIV: (1, 2, 3),
+    EQ: (1, 2, 3), NE: (1, 2, 3), LT: (1, 2, 3), GT: (1, 2, 3),
+    LE: (1, 2, 3), GE: (1, 2, 3), JMPZ: (1,),
+    GETCELL: (1, 2), SETCELL: (1, 3), NEWSHEET: (1, 2), ZEROSHEET: (1,),
+    PRINTS: (2,), PRINTSH: (2,), CALL: (2,), RETV: (1, 2), AGGREGATE: (1, 2),
+    SHIFT: (1, 2), PRINTR: (2,), FORPREP: (1, 2), FORNEXT: (1, 3),
+    GETITEM: (1, 2, 3), SETITEM: (1, 2, 3), LOADCELL: (1, 2, 3), STORECELL: (1, 2, 3),
+}
+
+def compile_program(tree, semdata):
+    '''Generate a Program from a checked syntax tree'''
+    return CodeGenerator(semdata).program(tree)
+
+def run(program):
+    '''The dispatch loop'''
+    code = program.code
+    k = program.consts
+    r = program.registers()
+    ret = program.ret
+    one, zero = program.one, program.zero
+    missing = memo.MISSING
+    # (return address, window base, saved window, cache, key) of each
+    # running call
+    calls = []
+    pc = 0
+    while True:
+        op = code[pc]
+        a = code[pc+1]
+        b = code[pc+2]
+        c = code[pc+3]
+        pc += WIDTH
+        if op == LOADK:
+            r[a] = k[b]
+        elif op == MOVE:
+            r[a] = r[b]
+        elif op == ADD:
+            r[a] = r[b] + r[c]
+        elif op == SUB:
+            r[a] = r[b] - r[c]
+        elif op == MUL:
+            r[a] = r[b] * r[c]
+        elif op == DIV:
+            r[a] = r[b] / r[c]
+        elif op == ROUND:
+            r[a] = round(r[b], 1)
+        elif op == GETCELL:
+            r[a] = r[b][k[c]]
+        elif op == JMPZ:
+            if r[a] == 0.0:
+                pc = b
+        elif op == JMP:
+            pc = a
+        elif op == LT:
+            r[a] = one if r[b] < r[c] else zero
+        elif op == GT:
+            r[a] = one if r[b] > r[c] else zero
+        elif op == EQ:
+            r[a] = one if r[b] == r[c] else zero
+        elif op == NE:
+            r[a] = one if r[b] != r[c] else zero
+        elif op == LE:
+            r[a] = one if r[b] <= r[c] else zero
+        elif op == GE:
+            r[a] = one if r[b] >= r[c] else zero
+        elif op == SETCELL:
+            r[a][k[b]] = r[c]
+        elif op == NEG:
+            r[a] = -r[b]
+        elif op == CALL:
+            base, size, nargs, cache = k[c]
+            key = None
+            if cache is not None:
+                key = cache.key(r[b:b + nargs])
+                value = cache.lookup(key)
+                if value is not missing:
+                    r[ret] = value
+                    continue
+            calls.append((pc, base, r[base:base + size], cache, key))
+            r[base:base + nargs] = r[b:b + nargs]
+            pc = a
+        elif op == RET:
+            pc, base, window, cache, key = calls.pop()
+            r[base:base + len(window)] = window
+        elif op == RETV:
+            r[b] = r[a]
+            pc, base, window, cache, key = calls.pop()
+            r[base:base + len(window)] = window
+            if cache is not None:
+                cache.store(key, r[b])
+        elif op == GETITEM:
+            r[a] = r[b][r[c]]
+        elif op == SETITEM:
+            r[a][r[b]] = r[c]
+        elif op == LOADCELL:
+            r[a] = load_cell(r[b], r[c])
+        elif op == STORECELL:
+            store_cell(r[a], r[b], r[c])
+        elif op == FORNEXT:
+            i = next(r[a], None)
+            if i is None:
+                pc = b
+            else:
+                r[c] = i
+        elif op == FORPREP:
+            cells = k[c]
+            r[a] = iter(range(start_for(r, cells, r[b:b + len(cells)])))
+        elif op == SHIFT:
+            r[a] = shift_range(r[b], *k[c])
+        elif op == AGGREGATE:
+            r[a] = AGGREGATES[k[c]](r[b])
+        elif op == PRINTR:
+            print_range(k[a], r[b])
+        elif op == PRINTS:
+            print_scalar(k[a], r[b])
+        elif op == PRINTSH:
+            print_sheet(k[a], r[b])
+        elif op == NEWSHEET:
+            rows, cols, storage, files = k[c]
+            cells = r[b:b + rows*cols]
+            r[a] = new_sheet([cells[i*cols:(i+1)*cols] for i in range(rows)], storage, files)
+        elif op == ZEROSHEET:
+            r[a] = zero_sheet(*k[b])
+        elif op == HALT:
+            return
+
+def run_program(tree, semdata):
+    run(compile_program(tree, semdata))
+
+def disassemble(program, out=None):
+    '''Print a listing of the program: address, instruction, operands, and
+       the names of the variables/constants they refer to'''
+    code = program.code
+    nvars = len(program.names)
+    for pc in range(0, len(code), WIDTH):
+        if pc in program.labels:
+            print(program.labels[pc] + ":", file=out)
+        op, a, b, c = code[pc:pc + WIDTH]
+        regs = REGISTER_OPERANDS.get(op, ())
+        operands = []
+        comments = []
+        for i, x in ((1, a), (2, b), (3, c)):
+            if op == CALL and i == 2 and program.consts[c][2] == 0:
+                # no arguments
+                continue
+            if i in regs:
+                operands.append(program.register_name(x))
+                if nvars <= x < nvars + len(program.consts):
+                    comments.append(repr(program.consts[x - nvars]))
+            elif i == 1 and op in (JMP, CALL) or i == 2 and op in (JMPZ, FORNEXT):
+                operands.append("@" + str(x))
+                if op == CALL:
+                    comments.append(program.labels.get(x, "?"))
+            elif (op, i) in CONST_OPERANDS:
+                operands.append("k" + str(x))
+                comments.append(repr(program.consts[x]))
+        line = "{:6d}  {:<10}{}".format(pc, OPNAMES[op], ", ".join(operands))
+        if comments:
+            line = "{:<40}; {}".format(line, ", ".join(comments))
+        print(line, file=out)
+
+# Operands of each opcode referring to the constant pool
+
+CONST_OPERANDS = {(LOADK, 2), (GETCELL, 3), (SETCELL, 2), (NEWSHEET, 3),
+                  (ZEROSHEET, 2), (PRINTS, 1), (PRINTSH, 1), (CALL, 3),
+                  (AGGREGATE, 3), (SHIFT, 3), (PRINTR, 1), (FORPREP, 3)}
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+#
+
+# Closure compiler: an alternative to the tree walking interpreter
+# (eval_node/execute in main.py).
+#
+# Every node of the checked syntax tree is turned ONCE into a specialized
+# Python closure. Running the program then only calls these closures, so the
+# chain of nodetype string comparisons is paid at compile time instead of on
+# every visit of a node (e.g. on every round of a while loop).
+#
+# The closures give the same results as the tree walker: both use the helpers
+# in runtime.py.
+
+import memo
+from runtime import ReturnValue, compare_chain, range_slices, shift_range, start_for, new_sheet, \
+    zero_sheet, load_cell, store_cell, print_scalar, print_sheet, print_range, AGGREGATES, COMPARE, \
+    ARITHMETIC
+
+def _nothing():
+    return None
+
+def _zero():
+    return 0.0
+
+def _negate(func):
+    return lambda: -func()
+
+def _fold(first, rest):
+    '''Closure for a left associative chain: first (op value)*'''
+    if len(rest) == 1:
+        op, right = rest[0]
+        return lambda: op(first(), right())
+    def fold():
+        result = first()
+        for op, func in rest:
+            result = op(result, func())
+        return result
+    return fold
+
+class ClosureCompiler:
+    '''Compile a checked syntax tree into closures
+
+       semdata: the SemData filled by the semantic checks. The closures read
+       and write variables in frames at the (depth, slot) addresses of the
+       checks, just like the tree walker.'''
+
+    def __init__(self, semdata):
+        self.semdata = semdata
+        # the globals and the frame of the running subroutine call
+        self.frames = [[None] * semdata.global_size, None]
+        # whether the sheets have typed storage (see runtime.py)
+        self.typed = semdata.storage is not None
+        # the 1.0 and 0.0 of the numeric mode
+        self.one, self.zero = semdata.numeric.one, semdata.numeric.zero
+        # compiled bodies of subroutines, by definition node
+        self.subroutines = {}
+
+    # Variables
+
+    def load(self, symdata):
+        '''Return a closure reading the variable of symdata'''
+        slot = symdata.slot
+        if symdata.depth == 0:
+            frame = self.frames[0]
+            return lambda: frame[slot]
+        frames = self.frames
+        return lambda: frames[1][slot]
+
+    def store(self, symdata):
+        '''Return a function (value) writing the variable of symdata'''
+        slot = symdata.slot
+        if symdata.depth == 0:
+            frame = self.frames[0]
+            def store_global(value):
+                frame[slot] = value
+            return store_global
+        frames = self.frames
+        def store_local(value):
+            frames[1][slot] = value
+        return store_local
+
+    # Expressions
+
+    def expr(self, node):
+        '''Return a closure evaluating the expression node'''
+        if node is None:
+            return _nothing
+        negative, value = node.negative, node.value
+        func = self.expr_unsigned(node, value)
+        if negative:
+            return _negate(func)
+        return func
+
+    def expr_unsigned(self, node, value):
+        nodetype = node.nodetype
+
+        if nodetype == "decimal":
+            return lambda: value
+
+        if nodetype == "scalar" or nodetype == "sheet" or nodetype == "range":
+            return self.load(node.symdata)
+
+        if nodetype == "range_expr":
+            return self.range(node)
+
+        if nodetype == "term" or nodetype == "simple_expr":
+            nodes = node.children_
+            operands = [self.expr(child) for child in nodes[0::2]]
+            operators = [ARITHMETIC[op.value] for op in nodes[1::2]]
+            return _fold(operands[0], list(zip(operators, operands[1:])))
+
+        if nodetype == "scalar_expr":
+            nodes = node.children_
+            operands = [self.expr(child) for child in nodes[0::2]]
+            operators = [op.value for op in nodes[1::2]]
+            one, zero = self.one, self.zero
+            if len(operators) == 1:
+                compare = COMPARE[operators[0]]
+                left, right = operands
+                return lambda: one if compare(left(), right()) else zero
+            return lambda: compare_chain([func() for func in operands], operators, one, zero)
+
+        if nodetype == "sheet_init_list":
+            rows = [[self.expr(child) for child in row.children_]
+                    for row in node.children_]
+            storage, files = node.symdata.storage, node.symdata.files
+            return lambda: new_sheet([[func() for func in row] for row in rows], storage, files)
+
+        if nodetype == "sheet_init_size":
+            columns, rows = value
+            storage, files = node.symdata.storage, node.symdata.files
+            return lambda: zero_sheet(columns, rows, storage, files)
+
+        if nodetype == "cell_ref":
+            if node.children_[0].nodetype == "dollar":
+                return self.current_cell(node.children_[0].symdata)[0]
+            sheet = self.load(node.children_[0].symdata)
+            col, row = node.children_[1].value[:2]
+            if self.typed:
+                return lambda: load_cell(sheet(), (row, col))
+            return lambda: sheet()[row, col]
+
+        if nodetype == "function_call":
+            return self.call(node)
+
+        # not (yet) evaluated by the interpreter, see eval_node
+        return _zero
+
+    def range(self, node):
+        '''Return a closure evaluating a range_expr to a view of the cells of
+           a sheet'''
+        children = node.children_
+        if children[0].nodetype != "cell_ref":
+            # a range variable or [ Function[...] ]
+            values, shifts = self.expr(children[0]), children[1:]
+        else:
+            start, end = children[:2]
+            if start.children_[0].nodetype != "sheet":
+                # range $..$, not evaluated by the interpreter
+                return _zero
+            sheet = self.load(start.children_[0].symdata)
+            index = range_slices(start.children_[1].value[:2], end.children_[1].value[:2])
+            values, shifts = (lambda: sheet()[index]), children[2:]
+        # range_expr[columns, rows]
+        for i in range(0, len(shifts), 2):
+            values = self.shift(values, shifts[i].value, shifts[i+1].value)
+        return values
+
+    @staticmethod
+    def shift(values, columns, rows):
+        return lambda: shift_range(values(), columns, rows)
+
+    def current_cell(self, cells):
+        '''Return a closure reading and a function (value) writing the
+           current cell of a for loop range'''
+        frames, depth = self.frames, cells.depth
+        slot, index = cells.slot, cells.index
+        if self.typed:
+            def read():
+                frame = frames[depth]
+                return load_cell(frame[slot], frame[index])
+            def write(value):
+                frame = frames[depth]
+                store_cell(frame[slot], frame[index], value)
+            return read, write
+        def read():
+            frame = frames[depth]
+            return frame[slot][frame[index]]
+        def write(value):
+            frame = frames[depth]
+            frame[slot][frame[index]] = value
+        return read, write
+
+    # Statements
+
+    def block(self, statement_list):
+        '''Return a closure executing a list of statement nodes'''
+        funcs = [self.statement(stm) for stm in statement_list]
+        funcs = [func for func in funcs if func is not _nothing]
+        if not funcs:
+            return _nothing
+        if len(funcs) == 1:
+            return funcs[0]
+        def run_block():
+            for func in funcs:
+                func()
+        return run_block
+
+    def statement(self, node):
+        '''Return a closure executing the statement node'''
+        if node is None:
+            return _nothing
+        nodetype = node.nodetype
+
+        if nodetype == "print_scalar":
+            info = node.children_[0].value
+            value = self.expr(node.children_[1])
+            return lambda: print_scalar(info, value())
+
+        if nodetype == "scalar_assignment":
+            symdata = node.children_[0].symdata
+            slot = symdata.slot
+            value = self.expr(node.children_[1])
+            if symdata.depth == 0:
+                frame = self.frames[0]
+                def assign_global():
+                    frame[slot] = round(value(), 1)
+                return assign_global
+            frames = self.frames
+            def assign_local():
+                frames[1][slot] = round(value(), 1)
+            return assign_local
+
+        if nodetype == "if":
+            condition = self.expr(node.children_[0])
+            then_block = self.block(node.children_[1].children_)
+            def if_then():
+                if condition() != 0.0:
+                    then_block()
+            return if_then
+
+        if nodetype == "if_else":
+            condition = self.expr(node.children_[0])
+            then_block = self.block(node.children_[1].children_)
+            else_block = self.block(node.children_[2].children_)
+            def if_else():
+                if condition() != 0.0:
+                    then_block()
+                else:
+                    else_block()
+            return if_else
+
+        if nodetype == "while":
+            condition = self.expr(node.children_[0])
+            body = self.block(node.children_[1].children_)
+            def while_loop():
+                while condition() != 0.0:
+                    body()
+            return while_loop
+
+        if nodetype == "print_sheet":
+            info = node.children_[0].value
+            sheet = self.load(node.children_[1].symdata)
+            return lambda: print_sheet(info, sheet())
+
+        if nodetype == "cell_ref_assignment":
+            value = self.expr(node.children_[1])
+            cell_ref = node.children_[0]
+            if cell_ref.children_[0].nodetype == "dollar":
+                # writes the cell of the sheet the range refers to
+                write = self.current_cell(cell_ref.children_[0].symdata)[1]
+                return lambda: write(value())
+            sheet = self.load(cell_ref.children_[0].symdata)
+            col, row = cell_ref.children_[1].value[:2]
+            if self.typed:
+                return lambda: store_cell(sheet(), (row, col), value())
+            def assign_cell():
+                sheet()[row, col] = value()
+            return assign_cell
+
+        if nodetype == "print_range":
+            info = node.children_[0].value
+            value = self.expr(node.children_[1])
+            return lambda: print_range(info, value())
+
+        if nodetype == "range_assign":
+            store = self.store(node.children_[0].symdata)
+            value = self.expr(node.children_[1])
+            return lambda: store(value())
+
+        if nodetype == "for":
+            return self.for_loop(node)
+
+        if nodetype == "subroutine_call":
+            return self.call(node)
+
+        if nodetype == "return":
+            value = self.expr(node.children_[0])
+            def return_value():
+                raise ReturnValue(value())
+            return return_value
+
+        # not (yet) executed by the interpreter, see execute
+        return _nothing
+
+    def for_loop(self, node):
+        loop = node.symdata
+        ranges = [self.expr(range_expr) for range_expr in node.children_[0].children_]
+        slots = [cells.slot for cells in loop.ranges]
+        body = self.block(node.children_[1].children_)
+        depth, index = loop.depth, loop.slot
+        frames = self.frames
+        def for_loop():
+            frame = frames[depth]
+            for i in range(start_for(frame, slots, [values() for values in ranges])):
+                frame[index] = i
+                body()
+        return for_loop
+
+    def call(self, node):
+        '''Return a closure calling a subroutine or function, which returns
+           the return value. Calls are Python calls, so the depth of recursion
+           is limited by Python's recursion limit.'''
+        frames = self.frames
+        definition = node.children_[0].symdata.defnode
+        if definition.symdata.symtype == "builtin":
+            aggregate = AGGREGATES[definition.value]
+            values = self.expr(node.children_[1].children_[0])
+            return lambda: aggregate(values())
+        if len(node.children_) == 1:
+            arguments = []
+        else:
+            arguments = [self.expr(arg) for arg in node.children_[1].children_]
+        # the frame is the arguments followed by the locals
+        locals_ = [None] * (definition.symdata.frame_size - len(arguments))
+        body = self.subroutine(definition)
+
+        def call():
+            frame = [argument() for argument in arguments]
+            frame += locals_
+            caller = frames[1]
+            frames[1] = frame
+            value = body[0]()
+            frames[1] = caller
+            return value
+
+        cache = definition.symdata.cache
+        if cache is None:
+            return call
+        key, lookup, store = cache.key, cache.lookup, cache.store
+        def memoized_call():
+            frame = [argument() for argument in arguments]
+            k = key(frame)
+            value = lookup(k)
+            if value is memo.MISSING:
+                frame += locals_
+                caller = frames[1]
+                frames[1] = frame
+                value = body[0]()
+                frames[1] = caller
+                store(k, value)
+            return value
+        return memoized_call
+
+    def subroutine(self, definition):
+        '''Compiled body of a subroutine or function, as a one element list so
+           that calls can be compiled before the body is (recursive calls)'''
+        body = self.subroutines.get(id(definition))
+        if body is not None:
+            return body
+        body = [_nothing]
+        self.subroutines[id(definition)] = body
+        local_defs = self.definitions(definition.children_[-2].children_)
+        statements = self.block(definition.children_[-1].children_)
+        zero = self.zero
+        def run_subroutine():
+            try:
+                local_defs()
+                statements()
+            except ReturnValue as ret:
+                return ret.value
+            # a function that ends without return gives 0.0
+            return zero
+        body[0] = run_subroutine
+        return body
+
+    # Definitions
+
+    def definitions(self, definition_list):
+        '''Return a closure initializing scalar, sheet and range variables
+           (globals, or locals in the frame of the running call)'''
+        funcs = []
+        for definition in definition_list:
+            if definition.nodetype == "definition_scalar":
+                init = self.expr(definition.children_[0])
+                rounded = True
+            elif definition.nodetype == "definition_sheet":
+                if len(definition.children_) > 1:
+                    init = self.expr(definition.children_[1])
+                else:
+                    init = _nothing
+                rounded = False
+            elif definition.nodetype == "definition_range":
+                init = self.expr(definition.children_[0])
+                rounded = False
+            else:
+                continue
+            funcs.append(self.definition(self.store(definition.symdata), init, rounded))
+
+        def run_definitions():
+            for func in funcs:
+                func()
+        return run_definitions
+
+    def definition(self, store, init, rounded):
+        def define():
+            value = init()
+            if rounded:
+                value = round(value, 1)
+            store(value)
+        return define
+
+    def program(self, tree):
+        '''Return a closure running the whole program'''
+        memo.attach(tree, self.semdata.caches)
+        definitions = self.definitions(tree.children_[0].children_)
+        statements = self.block(tree.children_[1].children_)
+        def run():
+            try:
+                definitions()
+                statements()
+            except ReturnValue:
+                # return in the main program ends it
+                pass
+        return run
+
+def compile_program(tree, semdata):
+    '''Compile a checked syntax tree, returns a function running the program'''
+    return ClosureCompiler(semdata).program(tree)
+
+def run_program(tree, semdata):
+    compile_program(tree, semdata)()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+#
+# An alternative to the PLY lexer of main.py: one combined regexp with a
+# group per token, and a single loop that converts the matches into tokens,
+# instead of PLY's master regexp plus a Python callback per token rule.
+#
+# The token stream is the same as PLY's, including its quirks:
+#  - the rules are tried in PLY's order: function rules in the order of
+#    definition, then string rules from the longest regexp to the shortest
+#  - t_ID matches [a-z_]+ before t_IDENT and t_RANGE_IDENT can, so those two
+#    regexps never match by themselves (t_ID gives their token types)
+#  - !...! is an info string before != is compared, and -1.0 is a literal
+#    before - is a minus
+#  - only newlines outside comments count lines
+#
+# bench.py lexer checks that both lexers give the same tokens.
+
+import codecs
+import functools
+import mmap
+import re
+from decimal import Decimal
+
+from ply.lex import LexToken
+
+# Token rules in the order PLY tries them. NEWLINE and COMMENT matches give
+# no token, ERROR is anything else no rule matches. Ignored characters
+# (blanks) are not errors: blanks at the end of the text match nothing, so
+# finditer skips them, as PLY does.
+RULES = (
+    ('ID', r'[a-z_]+'),
+    ('INFO_STRING', r'!.*?!'),
+    ('COORDINATE_IDENT', r'[A-Z]{1,2}[0-9]{1,3}'),
+    ('DECIMAL_LITERAL', r'-?\d+\.\d'),
+    ('INT_LITERAL', r'-?\d+'),
+    ('FUNC_IDENT', r'[A-Z][a-z0-9_]+'),
+    ('SHEET_IDENT', r'[A-Z]+'),
+    ('NEWLINE', r'\n+'),
+    ('COMMENT', r'\.{3}[\s\S]*?\.{3}'),
+    ('DOTDOT', r'\.\.'),
+    ('ASSIGN', r':='),
+    ('DOLLAR', r'\$'),
+    ('GTEQ', r'>='),
+    ('LPAREN', r'\('),
+    ('LSQUARE', r'\['),
+    ('LTEQ', r'<='),
+    ('MULT', r'\*'),
+    ('NOTEQ', r'!='),
+    ('NUMBER_SIGN', r'\#'),
+    ('PLUS', r'\+'),
+    ('RPAREN', r'\)'),
+    ('RSQUARE', r'\]'),
+    ('COLON', r':'),
+    ('COMMA', r','),
+    ('DIV', r'/'),
+    ('EQ', r'='),
+    ('GT', r'>'),
+    ('LCURLY', r'{'),
+    ('LT', r'<'),
+    ('MINUS', r'-'),
+    ('RCURLY', r'}'),
+    ('SQUOTE', r"'"),
+    ('ERROR', r'[^ \t]'),
+)
+
+# The ignored characters (t_ignore) before a token are part of its match,
+# which halves the number of matches
+MASTER = re.compile("[ \t]*(?:" + "|".join("(" + regexp + ")" for name, regexp in RULES) + ")")
+
+# Group numbers of the rules that need more than the matched text
+(ID, INFO_STRING, DECIMAL_LITERAL, INT_LITERAL, NEWLINE, COMMENT, DOTDOT, ERROR) = [
+    [name for name, regexp in RULES].index(name) + 1 for name in
+    ('ID', 'INFO_STRING', 'DECIMAL_LITERAL', 'INT_LITERAL', 'NEWLINE', 'COMMENT',
+     'DOTDOT', 'ERROR')]
+TOKEN_TYPES = (None,) + tuple(name for name, regexp in RULES)
+
+COMMENT_RE = re.compile(r"\.{3,3}([\s\S]*?)\.{3,3}")
+
+# Files are read in chunks of this many bytes
+CHUNK_SIZE = 1 << 20
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    '''Generate the text of a UTF-8 file in pieces, without ever having all
+       of it in memory. Regular files are memory mapped, others (pipes) read.'''
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as f:
+        try:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty file or not mappable
+            view = None
+        if view is not None:
+            # pages already read are dropped, so that they don't stay in the
+            # memory of the process
+            release = hasattr(mmap, "MADV_DONTNEED") and chunk_size % mmap.PAGESIZE == 0
+            with view:
+                for start in range(0, len(view), chunk_size):
+                    text = decoder.decode(view[start:start + chunk_size])
+                    if release:
+                        view.madvise(mmap.MADV_DONTNEED, start, min(chunk_size, len(view) - start))
+                    yield text
+        else:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                yield decoder.decode(block)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+class CombinedLexer:
+    '''Lexer with the interface the PLY parser uses (input, token)
+
+       reserved: the reserved words of the language and their token types'''
+
+    def __init__(self, reserved):
+        self.reserved = reserved
+        self.lineno = 1
+        self.lexdata = ""
+        self.tokens = iter(())
+
+    def input(self, data):
+        self.input_chunks((data,))
+        self.lexdata = data
+
+    def input_chunks(self, chunks):
+        '''Lex text that comes in pieces (eg. read_chunks), tokens are
+           made as the parser asks for them'''
+        self.lexdata = ""
+        self.tokens = self.tokenize(chunks)
+        # the parser calls token() for every token, without a Python frame
+        # in between this is a bit faster
+        self.token = functools.partial(next, self.tokens, None)
+
+    def token(self):
+        return next(self.tokens, None)
+
+    def __iter__(self):
+        return self.tokens
+
+    def tokenize(self, chunks):
+        '''Generate the tokens of the text in chunks (an iterable of str)
+
+           Only complete lines are lexed, the rest waits for the next chunk:
+           no token but a comment continues on the next line. A comment not
+           closed on the lines read so far would be lexed as .. (DOTDOT), so
+           then more is read too. lexpos counts from the start of the text.'''
+        reserved = self.reserved
+        types = TOKEN_TYPES
+        chunks = iter(chunks)
+        buffer = ""
+        offset = 0
+        at_end = False
+        # where to look for the end of a comment that is not closed yet
+        comment_end = None
+        while True:
+            end = len(buffer) if at_end else buffer.rfind("\n") + 1
+            match = None
+            for match in MASTER.finditer(buffer, 0, end):
+                group = match.lastindex
+                if group == DOTDOT and not at_end and buffer.startswith("...", match.start(group)):
+                    pos = match.start()
+                    comment_end = match.start(group) + 3 - pos
+                    break
+                value = match.group(group)
+                if group == ID:
+                    type = reserved.get(value)
+                    if type is None:
+                        type = 'IDENT' if value[0] != '_' else 'RANGE_IDENT'
+                elif group == NEWLINE:
+                    self.lineno += len(value)
+                    continue
+                elif group == COMMENT:
+                    continue
+                elif group == ERROR:
+                    raise Exception("Illegal character '{}' at line {}".format(
+                        value, self.lineno))
+                else:
+                    type = types[group]
+                    if group == DECIMAL_LITERAL:
+                        value = Decimal(value)
+                    elif group == INT_LITERAL:
+                        value = int(value)
+                    elif group == INFO_STRING:
+                        value = COMMENT_RE.sub("", value[1:-1])
+                token = LexToken()
+                token.type = type
+                token.value = value
+                token.lineno = self.lineno
+                token.lexpos = offset + match.start(group)
+                yield token
+            else:
+                pos = match.end() if match is not None else 0
+            if at_end:
+                return
+            buffer = buffer[pos:]
+            offset += pos
+            while True:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    at_end = True
+                    break
+                buffer += chunk
+                if comment_end is None:
+                    break
+                # read on until the comment is closed, instead of lexing the
+                # whole comment again for every chunk
+                closed = buffer.find("...", comment_end)
+                if closed == -1:
+                    comment_end = max(comment_end, len(buffer) - 2)
+                elif buffer.find("\n", closed) != -1:
+                    comment_end = None
+                    break
+                else:
+                    comment_end = closed
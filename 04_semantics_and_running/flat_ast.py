@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+#
+# A flat, struct-of-arrays representation of the syntax tree.
+#
+# Every node is a row in parallel arrays: kind, value index, first child,
+# next sibling, line number and sign. Values (identifiers, literals, ...) are
+# stored once in a value table and referred to by index. The rows are in
+# preorder, so a pass over the whole tree is a loop over range(len(tree)) and
+# the children of a node always come after it.
+#
+# The parser builds ast_nodes.Node trees. FlatTree.from_node converts such a
+# tree and to_node converts it back, so the engines keep working on Nodes.
+# A FlatTree converts to bytes and back (to_bytes, from_bytes) without
+# pickle.
+
+from array import array
+from decimal import Decimal
+import gc
+import marshal
+import struct
+import sys
+
+from ast_nodes import Node, NODE_TYPES
+
+# The kind of a missing child (None in Node.children_)
+NONE_KIND = 255
+
+# No child or sibling
+NIL = -1
+
+MAGIC = b"SHFLAT"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<6sHII")  # magic, version, nodes, value bytes
+
+class FlatTree:
+    '''A syntax tree stored in parallel arrays, one row per node'''
+
+    def __init__(self):
+        self.kind = array('B')
+        self.value = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.lineno = array('i')
+        self.negative = array('B')
+        self.values = []
+        self.value_index = {}
+
+    def __len__(self):
+        return len(self.kind)
+
+    def intern(self, value):
+        '''Index of value in the value table'''
+        # Decimal('1.0'), 1.0 and 1 are equal but are different values here
+        key = (type(value), repr(value))
+        index = self.value_index.get(key)
+        if index is None:
+            index = self.value_index[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def add(self, kind, value=None, lineno=0, negative=False):
+        '''Add a node without children, return its index'''
+        self.kind.append(kind)
+        self.value.append(self.intern(value))
+        self.first_child.append(NIL)
+        self.next_sibling.append(NIL)
+        self.lineno.append(lineno)
+        self.negative.append(negative)
+        return len(self.kind) - 1
+
+    # Accessing nodes
+
+    def nodetype(self, i):
+        kind = self.kind[i]
+        return None if kind == NONE_KIND else NODE_TYPES[kind]
+
+    def node_value(self, i):
+        return self.values[self.value[i]]
+
+    def children(self, i):
+        '''Indices of the children of node i'''
+        child = self.first_child[i]
+        next_sibling = self.next_sibling
+        while child != NIL:
+            yield child
+            child = next_sibling[child]
+
+    # Converting from and to Node trees
+
+    @classmethod
+    def from_node(cls, tree):
+        '''Flatten a Node tree (the root must not be None)'''
+        flat = cls()
+        # the last child added to each node, to link its next sibling
+        last_child = []
+        stack = [(tree, NIL)]
+        while stack:
+            node, parent = stack.pop()
+            if node is None:
+                index = flat.add(NONE_KIND)
+            else:
+                index = flat.add(node.kind, node.value, node.lineno, node.negative)
+            last_child.append(NIL)
+            if parent != NIL:
+                if last_child[parent] == NIL:
+                    flat.first_child[parent] = index
+                else:
+                    flat.next_sibling[last_child[parent]] = index
+                last_child[parent] = index
+            if node is not None:
+                stack.extend([(child, index) for child in reversed(node.children_)])
+        return flat
+
+    def to_node(self, root=0):
+        '''Rebuild the Node tree'''
+        # Creating many objects that stay alive triggers the cyclic garbage
+        # collector again and again, for nothing: the tree has no cycles
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.build_nodes(root)
+        finally:
+            if enabled:
+                gc.enable()
+
+    def build_nodes(self, root):
+        nodes = [None] * len(self)
+        values, value, lineno, negative = self.values, self.value, self.lineno, self.negative
+        first_child, next_sibling = self.first_child, self.next_sibling
+        # children come after their parent, so build bottom-up from the end
+        for i in range(len(self) - 1, root - 1, -1):
+            kind = self.kind[i]
+            if kind == NONE_KIND:
+                continue
+            node = Node(NODE_TYPES[kind], values[value[i]], lineno[i])
+            if negative[i]:
+                node.negative = True
+            child = first_child[i]
+            if child != NIL:
+                children = node.children_
+                while child != NIL:
+                    children.append(nodes[child])
+                    child = next_sibling[child]
+            nodes[i] = node
+        return nodes[root]
+
+    # Serialization
+
+    def to_bytes(self):
+        '''The tree in a compact binary format'''
+        values = marshal.dumps([encode_value(value) for value in self.values])
+        parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(self), len(values)), values]
+        for column in self.columns():
+            if sys.byteorder != "little" and column.itemsize > 1:
+                column = array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        '''Inverse of to_bytes. Raises ValueError for data in another format'''
+        try:
+            magic, version, count, value_size = HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("not a flat syntax tree")
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a flat syntax tree of version " + str(FORMAT_VERSION))
+        flat = cls()
+        offset = HEADER.size
+        flat.values = [decode_value(value)
+                       for value in marshal.loads(data[offset:offset + value_size])]
+        offset += value_size
+        for column in flat.columns():
+            size = count * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            if sys.byteorder != "little" and column.itemsize > 1:
+                column.byteswap()
+            offset += size
+        if offset != len(data) or len(flat.kind) != count:
+            raise ValueError("truncated flat syntax tree")
+        flat.value_index = {(type(value), repr(value)): i
+                            for i, value in enumerate(flat.values)}
+        return flat
+
+    def columns(self):
+        return (self.kind, self.value, self.first_child, self.next_sibling,
+                self.lineno, self.negative)
+
+# Values are identifiers, info strings, numbers, Decimals and tuples of them.
+# marshal handles all but Decimal, so Decimals and tuples are tagged.
+
+def encode_value(value):
+    if isinstance(value, Decimal):
+        return ("D", str(value))
+    if isinstance(value, tuple):
+        return ("T", [encode_value(item) for item in value])
+    return value
+
+def decode_value(value):
+    if isinstance(value, tuple):
+        tag, payload = value
+        if tag == "D":
+            return Decimal(payload)
+        return tuple(decode_value(item) for item in payload)
+    return value
+
+# Printing, with the same output as tree_print.treeprint for Node trees
+
+def treeprint(flat, outtype="unicode", root=0):
+    '''Print the tree like tree_print.treeprint (outtype unicode or ascii)'''
+    import tree_print
+    if outtype == "unicode":
+        indents = (tree_print.child_indent_uni, tree_print.normal_indent_uni,
+                   tree_print.last_child_indent_uni, tree_print.last_normal_indent_uni)
+    else:
+        indents = (tree_print.child_indent_asc, tree_print.normal_indent_asc,
+                   tree_print.last_child_indent_asc, tree_print.last_normal_indent_asc)
+    lines = []
+    # (node index or None, first line prefix, prefix of the rest)
+    stack = [(root, "", "")]
+    while stack:
+        i, first_indent, indent = stack.pop()
+        if i is None or flat.kind[i] == NONE_KIND:
+            lines.append(first_indent + "NONE")
+            continue
+        value = flat.values[flat.value[i]]
+        sign = "-" if flat.negative[i] else ""
+        lines.append(first_indent + NODE_TYPES[flat.kind[i]] + " (" + sign + str(value) + ")")
+        children = list(flat.children(i))
+        if not children:
+            stack.append((None, indent + indents[2] + "[EMPTY]: ", indent + indents[3]))
+            continue
+        last = len(children) - 1
+        for n in range(last, -1, -1):
+            child_indent, rest_indent = indents[2:] if n == last else indents[:2]
+            stack.append((children[n], indent + child_indent + "[" + str(n) + "]: ",
+                          indent + rest_indent))
+    print("\n".join(lines))
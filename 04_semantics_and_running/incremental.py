@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+#
+# Incremental lexing and parsing of a program that is edited, eg. in an
+# editor that runs the pipeline again on every save.
+#
+# A Program keeps the text, its tokens (a TokenBuffer), the syntax tree and
+# the first token of every top-level item: each function or variable
+# definition and each statement of the main program. An edit (offset,
+# removed length, inserted text) then
+#  - lexes the text again from the first token of the item the edit starts
+#    in, up to the first token of the item after the edit. The lexer has no
+#    state between tokens, so from there on the tokens are the old ones,
+#    only moved.
+#  - parses just the items between those tokens again, with parsers that
+#    start from a list of definitions or statements
+#  - splices the new tokens and items into the buffer and the tree. The
+#    nodes of all other items are kept as they are.
+# Edits that are not local (that open a comment, break up a block, turn a
+# statement into a definition, ...) parse the whole program again, so the
+# result is always the tree a full parse gives.
+#
+# The nodes of an item have line numbers relative to the item: 1 is the line
+# of its first token (0 is still no line). The item's own line is the one of
+# its first token in the buffer, so an edit that adds or removes lines only
+# moves the line numbers of the later tokens (an array), not of their nodes.
+# Program.lineno gives the line of a node in the text, and
+# Program.flat_tree the tree with the line numbers of a full parse.
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+import numpy
+
+import flat_ast
+import ply_tables
+from combined_lexer import CombinedLexer
+from token_buffer import TokenBuffer, BufferLexer
+
+# Start symbols of the parsers
+PROGRAM = 'program'
+DEFINITIONS = 'function_or_variable_definition_star'
+STATEMENTS = 'statement_list'
+
+# The rules of top-level items
+ITEM_RULES = ('function_or_variable_definition', 'statement')
+
+# Text is given to the lexer in pieces of this many characters, so that it
+# reads only as far as needed
+PIECE_SIZE = 1 << 16
+
+class ParseError(Exception):
+    '''Syntax error in a program'''
+
+class NotLocal(Exception):
+    '''The edit needs a full parse'''
+
+class Grammar:
+    '''Parsers of the grammar of a module (main) for the whole program and
+       for parts of it. The parsers record where the items they reduce start.'''
+
+    def __init__(self, module):
+        self.module = module
+        self.parsers = {}
+        # id of item node -> lexpos of its first token
+        self.item_lexpos = {}
+
+    def parser(self, start):
+        parser = self.parsers.get(start)
+        if parser is None:
+            parser = ply_tables.make_parser(self.module, None if start == PROGRAM else start)
+            self.module.track_line_numbers(parser)
+            for production in parser.productions:
+                if production.name in ITEM_RULES:
+                    production.callable = self.recording(production.callable)
+            parser.errorfunc = syntax_error
+            self.parsers[start] = parser
+        return parser
+
+    def recording(self, action):
+        item_lexpos = self.item_lexpos
+        def record(p):
+            action(p)
+            item_lexpos[id(p[0])] = p.lexpos(1)
+        return record
+
+    def parse(self, start, tokens):
+        '''Parse a TokenBuffer from start symbol start'''
+        self.item_lexpos.clear()
+        lexer = BufferLexer(tokens)
+        # tracking gives empty productions the line number of the lexer,
+        # with 0 they get none, as without tracking
+        lexer.lineno = 0
+        return self.parser(start).parse(lexer=lexer, tracking=True)
+
+    def item_starts(self, tokens, items):
+        '''Index of the first token of each item in the last parse'''
+        lexpos, item_lexpos = tokens.lexpos, self.item_lexpos
+        return array('q', [bisect_left(lexpos, item_lexpos[id(item)]) for item in items])
+
+def syntax_error(token):
+    if token is None:
+        raise ParseError("Syntax error at end of input")
+    raise ParseError("Syntax error at line {}: {} {!r}".format(
+        token.lineno, token.type, token.value))
+
+def pieces(text, start):
+    for i in range(start, len(text), PIECE_SIZE):
+        yield text[i:i + PIECE_SIZE]
+
+def shift(column, start, delta):
+    '''Add delta to column[start:] (an array)'''
+    if delta and start < len(column):
+        view = numpy.frombuffer(column, dtype=column.typecode)
+        view[start:] += delta
+        # the array can't be resized while the view exists
+        del view
+
+def relative_lines(item, line):
+    '''Make the line numbers of the nodes of an item, which starts on line,
+       relative to it'''
+    delta = line - 1
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if node.lineno:
+            node.lineno -= delta
+        stack.extend(node.children_)
+
+class Program:
+    '''The text, tokens and syntax tree of a program that is edited (with
+       line numbers relative to the top-level items)
+
+       grammar: a Grammar (of main)'''
+
+    def __init__(self, grammar, text):
+        self.grammar = grammar
+        self.parse_all(text)
+
+    def parse_all(self, text):
+        '''Lex and parse all of text. Raises ParseError.'''
+        grammar = self.grammar
+        tokens = TokenBuffer(grammar.module.tokens)
+        tokens.extend(self.lexer(text))
+        tree = grammar.parse(PROGRAM, tokens)
+        definitions, statements = tree.children_
+        items = definitions.children_ + statements.children_
+        self.item_start = grammar.item_starts(tokens, items)
+        for item, start in zip(items, self.item_start):
+            relative_lines(item, tokens.lineno[start])
+        self.text, self.tokens, self.tree = text, tokens, tree
+
+    def item_line(self, index):
+        '''The line of item index (of its first token)'''
+        return self.tokens.lineno[self.item_start[index]]
+
+    def lineno(self, index, node):
+        '''The line of node, a node of item index (0 if it has none)'''
+        return node.lineno and node.lineno + self.item_line(index) - 1
+
+    def flat_tree(self):
+        '''The tree as a flat_ast.FlatTree, with the line numbers of a full
+           parse'''
+        flat = flat_ast.FlatTree.from_node(self.tree)
+        definitions, statements = flat.children(0)
+        lineno = numpy.frombuffer(flat.lineno, dtype=flat.lineno.typecode)
+        index = 0
+        # the rows of an item reach to the next item, or the end of its list
+        for items, end in ((definitions, statements), (statements, len(flat))):
+            for row in flat.children(items):
+                following = flat.next_sibling[row]
+                lines = lineno[row:end if following == flat_ast.NIL else following]
+                lines[lines != 0] += self.item_line(index) - 1
+                index += 1
+        del lines, lineno
+        return flat
+
+    def lexer(self, text, lineno=1):
+        lexer = CombinedLexer(self.grammar.module.reserved)
+        lexer.lineno = lineno
+        lexer.input(text)
+        return lexer
+
+    def edit(self, offset, removed, inserted):
+        '''Replace removed characters at offset with the text inserted, and
+           return the new tree. Raises ParseError (and lexer errors) without
+           changing the program.'''
+        text = self.text[:offset] + inserted + self.text[offset + removed:]
+        try:
+            self.reparse(text, offset, offset + removed, len(inserted) - removed)
+        except NotLocal:
+            self.parse_all(text)
+        return self.tree
+
+    def item_at(self, pos):
+        '''Index of the item the text position pos belongs to: an item
+           reaches from its first token to the first token of the next one'''
+        token = bisect_right(self.tokens.lexpos, pos) - 1
+        return max(bisect_right(self.item_start, token) - 1, 0)
+
+    def reparse(self, text, start, end, delta):
+        '''Lex and parse again the items of the old text between start and
+           end, which is text now, moved by delta characters'''
+        tokens, item_start = self.tokens, self.item_start
+        definitions, statements = self.tree.children_
+        count, defs = len(item_start), len(definitions.children_)
+
+        first, last = self.item_at(start), self.item_at(end)
+        if first > 0 and start <= tokens.lexpos[item_start[first]]:
+            # the edit may continue the previous item
+            first -= 1
+        begin = item_start[first]
+        stop = item_start[last + 1] if last + 1 < count else len(tokens)
+
+        # Lex from the first token of the items (or from the start) until
+        # the lexer meets the old token at stop
+        pos, lineno = (tokens.lexpos[begin], tokens.lineno[begin]) if first else (0, 1)
+        stop_pos = tokens.lexpos[stop] + delta if stop < len(tokens) else None
+        fragment = tokens.fragment()
+        lexer = CombinedLexer(self.grammar.module.reserved)
+        lexer.lineno = lineno
+        line_delta = 0
+        for token in lexer.tokenize(pieces(text, pos)):
+            token.lexpos += pos
+            if stop_pos is not None and token.lexpos >= stop_pos:
+                if token.lexpos != stop_pos:
+                    # a token (or comment) runs over the old token
+                    raise NotLocal
+                line_delta = token.lineno - tokens.lineno[stop]
+                break
+            fragment.append(token.type, token.value, token.lineno, token.lexpos)
+        else:
+            if stop_pos is not None:
+                raise NotLocal
+
+        # Parse the new tokens as the kind of items they replace
+        new_defs, new_statements = [], []
+        if len(fragment):
+            start_symbol = (DEFINITIONS if last < defs else
+                            STATEMENTS if first >= defs else PROGRAM)
+            try:
+                result = self.grammar.parse(start_symbol, fragment)
+            except ParseError:
+                raise NotLocal
+            if start_symbol == DEFINITIONS:
+                new_defs = result.children_
+            elif start_symbol == STATEMENTS:
+                new_statements = result.children_
+            else:
+                new_defs, new_statements = (child.children_ for child in result.children_)
+        new_items = new_defs + new_statements
+        def_end, statement_start = min(last + 1, defs), max(first, defs)
+        if count - defs - max(last + 1 - statement_start, 0) + len(new_statements) == 0:
+            # no statements left
+            raise NotLocal
+        new_starts = self.grammar.item_starts(fragment, new_items)
+        for item, start in zip(new_items, new_starts):
+            relative_lines(item, fragment.lineno[start])
+        shift(new_starts, 0, begin)
+
+        # Splice
+        tokens.splice(begin, stop, fragment)
+        after = begin + len(fragment)
+        shift(tokens.lexpos, after, delta)
+        shift(tokens.lineno, after, line_delta)
+        item_start[first:last + 1] = new_starts
+        shift(item_start, first + len(new_items), len(fragment) - (stop - begin))
+        if first < defs:
+            definitions.children_[first:def_end] = new_defs
+        if last >= defs:
+            statements.children_[statement_start - defs:last + 1 - defs] = new_statements
+        self.text = text
+
+        # list nodes have the line of their first item
+        defs = len(definitions.children_)
+        statements.lineno = self.lineno(defs, statements.children_[0])
+        definitions.lineno = (self.lineno(0, definitions.children_[0]) if defs
+                              else statements.lineno)
+        self.tree.lineno = definitions.lineno
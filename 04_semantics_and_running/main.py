@@ -4,6 +4,7 @@ import sys, ply.lex
 import re
 from decimal import *
 import tree_print
+import ply_tables
 
 reserved = {
         'sheet':'SHEET',
@@ -159,7 +160,7 @@ def t_error(t):
     raise Exception("Illegal character '{}' at line {}".format( 
         t.value[0], t.lexer.lineno ) )
 
-lexer = ply.lex.lex()
+lexer = ply_tables.make_lexer(sys.modules[__name__])
 
 # ------------------------------------------------------------------------------
 # Phase 2 AND 3
@@ -170,26 +171,9 @@ from ply import yacc
 ### [a] : a_opt
 ### <a+> : a_plus // if necessary
 
-class Node:
-    def __init__(self,type=None, value=None):
-        self.setType(type)
-        self.setValue(value)
-        self.children_ = []
-    
-    def addChild(self, node):
-        self.children_.append(node)
-
-    def insertFirstChild(self, child):
-        self.children_.insert(0,child)
-    def setValue(self, value):
-        self.value = value
-    
-    def setType(self, type):
-        self.nodetype = type
-    
-    def assignChildren(self, children):
-        self.children_ = children
-    
+from ast_nodes import Node, KINDS
+import flat_ast
+import parse_cache
 
 def p_program(p):
     ''' program : function_or_variable_definition_star statement_list'''
@@ -348,7 +332,7 @@ def p_scalar_definition(p):
     p[0] = Node("definition_scalar",p[2])
     if len(p) == 3: #1
         # define behaviour when variable is not intialized
-        p[0].addChild(Node('decimal',('+',0.0)))
+        p[0].addChild(Node('decimal',0.0))
         return
     #t2
     p[0].addChild(p[4])
@@ -596,10 +580,9 @@ def p_factor(p):
                 | MINUS atom'''
     if (len(p) == 2): #t1
         p[0] = p[1]
-        p[0].value = ('+', p[0].value)
     else: #t2
         p[0] = p[2]
-        p[0].value = ('-', p[0].value)
+        p[0].negative = not p[0].negative
 
 def p_atom(p):
     '''atom : IDENT 
@@ -649,13 +632,105 @@ def p_error(p):
     print('Syntax error',p)
     raise SystemExit
 
-parser = yacc.yacc()
+def lineno_of(p):
+    '''Line number of the first token of a production'''
+    for i in range(1, len(p)):
+        if isinstance(p[i], Node):
+            if p[i].lineno:
+                return p[i].lineno
+        elif p.lineno(i):
+            return p.lineno(i)
+    return 0
+
+def with_line_numbers(action):
+    '''Wrap a p_* action so that the nodes it creates get the line number
+       of the first token of the production'''
+    def track(p):
+        action(p)
+        node = p[0]
+        if isinstance(node, Node):
+            if node.lineno:
+                # an existing (list) node, only the appended child is new
+                children = node.children_[-1:]
+            else:
+                children = node.children_
+            missing = [child for child in children
+                       if isinstance(child, Node) and not child.lineno]
+            if missing or not node.lineno:
+                lineno = lineno_of(p)
+                if not node.lineno:
+                    node.lineno = lineno
+                for child in missing:
+                    child.lineno = lineno
+    #the grammar signature of the parse cache hashes the code of both
+    track.__wrapped__ = action
+    return track
+
+def track_line_numbers(parser):
+    for production in parser.productions:
+        if production.callable:
+            production.callable = with_line_numbers(production.callable)
+
+parser = ply_tables.make_parser(sys.modules[__name__])
+track_line_numbers(parser)
+GRAMMAR_SIGNATURE = parse_cache.grammar_signature(parser, lexer)
 
 # ------------------------------------------------------------------------------
 # Phase 4
 
-from semantics_common import visit_tree, SymbolData, SemData
-import numpy
+from semantics_common import visit_tree, SymbolData, SemData, CheckRegistry
+from runtime import AGGREGATES, ARITHMETIC, ReturnValue, compare_chain, range_slices, shift_range, \
+    start_for, new_sheet, zero_sheet, load_cell, store_cell, parse_storage, print_scalar, print_sheet, \
+    print_range, SheetFiles, SheetFileError
+import closure_engine
+import combined_lexer
+import bytecode_vm
+import memo
+import numeric
+import optimizer
+import pycodegen
+import token_buffer
+
+VARIABLE_TYPES = ("scalar", "sheet", "range")
+
+def new_semdata():
+    '''A SemData for the semantic checks (and the engines after them)'''
+    semdata = SemData()
+    #parameters of the subroutine or function being checked
+    semdata.tempSymtbl = {}
+    #definition of that subroutine or function, None outside of them
+    semdata.frame_owner = None
+    #number of global variables
+    semdata.global_size = 0
+    #caches of the pure functions (a memo.Caches), None for no memoization
+    semdata.caches = None
+    #the for statements around the node being checked
+    semdata.loops = []
+    #typed storage of the sheets (a runtime.Storage), None for the default
+    semdata.storage = None
+    #files of sheets by sheet name (runtime.SheetFiles)
+    semdata.sheet_files = {}
+    #the numeric mode (a numeric.Numeric)
+    semdata.numeric = numeric.DEFAULT
+    for name in AGGREGATES:
+        definition = builtin_definition(name)
+        definition.symdata = semdata.symtbl[name] = SymbolData("builtin", definition)
+    return semdata
+
+def builtin_definition(name):
+    '''Definition node of a built-in function, as if it was declared
+       function Name[ _values : range ] return scalar, so that calls of it
+       are checked like calls of user functions'''
+    definition = Node("definition_function", name)
+    formals = Node("formals")
+    formals.addChild(Node("range", "_values"))
+    for child in (Node("func", name), formals, Node("return", "scalar"),
+                  Node("variable_definition_list"), Node("statement_list")):
+        definition.addChild(child)
+    return definition
+
+def is_builtin(definition):
+    return definition.symdata.symtype == "builtin"
 
 def add_def(node, semdata):
     #skip if not a node
@@ -668,33 +743,52 @@ def add_def(node, semdata):
     if nodetype.startswith("definition"):
         vtype = nodetype.split("_")[1]
         ident = node.value
-        if ident in semdata.symtbl or ident in semdata.tempSymtbl:
+        existing = semdata.symtbl.get(ident)
+        #a function of the program may replace a built-in one
+        if (existing is not None and existing.symtype != "builtin") or ident in semdata.tempSymtbl:
             return f"Error, redefine {vtype} {ident}"
         else:
             symdata = SymbolData(vtype, node)
             semdata.symtbl[ident] = symdata
             node.symdata = symdata
+            if vtype in VARIABLE_TYPES:
+                allocate(symdata, semdata)
 
     if nodetype == "definition_function" or nodetype == "definition_subroutine":
+        #parameters and locals go to the frame of this definition
+        semdata.frame_owner = node.symdata
+        node.symdata.frame_size = 0
         formals = node.children_[1]
         if isinstance(formals, Node): #if formals is not empty
             list_formals = formals.children_
             for arg in list_formals:
                 symdata = SymbolData(arg.nodetype, node)
+                allocate(symdata, semdata)
                 semdata.tempSymtbl[arg.value] = symdata
         
             
 
 
-    #check usage
+    #check usage, and annotate the node with the symbol it refers to
     TYPE = ['func', 'sub', 'range', 'sheet', 'scalar']
     if nodetype in TYPE:
-        if not isinstance(node.value, str): #ident is in an expression as expression node value contain the sign of the value as well, eg (+, sum)
-            ident = node.value[1]
-        else:  
-            ident = node.value
-        if not (ident in semdata.symtbl or ident in semdata.tempSymtbl):
+        ident = node.value
+        symdata = semdata.tempSymtbl.get(ident) or semdata.symtbl.get(ident)
+        if symdata is None:
             return f"Error, no {nodetype} \"{ident}\""
+        node.symdata = symdata
+
+def allocate(symdata, semdata):
+    '''Give a variable its address (depth, slot): depth 0 is the frame of
+       the global variables, depth 1 the frame of the subroutine or function
+       being checked, where the parameters come first'''
+    owner = semdata.frame_owner
+    if owner is None:
+        symdata.depth, symdata.slot = 0, semdata.global_size
+        semdata.global_size += 1
+    else:
+        symdata.depth, symdata.slot = 1, owner.frame_size
+        owner.frame_size += 1
         
 def clear_temp(node, semdata):
     #skip if not a node
@@ -703,20 +797,71 @@ def clear_temp(node, semdata):
     #clear temporary symtbl
     if node.nodetype == "definition_function" or node.nodetype == "definition_subroutine":
         semdata.tempSymtbl.clear()
-        #delete local from symtbl
-        temp_vars = node.children_[2]
+        semdata.frame_owner = None
+        #delete local from symtbl (the locals are the second last child of
+        #both functions and subroutines)
+        temp_vars = node.children_[-2]
         for var in temp_vars.children_:
             ident = var.value
-            semdata.symtbl.pop(ident)
+            semdata.symtbl.pop(ident, None)
 
 
+def enter_for(node, semdata):
+    '''Give a for loop its slots, like a variable: the index of the current
+       cell, and the cells of each of its ranges'''
+    if not isinstance(node, Node):
+        return None
+    loop = SymbolData("for", node)
+    allocate(loop, semdata)
+    loop.ranges = []
+    for range_expr in node.children_[0].children_:
+        cells = SymbolData("cells", range_expr)
+        allocate(cells, semdata)
+        cells.index = loop.slot
+        loop.ranges.append(cells)
+    node.symdata = loop
+    semdata.loops.append(node)
+
+def leave_for(node, semdata):
+    if isinstance(node, Node):
+        semdata.loops.pop()
+
+def check_dollar(node, semdata):
+    '''Annotate the dollar node of $ and $:_range with the cells of the for
+       loop range it refers to'''
+    #skip if not a node
+    if not isinstance(node, Node):
+        return None
+    dollar = node.children_[0]
+    if dollar.nodetype != "dollar":
+        return None
+    if not semdata.loops:
+        return "$ outside of a for loop"
+    if len(node.children_) == 1:
+        loop = semdata.loops[-1].symdata
+        if len(loop.ranges) > 1:
+            return "$ in a for loop of several ranges, use $:_range"
+        dollar.symdata = loop.ranges[0]
+        return None
+    name = node.children_[1].value
+    #the innermost loop going through the range variable
+    for loop in reversed(semdata.loops):
+        for cells in loop.symdata.ranges:
+            range_children = cells.defnode.children_
+            if len(range_children) == 1 and range_children[0].nodetype == "range" \
+                    and range_children[0].value == name:
+                dollar.symdata = cells
+                return None
+    return f"$:{name} is not a range of a for loop"
+
 def check_range_expr(node, semdata):
     #skip if not a node
     if not isinstance(node, Node):
         return None
     
     if node.nodetype == "range_expr":
-        if len(node.children_) == 2 and node.children_[0].nodetype == "cell_ref":
+        #(a shifted range has two more children per shift)
+        if node.children_[0].nodetype == "cell_ref":
             start = node.children_[0]
             end = node.children_[1]
             if start.children_[0].nodetype != "sheet":
@@ -729,6 +874,20 @@ def check_range_expr(node, semdata):
             if coordStart[0] != coordEnd[0] and coordStart[1] != coordEnd[1]:
                 return f"Range is not valid: from {coordStart[2]} to {coordEnd[2]}"
 
+def set_storage(node, semdata):
+    #skip if not a node
+    if not isinstance(node, Node):
+        return None
+    symdata = node.symdata
+    if node.nodetype != "definition_sheet" or symdata is None:
+        return None
+    storage = semdata.storage
+    symdata.storage = storage.of(node.value) if storage is not None else None
+    symdata.files = semdata.sheet_files.get(node.value)
+    if len(node.children_) > 1:
+        #the sheet_init node makes the sheet
+        node.children_[1].symdata = symdata
+
 def check_sheet_initializing_list(node, semdata):
     #skip if not a node
     if not isinstance(node, Node):
@@ -750,14 +909,18 @@ def check_subroutine_and_function_call(node, semdata):
 
     if node.nodetype == "subroutine_call":
         ident = node.value
-        symboldata = semdata.symtbl[ident]
+        symboldata = semdata.symtbl.get(ident)
+        if symboldata is None: #undefined, reported by add_def
+            return None
         def_node = symboldata.defnode 
         if def_node.nodetype == "definition_function":
             return f"subroutine call for function {ident}"
         return None
     if node.nodetype == "function_call":
-        ident = node.value[1]
-        symboldata = semdata.symtbl[ident]
+        ident = node.value
+        symboldata = semdata.symtbl.get(ident)
+        if symboldata is None: #undefined, reported by add_def
+            return None
         def_node = symboldata.defnode 
         if def_node.nodetype == "definition_subroutine":
             return f"function call for subroutine {ident}"
@@ -775,7 +938,9 @@ def check_number_args(node, semdata):
             agruments = node.children_[1]
             n = len(agruments.children_)
         ident = node.children_[0].value
-        symdata = semdata.symtbl[ident]
+        symdata = semdata.symtbl.get(ident)
+        if symdata is None: #undefined, reported by add_def
+            return None
         node_def = symdata.defnode  
         
         defined_args = node_def.children_[1]
@@ -787,6 +952,19 @@ def check_number_args(node, semdata):
             if def_n != n :
                 return f"Incompatible number of arguments, def {def_n} but found {n}"
         
+def check_builtin_arguments(node, semdata):
+    #skip if not a node
+    if not isinstance(node, Node):
+        return None
+
+    if node.nodetype == "function_call" and len(node.children_) > 1:
+        symdata = node.children_[0].symdata
+        if symdata is None or symdata.symtype != "builtin":
+            return None
+        for argument in node.children_[1].children_:
+            if argument.nodetype != "range_expr":
+                return f"{node.value} needs a range argument"
+
 def return_check(node, semdata):
     #skip if not a node
     if not isinstance(node, Node):
@@ -816,52 +994,295 @@ def print_symbol_table(semdata, title):
             print("  ", attr, "=", printvalue)
 
 
-def semantic_checks(tree, semdata):
-    #check variable and basic scoping
-    visit_tree(tree, add_def, clear_temp, semdata)
-    #check range expression
-    visit_tree(tree, check_range_expr, None, semdata)
-
-    #check sheet initialization
-    visit_tree(tree, check_sheet_initializing_list, None, semdata)
-
-    #check subroutine/function call
-    visit_tree(tree, check_subroutine_and_function_call, None, semdata)
+# All semantic checks, run in a single traversal of the tree. Each check is
+# only called for the node types it is registered for.
+
+DEFINITION_TYPES = ["definition_scalar", "definition_sheet", "definition_range",
+                    "definition_function", "definition_subroutine"]
+USAGE_TYPES = ['func', 'sub', 'range', 'sheet', 'scalar']
+CALL_TYPES = ["function_call", "subroutine_call"]
+
+semantic_check_registry = CheckRegistry()
+#check variable and basic scoping
+semantic_check_registry.add(DEFINITION_TYPES + USAGE_TYPES, before=add_def)
+semantic_check_registry.add(["definition_function", "definition_subroutine"], after=clear_temp)
+#check range expression
+semantic_check_registry.add(["range_expr"], before=check_range_expr)
+#for loops and the $ cells in them
+semantic_check_registry.add(["for"], before=enter_for, after=leave_for)
+semantic_check_registry.add(["cell_ref"], before=check_dollar)
+#check sheet initialization, and the storage of sheets
+semantic_check_registry.add(["sheet_init_list"], before=check_sheet_initializing_list)
+semantic_check_registry.add(["definition_sheet"], before=set_storage)
+#check subroutine/function call and number of arguments (after the children,
+#so that an undefined name is reported by add_def first)
+semantic_check_registry.add(CALL_TYPES, after=check_subroutine_and_function_call)
+semantic_check_registry.add(CALL_TYPES, after=check_number_args)
+semantic_check_registry.add(["function_call"], after=check_builtin_arguments)
+#check return statments of subroutinee
+semantic_check_registry.add(["definition_subroutine"], before=return_check)
 
-    #check number of arguments:
-    visit_tree(tree, check_number_args, None, semdata)
-
-    #check return statments of subroutinee
-    visit_tree(tree, return_check, None, semdata)
+def semantic_checks(tree, semdata):
+    semantic_check_registry.run(tree, semdata)
+
+def collect_semantic_errors(tree, semdata):
+    '''Run all semantic checks without stopping at the first error.
+       Returns a list of (line number, message) pairs'''
+    return semantic_check_registry.collect(tree, semdata)
+
+# Node kinds handled by the interpreter
+
+K_SCALAR = KINDS["scalar"]
+K_SHEET = KINDS["sheet"]
+K_SHEET_INIT_SIZE = KINDS["sheet_init_size"]
+K_SHEET_INIT_LIST = KINDS["sheet_init_list"]
+K_DECIMAL = KINDS["decimal"]
+K_PRINT_SHEET = KINDS["print_sheet"]
+K_PRINT_SCALAR = KINDS["print_scalar"]
+K_IF = KINDS["if"]
+K_IF_ELSE = KINDS["if_else"]
+K_WHILE = KINDS["while"]
+K_SUBROUTINE_CALL = KINDS["subroutine_call"]
+K_CELL_REF_ASSIGNMENT = KINDS["cell_ref_assignment"]
+K_SCALAR_ASSIGNMENT = KINDS["scalar_assignment"]
+K_CELL_REF = KINDS["cell_ref"]
+K_SCALAR_EXPR = KINDS["scalar_expr"]
+K_SIMPLE_EXPR = KINDS["simple_expr"]
+K_TERM = KINDS["term"]
+
+K_RETURN = KINDS["return"]
+K_FUNCTION_CALL = KINDS["function_call"]
+K_RANGE = KINDS["range"]
+K_RANGE_EXPR = KINDS["range_expr"]
+K_RANGE_ASSIGN = KINDS["range_assign"]
+K_PRINT_RANGE = KINDS["print_range"]
+K_FOR = KINDS["for"]
+K_DOLLAR = KINDS["dollar"]
+
+# Variables are kept in frames, lists indexed by the slot the semantic checks
+# gave them: semdata.frames[depth][slot], where frames[0] has the globals and
+# frames[1] the parameters and locals of the running call.
+#
+# Calls don't recurse in Python. Statements and expressions with a call in
+# them are run by generators (the *_steps functions), which yield every call
+# to make as (definition, frame) and are sent its return value. run_calls
+# keeps the generators of the waiting callers on a stack, the activation
+# records, so the depth of recursion is only limited by memory. Code without
+# calls is run by the plain eval_node and execute. Built-in functions are not
+# calls: they are evaluated on the spot, like an operator.
 
 def run_program(tree, semdata):
-    definition_list = tree.children_[0].children_
-
+    semdata.frames = [[None] * semdata.global_size, None]
+    semdata.calling = nodes_with_calls(tree)
+    memo.attach(tree, semdata.caches)
+    run_calls(program_steps(tree, semdata), semdata)
+
+def nodes_with_calls(tree):
+    '''Ids of the nodes with a function or subroutine call in their subtree'''
+    order = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(child for child in node.children_ if isinstance(child, Node))
+    calling = set()
+    #children come before their parents
+    for node in reversed(order):
+        if ((node.kind == K_FUNCTION_CALL and not is_builtin(node.children_[0].symdata.defnode))
+                or node.kind == K_SUBROUTINE_CALL
+                or any(id(child) in calling for child in node.children_)):
+            calling.add(id(node))
+    return calling
+
+def run_calls(steps, semdata):
+    '''Run the generator steps, and the calls it makes'''
+    frames = semdata.frames
+    callers = []
+    value = None
+    while True:
+        try:
+            definition, frame = steps.send(value)
+        except StopIteration as stop:
+            if not callers:
+                return
+            #back to the caller, with the return value
+            value = stop.value
+            steps, frames[1] = callers.pop()
+            continue
+        callers.append((steps, frames[1]))
+        frames[1] = frame
+        steps = body_steps(definition, semdata)
+        value = None
+
+def program_steps(tree, semdata):
+    try:
+        yield from definitions_steps(tree.children_[0].children_, semdata.frames[0], semdata)
+        yield from block_steps(tree.children_[1].children_, semdata)
+    except ReturnValue:
+        #return in the main program ends it
+        pass
+
+def body_steps(definition, semdata):
+    '''Steps of a call of a subroutine or function, returns its value'''
+    try:
+        yield from definitions_steps(definition.children_[-2].children_, semdata.frames[1], semdata)
+        yield from block_steps(definition.children_[-1].children_, semdata)
+    except ReturnValue as ret:
+        return ret.value
+    #a function that ends without return gives 0.0
+    return semdata.numeric.zero
+
+def call_steps(node, semdata):
+    '''Evaluate the arguments of a call into a new frame, and make the call
+       (unless its result is cached)'''
+    definition = node.children_[0].symdata.defnode
+    if is_builtin(definition):
+        argument = node.children_[1].children_[0]
+        values = ((yield from eval_steps(argument, semdata)) if id(argument) in semdata.calling
+                  else eval_node(argument, semdata))
+        return AGGREGATES[definition.value](values)
+    frame = [None] * definition.symdata.frame_size
+    nargs = 0
+    if len(node.children_) > 1:
+        calling = semdata.calling
+        for i, argument in enumerate(node.children_[1].children_):
+            frame[i] = ((yield from eval_steps(argument, semdata)) if id(argument) in calling
+                        else eval_node(argument, semdata))
+            nargs += 1
+    cache = definition.symdata.cache
+    if cache is None:
+        return (yield definition, frame)
+    key = cache.key(frame[:nargs])
+    value = cache.lookup(key)
+    if value is memo.MISSING:
+        value = yield definition, frame
+        cache.store(key, value)
+    return value
+
+def definitions_steps(definition_list, frame, semdata):
+    '''Initialize the scalar and sheet variables of definition_list in frame'''
+    calling = semdata.calling
     for definition in definition_list:
         if definition.nodetype == "definition_scalar":
-            value = eval_node(definition.children_[0], semdata)
-            semdata.symtbl[definition.value].value = round(value, 1)
-        if definition.nodetype == "definition_sheet":
-            arr = eval_node(definition.children_[1], semdata)
-            semdata.symtbl[definition.value].value = arr
-
+            init = definition.children_[0]
+        elif definition.nodetype == "definition_sheet":
+            init = definition.children_[1] if len(definition.children_) > 1 else None
+        elif definition.nodetype == "definition_range":
+            init = definition.children_[0]
+        else:
+            continue
+        value = ((yield from eval_steps(init, semdata)) if id(init) in calling
+                 else eval_node(init, semdata))
+        if definition.nodetype == "definition_scalar":
+            value = round(value, 1)
+        frame[definition.symdata.slot] = value
 
-    statement_list =  tree.children_[1].children_
+def block_steps(statement_list, semdata):
+    calling = semdata.calling
     for statement in statement_list:
-        execute(statement, semdata)
-    pass
+        if id(statement) in calling:
+            yield from statement_steps(statement, semdata)
+        else:
+            execute(statement, semdata)
+
+def statement_steps(statement, semdata):
+    '''Like execute, for a statement with calls'''
+    kind = statement.kind
+    children = statement.children_
+    if kind == K_SUBROUTINE_CALL:
+        yield from call_steps(statement, semdata)
+        return
+    if kind == K_WHILE:
+        while (yield from eval_steps(children[0], semdata)) != 0.0:
+            yield from block_steps(children[1].children_, semdata)
+        return
+    if kind == K_FOR:
+        ranges = []
+        for range_expr in children[0].children_:
+            ranges.append((yield from eval_steps(range_expr, semdata))
+                          if id(range_expr) in semdata.calling else eval_node(range_expr, semdata))
+        loop = statement.symdata
+        frame = semdata.frames[loop.depth]
+        for i in range(start_for(frame, [cells.slot for cells in loop.ranges], ranges)):
+            frame[loop.slot] = i
+            yield from block_steps(children[1].children_, semdata)
+        return
+
+    #the value of the expression child, then the statement as execute does it
+    expr = children[0] if kind in (K_IF, K_IF_ELSE, K_RETURN) else children[1]
+    if id(expr) in semdata.calling:
+        value = yield from eval_steps(expr, semdata)
+    else:
+        value = eval_node(expr, semdata)
+
+    if kind == K_PRINT_SCALAR:
+        print_scalar(children[0].value, value)
+    elif kind == K_PRINT_RANGE:
+        print_range(children[0].value, value)
+    elif kind == K_SCALAR_ASSIGNMENT:
+        symdata = children[0].symdata
+        semdata.frames[symdata.depth][symdata.slot] = round(value, 1)
+    elif kind == K_RANGE_ASSIGN:
+        symdata = children[0].symdata
+        semdata.frames[symdata.depth][symdata.slot] = value
+    elif kind == K_CELL_REF_ASSIGNMENT:
+        assign_cell(children[0], value, semdata)
+    elif kind == K_RETURN:
+        raise ReturnValue(value)
+    elif value != 0.0:
+        yield from block_steps(children[1].children_, semdata)
+    elif kind == K_IF_ELSE:
+        yield from block_steps(children[2].children_, semdata)
+
+def eval_steps(node, semdata):
+    '''Like eval_node, for an expression with calls'''
+    kind = node.kind
+    if kind == K_FUNCTION_CALL:
+        result = yield from call_steps(node, semdata)
+    elif kind == K_RANGE_EXPR:
+        #[ Function[...] ], the only range with calls
+        result = shift(node, (yield from call_steps(node.children_[0], semdata)), 1)
+    elif kind == K_SHEET_INIT_LIST:
+        rows = []
+        for row in node.children_:
+            rows.append([])
+            for child in row.children_:
+                rows[-1].append((yield from eval_steps(child, semdata))
+                                if id(child) in semdata.calling else eval_node(child, semdata))
+        result = new_sheet(rows, node.symdata.storage, node.symdata.files)
+    else:
+        #term, simple_expr or scalar_expr
+        nodes = node.children_
+        values = []
+        for child in nodes[0::2]:
+            values.append((yield from eval_steps(child, semdata))
+                          if id(child) in semdata.calling else eval_node(child, semdata))
+        operators = [op.value for op in nodes[1::2]]
+        if kind == K_SCALAR_EXPR:
+            result = compare_chain(values, operators, semdata.numeric.one, semdata.numeric.zero)
+        else:
+            result = values[0]
+            for operator, value in zip(operators, values[1:]):
+                result = ARITHMETIC[operator](result, value)
+    if node.negative:
+        return -result
+    return result
 
 def eval_node(node, semdata):
     if not isinstance(node, Node):
         return None
 
-    if node.nodetype == "decimal":
-        if node.value[0] == "+":
-            return node.value[1]
-        else:
-            return -node.value[1]
+    result = eval_unsigned(node, semdata)
+    if node.negative:
+        return -result
+    return result
+
+def eval_unsigned(node, semdata):
+    kind = node.kind
+    if kind == K_DECIMAL:
+        return node.value
         
-    if node.nodetype == "term":
+    if kind == K_TERM:
         nodes = node.children_
         values = nodes[0::2]
         values = [eval_node(node, semdata) for node in values]
@@ -873,7 +1294,7 @@ def eval_node(node, semdata):
             else:
                 result /= values[i+1]
         return result
-    if node.nodetype == "simple_expr":
+    if kind == K_SIMPLE_EXPR:
         nodes = node.children_
         values = nodes[0::2]
         values = [eval_node(node, semdata) for node in values]
@@ -886,76 +1307,111 @@ def eval_node(node, semdata):
                 result -= values[i+1]
         return result
 
-    if node.nodetype == "scalar":
-        if type(node.value) == tuple:
-            return semdata.symtbl[node.value[1]].value
-        else:
-            return semdata.symtbl[node.value].value
+    if kind == K_SCALAR or kind == K_SHEET or kind == K_RANGE:
+        symdata = node.symdata
+        return semdata.frames[symdata.depth][symdata.slot]
+
+    if kind == K_RANGE_EXPR:
+        return eval_range(node, semdata)
+
+    if kind == K_FUNCTION_CALL:
+        #calls of user functions are made by call_steps, this is a built-in
+        argument = node.children_[1].children_[0]
+        return AGGREGATES[node.value](eval_node(argument, semdata))
     
-    if node.nodetype == "scalar_expr":
+    if kind == K_SCALAR_EXPR:
         nodes = node.children_
         values = nodes[0::2]
         values = [eval_node(node, semdata) for node in values]
-        compare_operators = nodes[1::2]
-        for i in range(len(compare_operators)):
-            if compare_operators[i].value == "=":
-                if values[i] != values[i+1]:
-                    return 0.0
-            if compare_operators[i].value == "!=":
-                if values[i] == values[i+1]:
-                    return 0.0
-            if compare_operators[i].value == "<":
-                if values[i] >= values[i+1]:
-                    return 0.0
-            if compare_operators[i].value == ">":
-                if values[i] <= values[i+1]:
-                    return 0.0
-            if compare_operators[i].value == "<=":
-                if values[i] > values[i+1]:
-                    return 0.0
-            if compare_operators[i].value == ">=":
-                if values[i] < values[i+1]:
-                    return 0.0
-        return 1.0
+        compare_operators = [op.value for op in nodes[1::2]]
+        return compare_chain(values, compare_operators, semdata.numeric.one, semdata.numeric.zero)
     
-    if node.nodetype == "sheet_init_list":
+    if kind == K_SHEET_INIT_LIST:
         arr = []
         sheet_rows = node.children_
         for row in sheet_rows:
             new_row = [eval_node(child, semdata) for child in row.children_]
             arr.append(new_row)
-        arr = numpy.array(arr)
-        return arr
-
-    if node.nodetype == "sheet_init_size":
-        return numpy.zeros(node.value[1], node.value[0])
-
-    if node.nodetype == "cell_ref":
-        sheet = node.children_[0].value 
+        return new_sheet(arr, node.symdata.storage, node.symdata.files)
+
+    if kind == K_SHEET_INIT_SIZE:
+        return zero_sheet(node.value[0], node.value[1], node.symdata.storage, node.symdata.files)
+
+    if kind == K_CELL_REF:
+        first = node.children_[0]
+        if first.kind == K_DOLLAR:
+            #the current cell of a for loop
+            cells = first.symdata
+            frame = semdata.frames[cells.depth]
+            if semdata.storage is not None:
+                return load_cell(frame[cells.slot], frame[cells.index])
+            return frame[cells.slot][frame[cells.index]]
+        sheet = first.symdata
         coord = node.children_[1].value
-        return semdata.symtbl[sheet].value[coord[1], coord[0]]
+        if semdata.storage is not None:
+            return load_cell(semdata.frames[sheet.depth][sheet.slot], (coord[1], coord[0]))
+        return semdata.frames[sheet.depth][sheet.slot][coord[1], coord[0]]
     return 0.0
 
+def eval_range(node, semdata):
+    '''The value of a range_expr: a view of the cells of a sheet'''
+    first = node.children_[0]
+    if first.kind == K_RANGE:
+        return shift(node, eval_unsigned(first, semdata), 1)
+    start, end = node.children_[:2]
+    sheet = start.children_[0]
+    if sheet.kind != K_SHEET:
+        #range $..$, not evaluated by the interpreter
+        return 0.0
+    symdata = sheet.symdata
+    index = range_slices(start.children_[1].value[:2], end.children_[1].value[:2])
+    return shift(node, semdata.frames[symdata.depth][symdata.slot][index], 2)
+
+def shift(node, values, start):
+    '''The range values moved by the [columns, rows] of range_expr node,
+       its children from start on'''
+    children = node.children_
+    for i in range(start, len(children), 2):
+        values = shift_range(values, children[i].value, children[i+1].value)
+    return values
+
+def assign_cell(cell_ref, value, semdata):
+    first = cell_ref.children_[0]
+    if first.kind == K_DOLLAR:
+        #writes the cell of the sheet the range refers to
+        cells = first.symdata
+        frame = semdata.frames[cells.depth]
+        if semdata.storage is not None:
+            store_cell(frame[cells.slot], frame[cells.index], value)
+        else:
+            frame[cells.slot][frame[cells.index]] = value
+        return
+    sheet = first.symdata
+    coord = cell_ref.children_[1].value
+    if semdata.storage is not None:
+        store_cell(semdata.frames[sheet.depth][sheet.slot], (coord[1], coord[0]), value)
+    else:
+        semdata.frames[sheet.depth][sheet.slot][coord[1], coord[0]] = value
+
 def execute(statement, semdata):
     if not isinstance(statement, Node):
         return None
+    kind = statement.kind
         
-    if statement.nodetype == "print_scalar":
-        if statement.children_[0].value is not None:
-            print(statement.children_[0].value, round( eval_node(statement.children_[1], semdata), 1) ,sep='')
-        else:
-            print(round(eval_node(statement.children_[1], semdata), 1))
-    if statement.nodetype == "scalar_assignment":
-        semdata.symtbl[statement.children_[0].value].value = round( eval_node(statement.children_[1], semdata), 1)
+    if kind == K_PRINT_SCALAR:
+        print_scalar(statement.children_[0].value, eval_node(statement.children_[1], semdata))
+    if kind == K_SCALAR_ASSIGNMENT:
+        symdata = statement.children_[0].symdata
+        semdata.frames[symdata.depth][symdata.slot] = round( eval_node(statement.children_[1], semdata), 1)
 
-    if statement.nodetype == "if":
+    if kind == K_IF:
         condition = eval_node(statement.children_[0], semdata)
         if condition != 0.0:
             statement_list = statement.children_[1].children_
             for stm in statement_list :
                 execute(stm, semdata)
 
-    if statement.nodetype == "if_else":
+    if kind == K_IF_ELSE:
         condition = eval_node(statement.children_[0], semdata)
         if condition != 0.0:
             statement_list = statement.children_[1].children_
@@ -966,7 +1422,7 @@ def execute(statement, semdata):
             for stm in statement_list :
                 execute(stm, semdata)
     
-    if statement.nodetype == "while":
+    if kind == K_WHILE:
         condition = eval_node(statement.children_[0], semdata)
         while condition != 0.0:
             statement_list = statement.children_[1].children_
@@ -974,77 +1430,112 @@ def execute(statement, semdata):
                 execute(stm, semdata)
             condition = eval_node(statement.children_[0], semdata)
     
-    if statement.nodetype == "print_sheet":
-        sheet = statement.children_[1].value
-        arr = semdata.symtbl[sheet].value
-        print(statement.children_[0].value, end="")
-        for row in arr:
-            for element in row:
-                print(element, end=" ")
-            print("/ ", end="")
-        print("")
-
-    if statement.nodetype == "cell_ref_assignment":
-        value = eval_node(statement.children_[1], semdata)
-        cell_ref = statement.children_[0]
-        sheet = cell_ref.children_[0].value
-        coord = cell_ref.children_[1].value
-        semdata.symtbl[sheet].value[coord[1]][coord[0]] = value
-
-    if statement.nodetype == "subroutine_call":
-        static_link = semdata.symtbl[statement.value].defnode
-        if (len(statement.children_) == 1):
-            arguments = None
-        else:
-            arguments = statement.children_[1].children_
-        semdata.tempSymtbl.clear()
-        if static_link.children_[1] is not None: #have arguments
-            arguments_val = ( eval_node(node, semdata) for node in arguments )
-            for arg in static_link.children_[1].children_:
-                semdata.symtbl[arg.value] = SymbolData('auto', None) #autotype
-                semdata.symtbl[arg.value].value = next(arguments_val)
-                semdata.tempSymtbl[arg.value] = True
-                execute_subroutine(static_link, semdata)
-        
-            #clean up
-            for key in semdata.tempSymtbl :
-                semdata.symtbl.pop(key)
-            semdata.tempSymtbl.clear()
-        else:
-            execute_subroutine(static_link, semdata)
+    if kind == K_PRINT_SHEET:
+        sheet = statement.children_[1].symdata
+        print_sheet(statement.children_[0].value, semdata.frames[sheet.depth][sheet.slot])
+
+    if kind == K_CELL_REF_ASSIGNMENT:
+        assign_cell(statement.children_[0], eval_node(statement.children_[1], semdata), semdata)
+
+    if kind == K_PRINT_RANGE:
+        print_range(statement.children_[0].value, eval_node(statement.children_[1], semdata))
+
+    if kind == K_RANGE_ASSIGN:
+        symdata = statement.children_[0].symdata
+        semdata.frames[symdata.depth][symdata.slot] = eval_node(statement.children_[1], semdata)
+
+    if kind == K_FOR:
+        loop = statement.symdata
+        frame = semdata.frames[loop.depth]
+        ranges = [eval_node(range_expr, semdata) for range_expr in statement.children_[0].children_]
+        statement_list = statement.children_[1].children_
+        for i in range(start_for(frame, [cells.slot for cells in loop.ranges], ranges)):
+            frame[loop.slot] = i
+            for stm in statement_list:
+                execute(stm, semdata)
 
-            #clean up
-            for key in semdata.tempSymtbl :
-                semdata.symtbl.pop(key)
-            semdata.tempSymtbl.clear()
+    if kind == K_RETURN:
+        raise ReturnValue(eval_node(statement.children_[0], semdata))
 
-def execute_subroutine(node, semdata):
-    definition_list = node.children_[2].children_
+def recursion_error(engine):
+    '''Report that a program recursed too deep for the closure or python
+       engine, and exit'''
+    #their calls are Python calls, so they are as deep as the Python stack allows
+    print(f"error: recursion too deep for the {engine} engine, which runs the calls of the program "
+          "as Python calls (the vm engine has a call stack of its own, --engine vm)", file=sys.stderr)
+    sys.exit(1)
 
-    for definition in definition_list:
-        if definition.nodetype == "definition_scalar":
-            value = eval_node(definition.children_[0], semdata)
-            semdata.symtbl[definition.value] = SymbolData('scalar', None)
-            semdata.symtbl[definition.value].value = round(value, 1)
-            semdata.tempSymtbl[definition.value] = True
-
-        if definition.nodetype == "definition_sheet":
-            semdata.symtbl[definition.value] = SymbolData('sheet', None)
-            arr = eval_node(definition.children_[1], semdata)
-            semdata.symtbl[definition.value].value = arr
-            semdata.tempSymtbl[definition.value] = True
-
-    statement_list =  node.children_[3].children_
-    for statement in statement_list:
-        execute(statement, semdata)
-    
 
 if __name__ == '__main__':
-    import argparse, codecs
+    import argparse, codecs, os
     arg_parser = argparse.ArgumentParser()
     group = arg_parser.add_mutually_exclusive_group()
     group.add_argument('--who', action='store_true', help='who wrote this' )
     group.add_argument('-f', '--file', help='filename to process')
+    arg_parser.add_argument('--engine', choices=['tree', 'closure', 'vm', 'python'], default='tree',
+                            help='interpreter: walk the syntax tree (default), '
+                                 'compile it into Python closures first, '
+                                 'compile it into bytecode for a register VM, or '
+                                 'translate it into Python (cached on disk, a '
+                                 'cached program is run without parsing it again)')
+    arg_parser.add_argument('--cache-dir',
+                            help='directory of the syntax tree and compiled program '
+                                 'cache (default: __sheetcache__ next to the file)')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='always parse (and compile) the program, without '
+                                 'reading or writing the cache')
+    arg_parser.add_argument('--lexer', choices=['ply', 'combined'], default='ply',
+                            help='tokenizer: the PLY lexer (default) or one '
+                                 'combined regexp (same tokens, faster)')
+    arg_parser.add_argument('--stream', action='store_true',
+                            help='read the file in pieces while parsing instead of '
+                                 'all at once (uses the combined lexer, no cache)')
+    arg_parser.add_argument('--token-buffer', action='store_true',
+                            help='lex the whole program into a compact token buffer '
+                                 'first, and parse from that')
+    arg_parser.add_argument('--check', action='store_true',
+                            help='only run the semantic checks, and report all '
+                                 'errors instead of stopping at the first one')
+    arg_parser.add_argument('--disassemble', action='store_true',
+                            help='print the bytecode of the program instead of running it')
+    arg_parser.add_argument('--no-optimize', action='store_true',
+                            help='run the syntax tree as parsed, without folding '
+                                 'constant expressions and dead branches')
+    arg_parser.add_argument('--dump-optimized', action='store_true',
+                            help='print the syntax tree again after the optimization pass')
+    arg_parser.add_argument('--no-memo', nargs='*', metavar='FUNCTION',
+                            help='do not cache the results of the given pure '
+                                 'functions, or of any function if none is given')
+    arg_parser.add_argument('--memo-size', type=int, default=memo.DEFAULT_SIZE,
+                            help='number of results cached per pure function '
+                                 '(default %(default)s)')
+    arg_parser.add_argument('--memo-stats', action='store_true',
+                            help='print the hits, misses and evictions of the '
+                                 'function caches to stderr after the run')
+    arg_parser.add_argument('--storage', action='append', metavar='[SHEET=]{float,fixed,decimal}',
+                            help='keep the cells of all sheets, or of the sheets named '
+                                 'SHEET, in float64 or in int64 tenths (fixed), rounded '
+                                 'to one decimal, or as Decimals (decimal), instead of '
+                                 'the values as they are')
+    arg_parser.add_argument('--numeric', choices=sorted(numeric.MODES),
+                            help='compute with floats, or with Decimals (in one decimal '
+                                 'context), keeping sheets in float, decimal or fixed '
+                                 'storage by default. Without it literals are Decimals, '
+                                 'but comparisons and zero sheets give floats.')
+    arg_parser.add_argument('--mmap', action='append', metavar='SHEET=FILE',
+                            help='keep the cells of the sheets named SHEET in the .npy '
+                                 'file FILE, memory mapped, instead of in memory. The '
+                                 'file is created with the initial values of the sheet, '
+                                 'and opened as it is in later runs. Needs float or fixed '
+                                 'storage.')
+    arg_parser.add_argument('--load', action='append', metavar='SHEET=FILE',
+                            help='fill the sheets named SHEET, when they are made, with the '
+                                 'numbers of FILE, a .csv file (read in chunks of rows) or '
+                                 'a .npy file, from their first cell on')
+    arg_parser.add_argument('--dump', action='append', metavar='SHEET=FILE',
+                            help='write the cells of the sheets named SHEET into the .npy '
+                                 'file FILE (made anew, so it has the cells at the end of '
+                                 'the run), as float64 values. Needs float or fixed storage.')
 
     ns = arg_parser.parse_args()
     if ns.who == True:
@@ -1052,15 +1543,140 @@ if __name__ == '__main__':
     elif ns.file is None:
         arg_parser.print_help()
     else:
-        with codecs.open( ns.file, 'r', encoding='utf-8' ) as INFILE:
-            data = INFILE.read() 
-        
-        lexer.input( data )
-        tree = parser.parse(data, lexer=lexer, debug=False)
-        tree_print.treeprint(tree)
-
-        semdata = SemData()
-        semdata.tempSymtbl = {}
+        if ns.stream:
+            #the cache keys are hashes of the whole text
+            data = None
+            use_cache = False
+        else:
+            with codecs.open( ns.file, 'r', encoding='utf-8' ) as INFILE:
+                data = INFILE.read() 
+            use_cache = not ns.no_cache
+
+        mode = numeric.MODES[ns.numeric] if ns.numeric else numeric.DEFAULT
+        try:
+            storage = parse_storage(ns.storage, mode.storages[0] if mode.storages else None)
+        except ValueError as e:
+            arg_parser.error(str(e))
+        if storage is not None and mode.storages:
+            for used in [storage.mode] + list(storage.sheets.values()):
+                if used not in mode.storages:
+                    arg_parser.error(f"--numeric {mode.name} can't have {used} storage")
+        sheet_files = {}
+        for option, specs, suffixes in (('mmap', ns.mmap, ('.npy',)), ('dump', ns.dump, ('.npy',)),
+                                        ('load', ns.load, ('.csv', '.npy'))):
+            for spec in specs or ():
+                name, _, file = spec.partition("=")
+                if not name or not file:
+                    arg_parser.error(f"--{option} {spec}: not SHEET=FILE")
+                if not file.endswith(suffixes):
+                    arg_parser.error(f"--{option} {spec}: not a {' or '.join(suffixes)} file")
+                #a mapped file has cells of one type, the values of the default storage can be anything
+                if option != 'load' and (storage is None or storage.of(name) == 'decimal'):
+                    arg_parser.error(f"--{option} {spec}: needs float or fixed storage (--storage or --numeric)")
+                files = sheet_files.get(name, SheetFiles())
+                if option == 'dump' and files.mmap is not None:
+                    arg_parser.error(f"--dump {spec}: {name} is mapped, its file has its cells")
+                sheet_files[name] = files._replace(**{option: os.path.abspath(file)})
+        mode.activate()
+        cache_dir = ns.cache_dir or pycodegen.default_cache_dir(ns.file)
+        if ns.no_memo == []:
+            caches = None
+        else:
+            caches = memo.Caches(ns.memo_size, ns.no_memo or ())
+        if use_cache and ns.engine == 'python' and not (ns.disassemble or ns.check):
+            #the generated code depends on the numeric mode, the storage and the optimizer
+            options = (f"{mode.name} {storage.spec() if storage is not None else ''} "
+                       f"{sorted(sheet_files.items())} {'no-optimize' if ns.no_optimize else ''}")
+            cache_key = pycodegen.cache_key(data, options)
+            #--dump-optimized needs the tree, so it always compiles (and caches) again
+            code = pycodegen.load_cached(cache_dir, cache_key) if not ns.dump_optimized else None
+            #the tree dump comes from the parse cache, without the tree the program
+            #goes through the whole pipeline again
+            flat = None
+            if code is not None:
+                flat = parse_cache.load_flat(cache_dir, parse_cache.cache_key(data, GRAMMAR_SIGNATURE))
+            if flat is not None:
+                flat_ast.treeprint(flat)
+                #the program passed the semantic checks when it was cached
+                print("Semantics ok")
+                try:
+                    pycodegen.run_code(code, caches)
+                except SheetFileError as e:
+                    arg_parser.error(str(e))
+                except RecursionError:
+                    recursion_error('python')
+                if ns.memo_stats and caches is not None:
+                    caches.report(sys.stderr)
+                sys.exit()
+
+        tree = flat = None
+        if use_cache:
+            tree_key = parse_cache.cache_key(data, GRAMMAR_SIGNATURE)
+            flat = parse_cache.load_flat(cache_dir, tree_key)
+        if flat is not None:
+            tree = flat.to_node()
+        else:
+            if ns.stream:
+                lexer = combined_lexer.CombinedLexer(reserved)
+                lexer.input_chunks(combined_lexer.read_chunks(ns.file))
+            else:
+                if ns.lexer == 'combined':
+                    lexer = combined_lexer.CombinedLexer(reserved)
+                lexer.input( data )
+            if ns.token_buffer:
+                buffer = token_buffer.TokenBuffer(tokens).extend(lexer)
+                lexer = token_buffer.BufferLexer(buffer)
+            tree = parser.parse(data, lexer=lexer, debug=False)
+            if use_cache and tree is not None:
+                parse_cache.store_tree(cache_dir, tree_key, tree)
+
+        semdata = new_semdata()
+        semdata.caches = caches
+        semdata.storage = storage
+        semdata.sheet_files = sheet_files
+        semdata.numeric = mode
+        if ns.check:
+            errors = collect_semantic_errors(tree, semdata)
+            for lineno, err in errors:
+                print(err if lineno is None else f"Line {lineno}: {err}")
+            if errors:
+                sys.exit(1)
+            print("Semantics ok")
+            sys.exit()
+
+        if flat is not None:
+            #a cached tree prints from its arrays, without walking the nodes
+            flat_ast.treeprint(flat)
+        else:
+            tree_print.treeprint(tree)
         semantic_checks(tree, semdata)
         print("Semantics ok")
-        run_program(tree, semdata)
+        numeric.convert(tree, mode)
+        if not ns.no_optimize:
+            tree = optimizer.optimize(tree, mode)
+        if ns.dump_optimized:
+            tree_print.treeprint(tree)
+        engine = ns.engine
+        try:
+            if ns.disassemble:
+                bytecode_vm.disassemble(bytecode_vm.compile_program(tree, semdata))
+            elif engine == 'closure':
+                closure_engine.run_program(tree, semdata)
+            elif engine == 'vm':
+                bytecode_vm.run_program(tree, semdata)
+            elif engine == 'python':
+                code = pycodegen.compile_source(pycodegen.generate_source(tree, semdata), ns.file)
+                if use_cache:
+                    pycodegen.store_cached(cache_dir, cache_key, code)
+                pycodegen.run_code(code, caches)
+            else:
+                run_program(tree, semdata)
+        except SheetFileError as e:
+            #the sheets are made when the program runs, so are the files of --mmap, --dump and --load
+            arg_parser.error(str(e))
+        except RecursionError:
+            if engine not in ('closure', 'python') or ns.disassemble:
+                raise
+            recursion_error(engine)
+        if ns.memo_stats and caches is not None:
+            caches.report(sys.stderr)
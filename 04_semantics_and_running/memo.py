@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+#
+# Memoization of pure functions.
+#
+# A function is pure when its result depends only on its arguments and
+# calling it changes nothing: its body (locals and statements)
+#  - prints nothing
+#  - assigns no global scalar or range, and writes no cells but those of its
+#    own local sheets (not of sheets it is given as arguments)
+#  - reads only globals that nothing in the program ever changes after they
+#    are defined (eg. a table of rates)
+#  - calls only subroutines and functions that are pure by the same rules
+# Recursive functions are pure unless something else makes them impure.
+#
+# Pure functions returning a scalar get a bounded LRU cache of results, keyed
+# by the argument values: scalars by type and repr (Decimal 1.0 and 1.00, and
+# 0.0 and -0.0, give different results), sheets and ranges by a digest of
+# their contents. Every engine looks up a call in the cache of the function
+# before making it. The caches of a run are kept in a Caches object, which
+# also has the opt-outs and the hit, miss and eviction counters.
+
+from collections import OrderedDict
+from decimal import Decimal
+import hashlib
+
+import numpy
+
+import sparse
+
+# Default number of results kept per function
+DEFAULT_SIZE = 1024
+
+# Result of a lookup that misses
+MISSING = object()
+
+ROUTINE_TYPES = ("definition_function", "definition_subroutine")
+
+# Statements that always have effects
+EFFECT_TYPES = ("print_sheet", "print_range", "print_scalar", "sheet_assignment")
+
+def argument_key(value):
+    '''Hashable key of an argument value'''
+    if isinstance(value, numpy.ndarray):
+        digest = hashlib.blake2b(digest_size=16)
+        if value.dtype == object:
+            digest.update(repr([argument_key(cell) for cell in value.flat]).encode())
+        else:
+            digest.update(numpy.ascontiguousarray(value).tobytes())
+        return (value.shape, value.dtype.str, digest.digest())
+    if isinstance(value, sparse.SparseSheet):
+        return value.key()
+    if isinstance(value, sparse.SparseRange):
+        return argument_key(numpy.asarray(value))
+    # equal numbers can differ in type, exponent and sign of zero
+    if type(value) is float or type(value) is Decimal:
+        return (type(value), repr(value))
+    return value
+
+class FunctionCache:
+    '''LRU cache of the results of one function'''
+
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return "<cache of " + self.name + ">"
+
+    @staticmethod
+    def key(arguments):
+        return tuple(map(argument_key, arguments))
+
+    def lookup(self, key):
+        '''The cached result for key, or MISSING'''
+        results = self.results
+        value = results.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            results.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        results = self.results
+        results[key] = value
+        if len(results) > self.maxsize:
+            results.popitem(last=False)
+            self.evictions += 1
+
+class Caches:
+    '''The caches of the pure functions of a run
+
+       maxsize: results kept per function, 0 turns memoization off
+       exclude: names of functions that are not memoized'''
+
+    def __init__(self, maxsize=DEFAULT_SIZE, exclude=()):
+        self.maxsize = maxsize
+        self.exclude = frozenset(exclude)
+        self.caches = {}
+
+    def cache(self, name):
+        '''The cache of pure function name, None if it is not memoized'''
+        if self.maxsize <= 0 or name in self.exclude:
+            return None
+        cache = self.caches.get(name)
+        if cache is None:
+            cache = self.caches[name] = FunctionCache(name, self.maxsize)
+        return cache
+
+    def wrap(self, function, name):
+        '''function (a Python function of pure function name) with its cache'''
+        cache = self.cache(name)
+        if cache is None:
+            return function
+        key, lookup, store = cache.key, cache.lookup, cache.store
+        def memoized(*arguments):
+            k = key(arguments)
+            value = lookup(k)
+            if value is MISSING:
+                value = function(*arguments)
+                store(k, value)
+            return value
+        return memoized
+
+    def report(self, file=None):
+        '''Print the counters of every cache'''
+        for name, cache in sorted(self.caches.items()):
+            print(f"memo {name}: {cache.hits} hits, {cache.misses} misses, "
+                  f"{cache.evictions} evictions, {len(cache.results)} cached", file=file)
+
+def nodes(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in node.children_ if hasattr(child, "nodetype"))
+
+def written_globals(tree):
+    '''Names of the global variables the program may change after defining
+       them, and whether it may change any sheet (through a range or $)'''
+    names = set()
+    any_sheet = False
+    for node in nodes(tree):
+        nodetype = node.nodetype
+        if nodetype in ("scalar_assignment", "sheet_assignment", "range_assign"):
+            names.add(node.children_[0].value)
+        elif nodetype == "cell_ref_assignment":
+            target = node.children_[0].children_[0]
+            if target.nodetype == "sheet":
+                names.add(target.value)
+            else:
+                # $ of a for loop
+                any_sheet = True
+        elif nodetype == "subroutine_call" or nodetype == "function_call":
+            if len(node.children_) == 1:
+                continue
+            written = written_parameters(node.children_[0].symdata.defnode)
+            for i, argument in enumerate(node.children_[1].children_):
+                if i not in written:
+                    continue
+                if argument.nodetype == "sheet":
+                    names.add(argument.value)
+                elif argument.nodetype == "range_expr":
+                    any_sheet = True
+    return names, any_sheet
+
+def written_parameters(definition):
+    '''Indexes of the sheet and range parameters whose cells a subroutine or
+       function may write (or that it passes on to another call)'''
+    written = set()
+    for body in definition.children_[-2:]:
+        for node in nodes(body):
+            if node.nodetype == "cell_ref_assignment":
+                variables = node.children_[0].children_
+            elif node.nodetype == "arguments":
+                variables = nodes(node)
+            else:
+                continue
+            for variable in variables:
+                if (variable.nodetype == "sheet" or variable.nodetype == "range") \
+                        and variable.symdata.depth == 1:
+                    written.add(variable.symdata.slot)
+    return written
+
+def effects(definition, constant):
+    '''Whether the body of a subroutine or function has effects of its own,
+       and the definitions of the subroutines and functions it calls
+
+       constant: whether a global variable (its usage node) never changes'''
+    formals = definition.children_[1]
+    nargs = len(formals.children_) if formals is not None else 0
+    callees = []
+    for body in definition.children_[-2:]:
+        for node in nodes(body):
+            nodetype = node.nodetype
+            if nodetype in EFFECT_TYPES:
+                return True, callees
+            if nodetype == "scalar_assignment" or nodetype == "range_assign":
+                if node.children_[0].symdata.depth == 0:
+                    return True, callees
+            elif nodetype == "cell_ref_assignment":
+                sheet = node.children_[0].children_[0]
+                # only locals, not the parameters (the frame starts with them)
+                if sheet.nodetype != "sheet" or sheet.symdata.depth == 0 or sheet.symdata.slot < nargs:
+                    return True, callees
+            elif nodetype == "scalar" or nodetype == "sheet" or nodetype == "range":
+                symdata = getattr(node, "symdata", None)
+                if symdata is not None and symdata.depth == 0 and not constant(node):
+                    return True, callees
+            elif nodetype == "function_call" or nodetype == "subroutine_call":
+                callees.append(node.children_[0].symdata.defnode)
+    return False, callees
+
+def pure_functions(tree):
+    '''Definitions of the pure functions returning a scalar in a checked
+       syntax tree'''
+    routines = [definition for definition in tree.children_[0].children_
+                if definition.nodetype in ROUTINE_TYPES]
+    written, any_sheet = written_globals(tree)
+    def constant(node):
+        if any_sheet and node.nodetype != "scalar":
+            return False
+        return node.value not in written
+
+    impure = set()
+    calls = {}
+    for definition in routines:
+        effect, callees = effects(definition, constant)
+        if effect:
+            impure.add(id(definition))
+        calls[id(definition)] = callees
+    # whatever calls an impure routine is impure
+    changed = True
+    while changed:
+        changed = False
+        for definition in routines:
+            if id(definition) not in impure and any(id(callee) in impure for callee in calls[id(definition)]):
+                impure.add(id(definition))
+                changed = True
+    return [definition for definition in routines
+            if definition.nodetype == "definition_function"
+            and definition.children_[2].value == "scalar"
+            and id(definition) not in impure]
+
+def attach(tree, caches):
+    '''Set the cache attribute of the symbol data of every subroutine and
+       function: its FunctionCache if it is memoized, else None'''
+    for definition in tree.children_[0].children_:
+        if definition.nodetype in ROUTINE_TYPES:
+            definition.symdata.cache = None
+    if caches is not None:
+        for definition in pure_functions(tree):
+            definition.symdata.cache = caches.cache(definition.value)
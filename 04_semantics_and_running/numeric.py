@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#
+# Numeric modes: the type of the numbers a program computes with.
+#
+# By default the numbers are a mix: literals are Decimals, but comparisons
+# give the floats 1.0 and 0.0 and the cells of sheets SS = 10 * 3 are
+# floats, and Decimal and float can't be added. A numeric mode (--numeric)
+# makes every number of a program the same type:
+#  - 'float': floats, sheets have float storage (see runtime.py)
+#  - 'decimal': Decimals, sheets keep the Decimals written to them as they
+#    are (decimal storage)
+#  - 'fixed': Decimals, sheets keep their cells in int64 tenths (fixed
+#    storage)
+# Decimals are computed in DECIMAL_CONTEXT, which activate() makes the
+# current context.
+#
+# The lexer keeps the exact Decimal of every literal, so that the tokens,
+# the syntax tree and the parse cache are the same in all modes, and
+# convert() gives the literals of a checked tree their type in the mode
+# before it is optimized and run.
+
+import decimal
+from decimal import Decimal
+
+try:
+    import _decimal
+    # whether the decimal module is the C implementation (libmpdec)
+    ACCELERATED = decimal.Decimal is _decimal.Decimal
+except ImportError:
+    ACCELERATED = False
+
+# The context of the Decimal modes: the 28 digits and half even rounding of
+# the default context, and division by zero, invalid operations and
+# overflow raise, as float operations do
+DECIMAL_CONTEXT = decimal.Context(prec=28, rounding=decimal.ROUND_HALF_EVEN,
+                                  traps=[decimal.InvalidOperation, decimal.DivisionByZero,
+                                         decimal.Overflow])
+
+class Numeric:
+    '''A numeric mode
+
+       name: the --numeric argument, None for the default
+       number: the type of numbers (float or Decimal), None for the default
+       storages: the storages its sheets can have, the first one is the
+       default'''
+
+    def __init__(self, name, number, storages):
+        self.name = name
+        self.number = number
+        self.storages = storages
+        # values of comparisons and of functions that end without return
+        self.one = 1.0 if number is not Decimal else Decimal("1.0")
+        self.zero = 0.0 if number is not Decimal else Decimal("0.0")
+
+    def __repr__(self):
+        return "<numeric " + str(self.name) + ">"
+
+    def literal(self, value):
+        '''The number of a literal (a Decimal, or the 0.0 of a scalar without
+           initial value) in this mode'''
+        if self.number is float:
+            return float(value)
+        if self.number is Decimal and not isinstance(value, Decimal):
+            return Decimal(repr(value))
+        return value
+
+    def activate(self):
+        '''Make DECIMAL_CONTEXT the context of Decimal operations'''
+        if self.number is Decimal:
+            decimal.setcontext(DECIMAL_CONTEXT)
+
+DEFAULT = Numeric(None, None, ())
+
+MODES = {
+    'float': Numeric('float', float, ('float',)),
+    'decimal': Numeric('decimal', Decimal, ('decimal', 'fixed')),
+    'fixed': Numeric('fixed', Decimal, ('fixed', 'decimal')),
+}
+
+def convert(tree, numeric):
+    '''Give the literals of a tree their type in numeric mode (in place)'''
+    if numeric.number is None:
+        return tree
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.nodetype == "decimal":
+            node.value = numeric.literal(node.value)
+        stack.extend(child for child in node.children_ if hasattr(child, "nodetype"))
+    return tree
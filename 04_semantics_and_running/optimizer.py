@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+#
+# Optimization pass over the checked syntax tree, run before any engine.
+#
+#  - literal subtrees are folded: 2.0 * 3.0 + x becomes 6.00 + x, and a
+#    comparison of literals becomes 1.0 or 0.0
+#  - x * 1.0, x / 1.0, x + 0.0 and x - 0.0 become x where that can't change
+#    the result
+#  - if, if-else and while statements whose condition is a literal are
+#    replaced by the statements that run
+#
+# Expressions are evaluated left to right, so only a leading run of literals
+# is folded (x + 2.0 + 3.0 is (x + 2.0) + 3.0), and values are computed with
+# the operators of runtime.py, exactly as the engines compute them: nothing
+# is rounded, the interpreter rounds only when a scalar is assigned or
+# printed. A fold that raises (division by zero) is left for run time.
+# Comparisons of literals fold to the 1.0 or 0.0 of the numeric mode.
+#
+# Removing 1.0 and 0.0 changes the exponent of a Decimal result (1.5 * 1.0
+# is 1.50) and the sign of a zero (-0.0 + 0.0 is 0.0). Neither shows when
+# the value is only compared, so the removal depends on how the value of the
+# expression is used (its context):
+#  - COMPARED: conditions and operands of comparisons, everything goes
+#  - ROUNDED: assigned to a scalar or printed, the sign of zero shows, so
+#    only x - 0.0, x + -0.0 and -0.0 + x are removed
+#  - EXACT: stored as is in a sheet (cell assignments, sheet rows, and so
+#    arguments and return values too), where print_sheet shows 1.50, no
+#    removal at all
+
+from decimal import Decimal
+
+from ast_nodes import Node
+import numeric
+from runtime import ARITHMETIC, compare_chain
+
+COMPARED, ROUNDED, EXACT = range(3)
+
+# (node type, child index) of expressions whose value is rounded
+ROUNDED_CHILDREN = {("print_scalar", 1), ("scalar_assignment", 1), ("definition_scalar", 0)}
+
+CONDITIONALS = ("if", "if_else", "while")
+
+def optimize(tree, mode=numeric.DEFAULT):
+    '''Optimize the tree (with the literals of numeric mode) in place,
+       returns it'''
+    return optimize_node(tree, EXACT, mode)
+
+def literal(node):
+    '''Value of node if it is a literal, else None'''
+    if node is not None and node.nodetype == "decimal":
+        return -node.value if node.negative else node.value
+    return None
+
+def constant(value, lineno):
+    return Node("decimal", value, lineno)
+
+def optimize_node(node, context, mode):
+    '''The optimized node (node itself, changed in place, or a new one)'''
+    if node is None:
+        return None
+    nodetype = node.nodetype
+    if nodetype == "term" or nodetype == "simple_expr":
+        return optimize_arithmetic(node, context, mode)
+    if nodetype == "scalar_expr":
+        return optimize_comparison(node, mode)
+    if nodetype == "statement_list":
+        node.children_ = optimize_statements(node.children_, mode)
+        return node
+    children = node.children_
+    for i, child in enumerate(children):
+        if nodetype in CONDITIONALS and i == 0:
+            children[i] = optimize_node(child, COMPARED, mode)
+        elif (nodetype, i) in ROUNDED_CHILDREN:
+            children[i] = optimize_node(child, ROUNDED, mode)
+        else:
+            children[i] = optimize_node(child, EXACT, mode)
+    return node
+
+def optimize_statements(statements, mode):
+    '''Optimized statements of a statement list, without the ones that never
+       run'''
+    result = []
+    for statement in statements:
+        statement = optimize_node(statement, EXACT, mode)
+        if statement.nodetype in CONDITIONALS:
+            condition = literal(statement.children_[0])
+            if condition is not None:
+                if statement.nodetype == "while":
+                    if condition == 0.0:
+                        continue
+                elif condition != 0.0:
+                    result.extend(statement.children_[1].children_)
+                    continue
+                else:
+                    if statement.nodetype == "if_else":
+                        result.extend(statement.children_[2].children_)
+                    continue
+        result.append(statement)
+    return result
+
+def optimize_comparison(node, mode):
+    children = node.children_
+    for i in range(0, len(children), 2):
+        children[i] = optimize_node(children[i], COMPARED, mode)
+    values = [literal(child) for child in children[0::2]]
+    if None in values:
+        return node
+    try:
+        value = compare_chain(values, [op.value for op in children[1::2]], mode.one, mode.zero)
+    except TypeError:
+        return node
+    return constant(-value if node.negative else value, node.lineno)
+
+def is_identity(op, value, context):
+    '''Whether x op value is x in context'''
+    if value is None or context == EXACT:
+        return False
+    if op == '*' or op == '/':
+        return value == 1
+    if value != 0:
+        return False
+    if context == COMPARED:
+        return True
+    # -0.0 - 0.0 is -0.0, -0.0 + -0.0 is -0.0, but -0.0 + 0.0 is 0.0
+    return (op == '-') != value.is_signed() if isinstance(value, Decimal) else False
+
+def optimize_arithmetic(node, context, mode):
+    children = node.children_
+    operands = [optimize_node(child, context, mode) for child in children[0::2]]
+    operators = [oper.value for oper in children[1::2]]
+    values = [literal(operand) for operand in operands]
+
+    # fold the literals at the start
+    folded = 0
+    result = values[0]
+    while folded < len(operators) and result is not None and values[folded + 1] is not None:
+        try:
+            result = ARITHMETIC[operators[folded]](result, values[folded + 1])
+        except (ArithmeticError, TypeError):
+            break
+        folded += 1
+    if folded == len(operators):
+        return constant(-result if node.negative else result, node.lineno)
+    if folded:
+        first = constant(result, operands[0].lineno)
+    else:
+        first = operands[0]
+
+    # x * 1.0, x + 0.0
+    opers = children[1::2]
+    rest = [(oper, operand) for oper, operand, value in
+            zip(opers[folded:], operands[folded + 1:], values[folded + 1:])
+            if not is_identity(oper.value, value, context)]
+    # 1.0 * x, 0.0 + x
+    if rest and rest[0][0].value in ('*', '+') and is_identity(rest[0][0].value, literal(first), context):
+        first = rest.pop(0)[1]
+    if not rest:
+        first.negative = first.negative != node.negative
+        return first
+
+    node.children_ = [first]
+    for oper, operand in rest:
+        node.children_ += [oper, operand]
+    return node
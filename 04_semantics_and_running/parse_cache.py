@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+#
+# On-disk cache of syntax trees, so that an unchanged program is not lexed
+# and parsed again.
+#
+# Trees are stored in the binary format of flat_ast.FlatTree, compressed with
+# zlib (the fast setting shrinks entries about 5x), one file per program. The
+# file is named after a hash of the source text and of the grammar (the
+# productions of the parser, the code of their actions, which build the
+# trees, and the token regexps of the lexer), so changing the grammar never
+# gives old trees. Entries share the cache directory with
+# the compiled programs of pycodegen, and evict() keeps the total size and
+# the age of all entries in the directory bounded.
+
+import hashlib
+import os
+import tempfile
+import time
+import types
+import zlib
+
+import flat_ast
+
+# Entries not used for this long are removed
+MAX_AGE = 30 * 24 * 60 * 60
+
+# The total size of the entries is kept below this, by removing the least
+# recently used entries first
+MAX_SIZE = 64 * 1024 * 1024
+
+# File name suffixes of cache entries (.code is used by pycodegen)
+SUFFIX = ".ast"
+ENTRY_SUFFIXES = (SUFFIX, ".code")
+
+# Suffix of the files entries are written to before they are moved in place.
+# Those of runs that were killed while writing are removed after TEMP_AGE.
+TEMP_SUFFIX = ".tmp"
+TEMP_AGE = 60 * 60
+
+def grammar_signature(parser, lexer):
+    '''A hash of the grammar, changes whenever a production, the action of a
+       production or a token changes'''
+    digest = hashlib.sha256()
+    actions = set()
+    for production in parser.productions:
+        digest.update(str(production).encode("utf-8") + b"\n")
+        # the action and the functions it is wrapped in (functools.wraps)
+        action = production.callable
+        while action is not None:
+            if action not in actions:
+                actions.add(action)
+                code_digest(digest, action.__code__)
+            action = getattr(action, "__wrapped__", None)
+    for state, regexps in sorted(lexer.lexstatere.items()):
+        for regexp, functions in regexps:
+            digest.update(regexp.pattern.encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+def code_digest(digest, code):
+    '''Add what a code object does to digest: its bytecode, constants and
+       names, but not its line numbers, so that moving a function does not
+       change the hash (and this is much faster than hashing its source)'''
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            code_digest(digest, const)
+        elif isinstance(const, frozenset):
+            # x in {...}, in an order that depends on the hash seed
+            digest.update(repr(sorted(const, key=repr)).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+def cache_key(data, grammar):
+    '''Cache key of a SheetScript source text'''
+    digest = hashlib.sha256()
+    digest.update(grammar.encode())
+    digest.update(str(flat_ast.FORMAT_VERSION).encode())
+    digest.update(data.encode("utf-8"))
+    return digest.hexdigest()
+
+def cache_path(cache_dir, key):
+    return os.path.join(cache_dir, key + SUFFIX)
+
+def load_tree(cache_dir, key):
+    '''Cached syntax tree (a Node) for key, or None'''
+    flat = load_flat(cache_dir, key)
+    return None if flat is None else flat.to_node()
+
+def load_flat(cache_dir, key):
+    '''Cached syntax tree (a flat_ast.FlatTree) for key, or None'''
+    path = cache_path(cache_dir, key)
+    try:
+        with open(path, "rb") as f:
+            flat = flat_ast.FlatTree.from_bytes(zlib.decompress(f.read()))
+        # the modification time tells when the entry was used last
+        os.utime(path)
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+    return flat
+
+def store_tree(cache_dir, key, tree):
+    '''Write the tree atomically, so that concurrent runs never see a
+       partially written file, and evict old entries. Failing to cache is not
+       an error.'''
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=cache_dir, suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(flat_ast.FlatTree.from_node(tree).to_bytes(), 1))
+            os.replace(temp, cache_path(cache_dir, key))
+        except BaseException:
+            remove_temp(temp)
+            raise
+    except OSError:
+        return
+    evict(cache_dir)
+
+def remove_temp(temp):
+    '''Remove the temporary file of a failed write'''
+    try:
+        os.unlink(temp)
+    except OSError:
+        pass
+
+def evict(cache_dir, max_size=MAX_SIZE, max_age=MAX_AGE, now=None):
+    '''Remove entries older than max_age seconds, then the least recently
+       used ones until the entries take at most max_size bytes. Returns the
+       number of removed entries.'''
+    if now is None:
+        now = time.time()
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(ENTRY_SUFFIXES):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.name.endswith(TEMP_SUFFIX):
+                    try:
+                        if now - entry.stat().st_mtime > TEMP_AGE:
+                            remove_temp(entry.path)
+                    except OSError:
+                        continue
+    except OSError:
+        return 0
+    # newest first, so that the entries to remove are at the end
+    entries.sort(reverse=True)
+    total = 0
+    removed = 0
+    for mtime, size, path in entries:
+        total += size
+        if total > max_size or now - mtime > max_age:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                # removed by a concurrent run
+                pass
+            total -= size
+    return removed
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+#
+# Building the PLY lexer and parser from precompiled tables.
+#
+# By default ply.lex validates all token rules and ply.yacc reflects the
+# grammar at every start, and both write their table modules into the
+# current (or the grammar's) directory with a plain open(), so parallel runs
+# can read a half written parsetab.py.
+#
+# Here the tables live next to this file (sheet_lextab.py, sheet_parsetab.py
+# and the sheet_parsetab_*.py of the incremental parsers) and are loaded in
+# optimize mode, which skips all validation. The tables are generated ahead
+# of time and kept in the repository with the interpreter, so a fresh
+# checkout only reads them and many processes can start at once.
+#
+# Because optimize mode trusts the tables blindly, they are only used if
+# they were generated from the current rules (a signature is stored in
+# both). Missing or stale tables (the grammar was changed) are generated
+# into a temporary directory and moved in place with os.replace, so other
+# processes see either the old or the new file, never a partial one. If
+# the directory is read-only, the tables are just built in memory.
+#
+# After changing the tokens or the p_ functions of main.py, generate the
+# tables again and commit them with the change:
+#
+#     python3 ply_tables.py
+
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+import ply.lex
+import ply.yacc
+
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+LEXTAB = "sheet_lextab"
+PARSETAB = "sheet_parsetab"
+
+def module_dict(module):
+    return {name: getattr(module, name) for name in dir(module)}
+
+def lexer_signature(module):
+    '''A hash of the token rules of module, like the grammar signature PLY
+       stores in parse tables'''
+    ldict = module_dict(module)
+    digest = hashlib.sha256()
+    for name in ("tokens", "literals", "states"):
+        digest.update(repr(ldict.get(name)).encode("utf-8"))
+    for name in sorted(name for name in ldict if name.startswith("t_")):
+        rule = ldict[name]
+        if callable(rule):
+            rule = getattr(rule, "regex", rule.__doc__)
+        digest.update((name + "=" + repr(rule) + "\n").encode("utf-8"))
+    return digest.hexdigest()
+
+def parser_signature(module, start=None):
+    pdict = module_dict(module)
+    if start is not None:
+        pdict['start'] = start
+    pinfo = ply.yacc.ParserReflect(pdict, log=ply.yacc.NullLogger())
+    pinfo.get_all()
+    return pinfo.signature()
+
+def load_table(name, signature, signature_attr):
+    '''The table module name from TABLE_DIR if it matches signature, else None'''
+    path = os.path.join(TABLE_DIR, name + ".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    table = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(table)
+    except (OSError, SyntaxError, ImportError):
+        return None
+    if getattr(table, signature_attr, None) != signature:
+        return None
+    return table
+
+def install_tables(generate):
+    '''Call generate(outputdir) in a temporary directory and move the files
+       it writes into TABLE_DIR'''
+    try:
+        tempdir = tempfile.mkdtemp(dir=TABLE_DIR, prefix=".tables-")
+    except OSError:
+        # read-only installation, build the tables in memory only
+        tempdir = tempfile.mkdtemp()
+        try:
+            return generate(tempdir)
+        finally:
+            shutil.rmtree(tempdir, ignore_errors=True)
+    try:
+        result = generate(tempdir)
+        for name in os.listdir(tempdir):
+            if name.endswith(".py"):
+                os.replace(os.path.join(tempdir, name), os.path.join(TABLE_DIR, name))
+        return result
+    finally:
+        shutil.rmtree(tempdir, ignore_errors=True)
+
+def make_lexer(module):
+    '''The lexer of the token rules in module'''
+    signature = lexer_signature(module)
+    table = load_table(LEXTAB, signature, "_sheet_signature")
+    if table is not None:
+        return ply.lex.lex(module=module, optimize=True, lextab=table)
+
+    def generate(outputdir):
+        lexer = ply.lex.lex(module=module)
+        lexer.writetab(LEXTAB, outputdir)
+        with open(os.path.join(outputdir, LEXTAB + ".py"), "a") as f:
+            f.write("_sheet_signature = %r\n" % signature)
+        return lexer
+    return install_tables(generate)
+
+def make_parser(module, start=None):
+    '''The parser of the grammar (p_* functions) in module. Every call gives
+       a new parser object.
+
+       start: the start symbol, if not the first rule of the grammar. Parts
+       of the grammar are then unreachable, so PLY's warnings are not shown.'''
+    tabmodule = PARSETAB if start is None else PARSETAB + "_" + start
+    table = load_table(tabmodule, parser_signature(module, start), "_lr_signature")
+    if table is not None:
+        return ply.yacc.yacc(module=module, optimize=True, tabmodule=table, start=start,
+                             write_tables=False, debug=False)
+
+    errorlog = None if start is None else ply.yacc.NullLogger()
+    def generate(outputdir):
+        return ply.yacc.yacc(module=module, tabmodule=tabmodule, outputdir=outputdir,
+                             start=start, debug=False, errorlog=errorlog)
+    return install_tables(generate)
+
+if __name__ == '__main__':
+    # importing main builds (and writes) any missing or stale tables
+    sys.path.insert(0, TABLE_DIR)
+    import main
+    # and the parsers of program parts for incremental parsing
+    import incremental
+    for start in (incremental.DEFINITIONS, incremental.STATEMENTS):
+        make_parser(main, start)
+    print("Tables up to date in", TABLE_DIR)
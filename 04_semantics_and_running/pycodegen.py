@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+#
+
+# Python code generation: an alternative to interpreting the syntax tree.
+#
+# A checked syntax tree is translated into plain Python source: the program
+# becomes one function whose locals are the scalar and sheet variables
+# (sheets are NumPy arrays), and every subroutine and function becomes a
+# nested def. Calls are Python calls, so the depth of recursion is limited by
+# Python's recursion limit. Pure functions are wrapped by memoized(function,
+# name), which run_code gives the program (see memo.py).
+# The source is compiled with compile() so that CPython's own bytecode runs
+# the program.
+#
+# The compiled code object is cached on disk (marshal format), keyed by a hash
+# of the SheetScript source, so running the same program again skips lexing,
+# parsing, semantic checks and code generation entirely.
+#
+# The generated code gives the same results as the tree walker: both use the
+# helpers in runtime.py.
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+
+import memo
+import parse_cache
+from runtime import range_slices
+
+# Bump this when the generated code changes, so that old cache entries are
+# not used any more
+CODEGEN_VERSION = 9
+
+PROGRAM_FUNCTION = "sheet_program"
+
+class SourceGenerator:
+    '''Generate Python source from a checked syntax tree
+
+       semdata: the SemData filled by the semantic checks, used to find the
+       definitions of called subroutines'''
+
+    def __init__(self, semdata):
+        self.symtbl = semdata.symtbl
+        # whether the sheets have typed storage (see runtime.py)
+        self.typed = semdata.storage is not None
+        self.numeric = semdata.numeric
+        self.lines = []
+        self.consts = []
+        self.const_index = {}
+
+    # Helpers
+
+    def line(self, indent, text):
+        self.lines.append("    " * indent + text)
+
+    def const(self, value):
+        '''Name of a module level constant holding value'''
+        # equal values can differ in type, exponent and sign of zero
+        key = (type(value), repr(value))
+        name = self.const_index.get(key)
+        if name is None:
+            name = "k" + str(len(self.consts))
+            self.consts.append((name, value))
+            self.const_index[key] = name
+        return name
+
+    # SheetScript identifiers get a prefix, so that they never clash with
+    # Python keywords, builtins or the helpers of the generated code
+
+    @staticmethod
+    def var(ident):
+        return "v_" + ident
+
+    @staticmethod
+    def sub(ident):
+        return "s_" + ident
+
+    # the hidden variables of a for loop: the cells of its ranges and the
+    # index of the current cell, named by their slots
+
+    @staticmethod
+    def cells(symdata):
+        return "c_" + str(symdata.slot)
+
+    @staticmethod
+    def index(symdata):
+        return "i_" + str(symdata.slot)
+
+    def number(self, value):
+        '''Python expression of a number'''
+        if isinstance(value, float):
+            return repr(value)
+        return self.const(value)
+
+    # Expressions
+
+    def expr(self, node):
+        '''Python expression evaluating node'''
+        if node is None:
+            return "None"
+        negative, value = node.negative, node.value
+        nodetype = node.nodetype
+
+        if nodetype == "decimal":
+            return self.number(-value if negative else value)
+
+        if nodetype == "scalar" or nodetype == "sheet" or nodetype == "range":
+            code = self.var(value)
+        elif nodetype == "range_expr":
+            code = self.range(node)
+        elif nodetype == "term" or nodetype == "simple_expr":
+            # one level of operators, left associative in Python too (and
+            # without nesting, long chains stay within the parser's limits)
+            nodes = node.children_
+            parts = [self.expr(nodes[0])]
+            for i in range(1, len(nodes), 2):
+                parts += [nodes[i].value, self.expr(nodes[i+1])]
+            code = "(" + " ".join(parts) + ")"
+        elif nodetype == "scalar_expr":
+            nodes = node.children_
+            operands = [self.expr(child) for child in nodes[0::2]]
+            operators = [op.value for op in nodes[1::2]]
+            one, zero = self.number(self.numeric.one), self.number(self.numeric.zero)
+            if len(operators) == 1:
+                op = "==" if operators[0] == "=" else operators[0]
+                code = "(" + one + " if " + operands[0] + " " + op + " " + operands[1] + " else " + zero + ")"
+            else:
+                # like the tree walker, all operands are evaluated first
+                code = ("compare_chain([" + ", ".join(operands) + "], " + repr(operators) + ", "
+                        + one + ", " + zero + ")")
+        elif nodetype == "sheet_init_list":
+            rows = ["[" + ", ".join(self.expr(cell) for cell in row.children_) + "]"
+                    for row in node.children_]
+            code = "new_sheet([" + ", ".join(rows) + "]" + self.storage(node) + ")"
+        elif nodetype == "sheet_init_size":
+            code = "zero_sheet(" + str(value[0]) + ", " + str(value[1]) + self.storage(node) + ")"
+        elif nodetype == "cell_ref" and node.children_[0].nodetype == "dollar":
+            code = self.current_cell(node.children_[0].symdata)
+        elif nodetype == "cell_ref":
+            sheet = node.children_[0].value
+            col, row = node.children_[1].value[:2]
+            if self.typed:
+                code = "load_cell(" + self.var(sheet) + ", (" + str(row) + ", " + str(col) + "))"
+            else:
+                code = self.var(sheet) + "[" + str(row) + ", " + str(col) + "]"
+        elif nodetype == "function_call":
+            code = self.call(node)
+        else:
+            # not (yet) evaluated by the interpreter, see eval_node
+            code = "0.0"
+
+        if negative:
+            return "(-" + code + ")"
+        return code
+
+    def range(self, node):
+        '''Python expression giving a view of the cells of a range_expr'''
+        children = node.children_
+        if children[0].nodetype != "cell_ref":
+            # a range variable or [ Function[...] ]
+            code, shifts = self.expr(children[0]), children[1:]
+        else:
+            start, end = children[:2]
+            if start.children_[0].nodetype != "sheet":
+                # range $..$, not evaluated by the interpreter
+                return "0.0"
+            rows, cols = range_slices(start.children_[1].value[:2], end.children_[1].value[:2])
+            code = (self.var(start.children_[0].value) + "[" + str(rows.start) + ":" + str(rows.stop)
+                    + ", " + str(cols.start) + ":" + str(cols.stop) + "]")
+            shifts = children[2:]
+        # range_expr[columns, rows]
+        for i in range(0, len(shifts), 2):
+            code = "shift_range(" + code + ", " + str(shifts[i].value) + ", " + str(shifts[i+1].value) + ")"
+        return code
+
+    def current_cell(self, cells):
+        '''Python expression of the current cell of a for loop range'''
+        if self.typed:
+            return "load_cell(" + self.cells(cells) + ", i_" + str(cells.index) + ")"
+        return self.cells(cells) + "[" + "i_" + str(cells.index) + "]"
+
+    @staticmethod
+    def storage(node):
+        '''The storage (and files) arguments of the sheet made by a
+           sheet_init node'''
+        storage, files = node.symdata.storage, node.symdata.files
+        if files is not None:
+            return ", " + repr(storage) + ", " + repr(files)
+        return "" if storage is None else ", " + repr(storage)
+
+    def condition(self, node):
+        '''Python expression that is true when node is not 0.0'''
+        if node.nodetype == "scalar_expr" and not node.negative and len(node.children_) == 3:
+            left, op, right = node.children_
+            op = "==" if op.value == "=" else op.value
+            return self.expr(left) + " " + op + " " + self.expr(right)
+        return self.expr(node) + " != 0.0"
+
+    # Statements
+
+    def block(self, indent, statement_list):
+        start = len(self.lines)
+        for statement in statement_list:
+            self.statement(indent, statement)
+        if len(self.lines) == start:
+            self.line(indent, "pass")
+
+    def statement(self, indent, node):
+        nodetype = node.nodetype
+
+        if nodetype == "print_scalar":
+            info = repr(node.children_[0].value)
+            self.line(indent, "print_scalar(" + info + ", " + self.expr(node.children_[1]) + ")")
+
+        elif nodetype == "scalar_assignment":
+            variable = self.var(node.children_[0].value)
+            self.line(indent, variable + " = round(" + self.expr(node.children_[1]) + ", 1)")
+
+        elif nodetype == "if":
+            self.line(indent, "if " + self.condition(node.children_[0]) + ":")
+            self.block(indent + 1, node.children_[1].children_)
+
+        elif nodetype == "if_else":
+            self.line(indent, "if " + self.condition(node.children_[0]) + ":")
+            self.block(indent + 1, node.children_[1].children_)
+            self.line(indent, "else:")
+            self.block(indent + 1, node.children_[2].children_)
+
+        elif nodetype == "while":
+            self.line(indent, "while " + self.condition(node.children_[0]) + ":")
+            self.block(indent + 1, node.children_[1].children_)
+
+        elif nodetype == "print_sheet":
+            info = repr(node.children_[0].value)
+            self.line(indent, "print_sheet(" + info + ", " + self.var(node.children_[1].value) + ")")
+
+        elif nodetype == "cell_ref_assignment":
+            cell_ref = node.children_[0]
+            value = self.expr(node.children_[1])
+            if cell_ref.children_[0].nodetype == "dollar":
+                cells = cell_ref.children_[0].symdata
+                values, index = self.cells(cells), "i_" + str(cells.index)
+            else:
+                col, row = cell_ref.children_[1].value[:2]
+                values, index = self.var(cell_ref.children_[0].value), str(row) + ", " + str(col)
+            if self.typed:
+                self.line(indent, "store_cell(" + values + ", (" + index + "), " + value + ")")
+            else:
+                self.line(indent, values + "[" + index + "] = " + value)
+
+        elif nodetype == "print_range":
+            info = repr(node.children_[0].value)
+            self.line(indent, "print_range(" + info + ", " + self.expr(node.children_[1]) + ")")
+
+        elif nodetype == "range_assign":
+            self.line(indent, self.var(node.children_[0].value) + " = " + self.expr(node.children_[1]))
+
+        elif nodetype == "for":
+            loop = node.symdata
+            ranges = node.children_[0].children_
+            cells = [self.cells(symdata) for symdata in loop.ranges]
+            # like start_for: one dimensional views of the cells
+            for name, range_expr in zip(cells, ranges):
+                self.line(indent, name + " = " + self.expr(range_expr) + ".reshape(-1)")
+            rounds = "len(" + cells[0] + ")" if len(cells) == 1 else \
+                "min(" + ", ".join("len(" + name + ")" for name in cells) + ")"
+            self.line(indent, "for " + self.index(loop) + " in range(" + rounds + "):")
+            self.block(indent + 1, node.children_[1].children_)
+
+        elif nodetype == "subroutine_call":
+            self.line(indent, self.call(node))
+
+        elif nodetype == "return":
+            # in the main program, return ends it
+            self.line(indent, "return " + self.expr(node.children_[0]))
+
+        # other statements are not (yet) executed by the interpreter, see
+        # execute
+
+    def call(self, node):
+        arguments = node.children_[1].children_ if len(node.children_) > 1 else []
+        if node.children_[0].symdata.symtype == "builtin":
+            return "AGGREGATES[" + repr(node.value) + "](" + self.expr(arguments[0]) + ")"
+        return self.sub(node.value) + "(" + ", ".join(self.expr(arg) for arg in arguments) + ")"
+
+    def definitions(self, indent, definition_list):
+        for definition in definition_list:
+            if definition.nodetype == "definition_scalar":
+                self.line(indent, self.var(definition.value) + " = round("
+                          + self.expr(definition.children_[0]) + ", 1)")
+            elif definition.nodetype == "definition_sheet":
+                init = definition.children_[1] if len(definition.children_) > 1 else None
+                self.line(indent, self.var(definition.value) + " = " + self.expr(init))
+            elif definition.nodetype == "definition_range":
+                self.line(indent, self.var(definition.value) + " = " + self.expr(definition.children_[0]))
+
+    def subroutine(self, indent, definition):
+        formals = definition.children_[1]
+        names = [arg.value for arg in formals.children_] if formals is not None else []
+        self.line(indent, "def " + self.sub(definition.value) + "("
+                  + ", ".join(self.var(name) for name in names) + "):")
+        # globals assigned in the body live in the program function
+        assigned = sorted(assigned_globals(definition.children_[-1]))
+        if assigned:
+            self.line(indent + 1, "nonlocal " + ", ".join(self.var(name) for name in assigned))
+        self.definitions(indent + 1, definition.children_[-2].children_)
+        self.block(indent + 1, definition.children_[-1].children_)
+        if definition.nodetype == "definition_function":
+            # a function that ends without return gives 0.0
+            self.line(indent + 1, "return " + self.number(self.numeric.zero))
+
+    def program(self, tree):
+        definition_list = tree.children_[0].children_
+        global_names = set(definition.value for definition in definition_list
+                           if definition.nodetype in ("definition_scalar", "definition_sheet",
+                                                      "definition_range"))
+
+        self.line(0, "def " + PROGRAM_FUNCTION + "():")
+        # nested defs refer to the variables, so they exist from the start
+        if global_names:
+            self.line(1, " = ".join(self.var(name) for name in sorted(global_names)) + " = None")
+        for definition in definition_list:
+            if definition.nodetype in ("definition_subroutine", "definition_function"):
+                self.subroutine(1, definition)
+        for definition in memo.pure_functions(tree):
+            name = self.sub(definition.value)
+            self.line(1, name + " = memoized(" + name + ", " + repr(definition.value) + ")")
+        self.definitions(1, definition_list)
+        self.block(1, tree.children_[1].children_)
+
+        header = ["# Generated from SheetScript, do not edit",
+                  "from decimal import Decimal",
+                  "from runtime import AGGREGATES, compare_chain, shift_range, new_sheet, zero_sheet, "
+                  "load_cell, store_cell, print_scalar, print_sheet, print_range, SheetFiles"]
+        header += [name + " = Decimal(" + repr(str(value)) + ")" for name, value in self.consts]
+        return "\n".join(header + self.lines + [PROGRAM_FUNCTION + "()", ""])
+
+def assigned_globals(node):
+    '''Names of the global variables assigned in a subtree'''
+    names = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if node.nodetype in ("scalar_assignment", "range_assign") and node.children_[0].symdata.depth == 0:
+            names.add(node.children_[0].value)
+        stack.extend(child for child in node.children_ if hasattr(child, "nodetype"))
+    return names
+
+def generate_source(tree, semdata):
+    '''Python source of a checked syntax tree'''
+    return SourceGenerator(semdata).program(tree)
+
+def compile_source(source, file=None):
+    '''Compile generated source of the program in file. Its code is named
+       <sheet-py:file>, not file, because its line numbers are lines of the
+       generated Python, not of the .sheet file.'''
+    return compile(source, "<sheet-py>" if file is None else f"<sheet-py:{file}>", "exec")
+
+def run_code(code, caches=None):
+    '''Run a compiled program, with the function caches of a memo.Caches'''
+    memoized = caches.wrap if caches is not None else lambda function, name: function
+    exec(code, {"__name__": "__sheet__", "memoized": memoized})
+
+# The code cache
+
+def cache_key(data, options=""):
+    '''Cache key of a SheetScript source text, compiled with options (a
+       string of the command line options the code depends on)'''
+    digest = hashlib.sha256()
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(str(CODEGEN_VERSION).encode())
+    digest.update(options.encode("utf-8") + b"\0")
+    digest.update(data.encode("utf-8"))
+    return digest.hexdigest()
+
+def default_cache_dir(filename):
+    return os.path.join(os.path.dirname(os.path.abspath(filename)), "__sheetcache__")
+
+def cache_path(cache_dir, key):
+    return os.path.join(cache_dir, key + ".code")
+
+def load_cached(cache_dir, key):
+    '''Cached code object for key, or None'''
+    path = cache_path(cache_dir, key)
+    try:
+        with open(path, "rb") as f:
+            code = marshal.load(f)
+        # the modification time tells when the entry was used last, see
+        # parse_cache.evict
+        os.utime(path)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return code
+
+def store_cached(cache_dir, key, code):
+    '''Write the code object atomically, so that concurrent runs never see a
+       partially written file. Failing to cache is not an error.'''
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=cache_dir, suffix=parse_cache.TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(temp, cache_path(cache_dir, key))
+        except BaseException:
+            parse_cache.remove_temp(temp)
+            raise
+    except OSError:
+        pass
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+#
+
+# Runtime helpers shared by the interpreter engines (tree walker in main.py,
+# closure_engine.py), so that every engine gives the same results for the
+# same program
+
+import atexit
+from collections import namedtuple
+from decimal import Decimal
+import itertools
+import math
+import operator
+import os
+
+import numpy
+
+import sparse
+
+# Comparison operators of scalar_expr. A comparison gives 1.0 if true and 0.0
+# if false (if and while treat anything not equal to 0.0 as true)
+
+COMPARE = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+# Arithmetic operators of simple_expr and term
+
+ARITHMETIC = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+class ReturnValue(Exception):
+    '''Raised by a return statement, ends the running call'''
+    def __init__(self, value):
+        self.value = value
+
+class SheetFileError(ValueError):
+    '''The file of a sheet (--mmap, --dump, --load) does not fit the sheet'''
+
+def compare_chain(values, operators, true=1.0, false=0.0):
+    '''Evaluate a chained comparison a < b < c ... of already evaluated values
+       (true and false are the values of the numeric mode)'''
+    for i, op in enumerate(operators):
+        if not COMPARE[op](values[i], values[i+1]):
+            return false
+    return true
+
+def range_slices(start, end):
+    '''Index of the cells from coordinate start to end, (col, row) pairs, in
+       the array of a sheet. Indexing with it gives a view, not a copy.'''
+    (col0, row0), (col1, row1) = start, end
+    return (slice(min(row0, row1), max(row0, row1) + 1),
+            slice(min(col0, col1), max(col0, col1) + 1))
+
+def sheet_of(values):
+    '''The array of the sheet a range (a view) refers to'''
+    sheet = values
+    while isinstance(sheet.base, numpy.ndarray):
+        sheet = sheet.base
+    return sheet
+
+def shift_range(values, columns, rows):
+    '''The range values (a view) moved by columns to the right and rows down
+       in its sheet (range_expr[columns, rows]), also a view'''
+    if isinstance(values, sparse.SparseRange):
+        return values.shift(columns, rows)
+    sheet = sheet_of(values)
+    # sheets are C contiguous, so the offset of the view in the sheet gives
+    # its first cell
+    offset = values.__array_interface__['data'][0] - sheet.__array_interface__['data'][0]
+    row, col = divmod(offset // sheet.itemsize, sheet.shape[1])
+    row, col = row + rows, col + columns
+    height, width = values.shape
+    if row < 0 or col < 0 or row + height > sheet.shape[0] or col + width > sheet.shape[1]:
+        raise IndexError(f"range shifted by [{columns}, {rows}] is outside of its sheet")
+    return sheet[row:row + height, col:col + width]
+
+def start_for(frame, slots, ranges):
+    '''Put the cells of the ranges of a for loop into their slots of frame,
+       as one dimensional views. Returns the number of rounds, the length of
+       the shortest range.'''
+    rounds = None
+    for slot, values in zip(slots, ranges):
+        # a range has one row or one column, so this is a view too
+        cells = frame[slot] = values.reshape(-1)
+        rounds = len(cells) if rounds is None else min(rounds, len(cells))
+    return rounds
+
+# Storage of the cells of sheets. By default a sheet is the NumPy array of
+# the values it is made of: objects if they are Decimals, float64 for a
+# sheet SS = 10 * 3 of zeros. A program can choose typed storage instead
+# (--storage, or the storage of its numeric mode), for all its sheets or per
+# sheet name:
+#  - 'float': float64 cells, rounded half-even to one decimal like
+#    round(value, 1) when they are written, read as floats
+#  - 'fixed': int64 cells, the number of tenths, read as Decimals with one
+#    decimal
+#  - 'decimal': object cells, Decimals kept as they are written (zeros are
+#    Decimal 0.0 too)
+# Ranges are views of their sheet and have its dtype, so load_cell and
+# store_cell find the storage of any sheet or range from the dtype. The
+# engines only use them in programs with typed storage, where every sheet
+# is typed: the float64 sheets of the default storage keep the values
+# written to them as they are.
+
+STORAGES = ('float', 'fixed', 'decimal')
+
+DTYPES = {'float': numpy.float64, 'fixed': numpy.int64, 'decimal': object}
+
+class Storage:
+    '''The typed storage of the sheets of a program
+
+       mode: storage of the sheets not in sheets
+       sheets: storage of sheets by name'''
+
+    def __init__(self, mode='float', sheets=None):
+        self.mode = mode
+        self.sheets = dict(sheets or {})
+
+    def __repr__(self):
+        return "<storage " + self.spec() + ">"
+
+    def of(self, name):
+        '''Storage of the sheets named name'''
+        return self.sheets.get(name, self.mode)
+
+    def spec(self):
+        '''The --storage arguments of this storage, as one string'''
+        return ",".join([self.mode] + [f"{name}={mode}" for name, mode in sorted(self.sheets.items())])
+
+def parse_storage(specs, mode=None):
+    '''The Storage of --storage arguments (MODE or SHEET=MODE) over the
+       storage mode of the numeric mode, None if there are neither. Raises
+       ValueError.'''
+    if not specs and mode is None:
+        return None
+    storage = Storage(mode or 'float')
+    for spec in specs or ():
+        name, _, mode = spec.rpartition("=")
+        if mode not in STORAGES:
+            raise ValueError(f"unknown storage {mode!r}, not one of {', '.join(STORAGES)}")
+        if name:
+            storage.sheets[name] = mode
+        else:
+            storage.mode = mode
+    return storage
+
+def tenths(value):
+    '''value in tenths, rounded half-even like round(value, 1)'''
+    return round(round(value, 1) * 10)
+
+def decimal_tenths(count):
+    '''The Decimal of count tenths'''
+    return Decimal(count).scaleb(-1)
+
+def load_cell(values, index):
+    '''Cell index of a typed sheet or range'''
+    kind = values.dtype.kind
+    if kind == 'f':
+        return float(values[index])
+    if kind == 'i':
+        return decimal_tenths(int(values[index]))
+    return values[index]
+
+def store_cell(values, index, value):
+    '''Write cell index of a typed sheet or range'''
+    kind = values.dtype.kind
+    if kind == 'f':
+        values[index] = round(value, 1)
+    elif kind == 'i':
+        values[index] = tenths(value)
+    else:
+        values[index] = value
+
+def cell_values(values):
+    '''The values of the cells of an array, as they are read'''
+    if values.dtype.kind == 'i':
+        return [decimal_tenths(count) for count in values.ravel().tolist()]
+    return values.flat
+
+# Built-in functions of ranges, each one NumPy reduction over the view of
+# the cells. Object arrays (of Decimals) are reduced with the Python
+# operators, so the results are the values a loop over the cells would give.
+# Fixed storage is reduced in integer tenths, which is exact (but for
+# Product, rounded like the Decimals).
+
+def _scalar(reduce, fixed):
+    def aggregate(values):
+        if values.dtype.kind == 'i':
+            return fixed(values)
+        result = reduce(values)
+        # the reductions of float arrays give NumPy scalars
+        if isinstance(result, numpy.generic):
+            return result.item()
+        return result
+    return aggregate
+
+AGGREGATES = {
+    'Sum': _scalar(numpy.sum, lambda values: decimal_tenths(int(numpy.sum(values)))),
+    'Average': _scalar(lambda values: numpy.sum(values) / numpy.size(values),
+                       lambda values: decimal_tenths(int(numpy.sum(values))) / numpy.size(values)),
+    'Min': _scalar(numpy.min, lambda values: decimal_tenths(int(numpy.min(values)))),
+    'Max': _scalar(numpy.max, lambda values: decimal_tenths(int(numpy.max(values)))),
+    # of the type of the cells
+    'Count': lambda values: (float(numpy.size(values)) if values.dtype.kind == 'f'
+                             else decimal_tenths(10 * numpy.size(values))),
+    # the product of the tenths is rounded like the product of the Decimals
+    # (to the digits of the context), then gets a decimal per cell
+    'Product': _scalar(numpy.prod, lambda values: math.prod(map(Decimal, values.ravel().tolist()))
+                       .scaleb(-numpy.size(values))),
+}
+
+# The files of a sheet (from --mmap, --load and --dump), None for none:
+#  - mmap: the .npy file that keeps its cells (see mapped_sheet)
+#  - load: the .csv or .npy file its cells are read from when it is made
+#  - dump: the .npy file its cells are written to, made anew by every run
+SheetFiles = namedtuple("SheetFiles", "mmap load dump", defaults=(None, None, None))
+
+def new_sheet(rows, storage=None, files=None):
+    '''Create the storage of a sheet from a list of rows (sheet_init_list).
+       storage: one of STORAGES, None for the default storage
+       files: its SheetFiles, None for a sheet in memory only'''
+    if storage == 'fixed':
+        values = numpy.array([[tenths(value) for value in row] for row in rows], dtype=numpy.int64)
+    elif storage == 'float':
+        values = numpy.array([[round(value, 1) for value in row] for row in rows], dtype=numpy.float64)
+    else:
+        values = numpy.array(rows, dtype=DTYPES.get(storage))
+    if files is not None:
+        return file_sheet(files, values.shape, storage, values)
+    return values
+
+# Sheets of given size with at least this many cells are sparse (see
+# sparse.py): their cells are allocated in blocks when they are written
+SPARSE_CELLS = 1 << 20
+
+def zero_sheet(columns, rows, storage=None, files=None):
+    '''Create the storage of a sheet of given size (sheet_init_size).
+       Note the order: sheet SS = 10 * 3 has 10 columns and 3 rows'''
+    if files is not None and (files.mmap is not None or files.dump is not None):
+        return file_sheet(files, (rows, columns), storage)
+    dtype = numpy.dtype(DTYPES.get(storage, numpy.float64))
+    zero = Decimal("0.0") if storage == 'decimal' else dtype.type(0)
+    if rows * columns >= SPARSE_CELLS:
+        sheet = sparse.SparseSheet((rows, columns), dtype, zero)
+    elif storage == 'decimal':
+        sheet = numpy.full((rows, columns), zero, dtype=object)
+    else:
+        sheet = numpy.zeros((rows, columns), dtype=dtype)
+    if files is not None:
+        load_sheet(sheet, files.load, storage)
+    return sheet
+
+def file_sheet(files, shape, storage, values=None):
+    '''The sheet of shape with files, from values (or zeros)'''
+    if files.mmap is not None:
+        sheet = mapped_sheet(files.mmap, shape, storage, values)
+    elif files.dump is not None and storage == 'fixed':
+        # the cells are tenths, the file gets their values when the run ends
+        sheet = values if values is not None else numpy.zeros(shape, dtype=numpy.int64)
+        atexit.register(dump_tenths, sheet, files.dump)
+    elif files.dump is not None:
+        sheet = mapped_sheet(files.dump, shape, storage, values, reopen=False)
+    else:
+        sheet = values
+    if files.load is not None:
+        load_sheet(sheet, files.load, storage)
+    return sheet
+
+# Mapped sheets (--mmap SHEET=FILE) keep their cells in a .npy file, mapped
+# into memory with numpy.memmap, so that the OS pages them in and out and
+# they persist from run to run. The first run creates the file with the
+# initial values of the sheet, later runs open it as it is, without reading
+# it (the initial values are then ignored). A mapped sheet is an ndarray
+# (a memmap), so the engines and ranges use it like any sheet. The file
+# has cells of one type, so a mapped sheet has typed storage: float64, or
+# int64 with fixed storage (decimal storage can't be mapped).
+#
+# A dumped sheet (--dump SHEET=FILE) is a mapped sheet whose file every run
+# creates anew, so that it has the cells of the sheet when the run ends.
+# Dumps are .npy files of float64 values, like those of other tools: a
+# sheet of fixed storage (int64 tenths) is kept in memory and written into
+# its file, as values, by dump_tenths at exit.
+
+def mapped_sheet(file, shape, storage=None, values=None, reopen=True):
+    '''The sheet of shape (rows, columns) in file, created from values (or
+       zeros) if the file does not exist (or reopen is false). Raises
+       SheetFileError if it has another shape or type, or is not in C order.'''
+    dtype = numpy.dtype(DTYPES.get(storage, numpy.float64))
+    if dtype == object:
+        raise SheetFileError(f"sheet file {file}: decimal storage can't be mapped")
+    if reopen and os.path.exists(file):
+        sheet = numpy.lib.format.open_memmap(file, mode='r+')
+        if sheet.shape != shape or sheet.dtype != dtype:
+            raise SheetFileError(f"sheet file {file} has {sheet.shape[1]} * {sheet.shape[0]} cells of "
+                                 f"{sheet.dtype}, not {shape[1]} * {shape[0]} of {dtype}")
+        # shift_range finds the first cell of a range from its offset in
+        # the sheet, which needs the cells row by row
+        if not sheet.flags.c_contiguous:
+            raise SheetFileError(f"sheet file {file} has its cells column by column (Fortran order), "
+                                 "not row by row")
+        return sheet
+    sheet = numpy.lib.format.open_memmap(file, mode='w+', dtype=dtype, shape=shape)
+    if values is not None:
+        sheet[...] = values
+    return sheet
+
+def dump_tenths(sheet, file):
+    '''Write the cells of a sheet of fixed storage into file as float64
+       values, LOAD_ROWS rows at a time'''
+    dump = numpy.lib.format.open_memmap(file, mode='w+', dtype=numpy.float64, shape=sheet.shape)
+    for row in range(0, sheet.shape[0], LOAD_ROWS):
+        dump[row:row + LOAD_ROWS] = sheet[row:row + LOAD_ROWS] / 10
+    dump.flush()
+
+# Loading a sheet (--load SHEET=FILE) writes the values of a file into its
+# cells, from the first cell on, when the sheet is made; the cells the file
+# does not have keep their initial values. The file is read in chunks of
+# LOAD_ROWS rows, each one converted into the type of the cells at once:
+#  - .csv: numbers separated by commas, parsed by numpy.loadtxt, into
+#    floats, or Decimals (exactly as written) for object cells
+#  - .npy: read through a memory map, floats or integers (--dump writes
+#    floats, also for fixed storage)
+# Values are rounded like store_cell rounds them, in typed storage.
+
+LOAD_ROWS = 4096
+
+def load_sheet(sheet, file, storage=None):
+    '''Write the values of file (.csv or .npy) into the cells of sheet.
+       Raises ValueError if the file is not one of those or too large.'''
+    if file is None:
+        return
+    if file.endswith(".npy"):
+        chunks = npy_chunks(file)
+    elif file.endswith(".csv"):
+        chunks = csv_chunks(file, sheet.dtype == object)
+    else:
+        raise ValueError(f"can't load {file}: not a .csv or .npy file")
+    rows, columns = sheet.shape
+    row = 0
+    for chunk in chunks:
+        if row + chunk.shape[0] > rows or chunk.shape[1] > columns:
+            raise ValueError(f"can't load {file}: more than the {columns} * {rows} cells of the sheet")
+        values = cells_of(chunk, sheet.dtype, storage)
+        if isinstance(sheet, sparse.SparseSheet):
+            sheet.write(row, 0, values)
+        else:
+            sheet[row:row + values.shape[0], :values.shape[1]] = values
+        row += chunk.shape[0]
+
+def npy_chunks(file):
+    values = numpy.load(file, mmap_mode='r')
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    if values.ndim != 2 or values.dtype.kind not in 'fi':
+        raise ValueError(f"can't load {file}: not a table of numbers")
+    for row in range(0, values.shape[0], LOAD_ROWS):
+        yield values[row:row + LOAD_ROWS]
+
+def csv_chunks(file, decimals):
+    with open(file) as f:
+        while True:
+            lines = list(itertools.islice(f, LOAD_ROWS))
+            if not lines:
+                return
+            if decimals:
+                yield numpy.loadtxt(lines, delimiter=",", dtype=object, converters=Decimal, ndmin=2)
+            else:
+                yield numpy.loadtxt(lines, delimiter=",", dtype=numpy.float64, ndmin=2)
+
+def cells_of(values, dtype, storage):
+    '''values (floats, integers or Decimals) as cells of dtype'''
+    kind = values.dtype.kind
+    if dtype == object:
+        if kind == 'i':
+            return numpy.array([[decimal_tenths(10 * value) for value in row] for row in values.tolist()],
+                               dtype=object)
+        if kind == 'f':
+            return numpy.array([[Decimal(repr(value)) for value in row] for row in values.tolist()],
+                               dtype=object)
+        return values
+    if dtype.kind == 'i':
+        if kind == 'i':
+            return numpy.asarray(values, dtype=numpy.int64) * 10
+        return numpy.rint(numpy.asarray(values, dtype=numpy.float64) * 10).astype(numpy.int64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+    return numpy.round(values, 1) if storage == 'float' else values
+
+def print_scalar(info, value):
+    if info is not None:
+        print(info, round(value, 1), sep='')
+    else:
+        print(round(value, 1))
+
+def print_sheet(info, arr):
+    print(info, end="")
+    for row in arr:
+        for element in cell_values(row):
+            print(element, end=" ")
+        print("/ ", end="")
+    print("")
+
+def print_range(info, values):
+    if info is not None:
+        print(info, end="")
+    for element in cell_values(values):
+        print(element, end=" ")
+    print("")
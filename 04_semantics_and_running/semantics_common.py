@@ -4,7 +4,7 @@
 # Generic useful stuff for semantic analysis and interpretation/code generation
 
 import sys
-from tree_print import get_childvars
+from tree_print import child_nodes
 
 
 # A class for collecting data needed during semantic analysis etc.
@@ -22,9 +22,44 @@ class SymbolData:
     self.symtype = symtype
     self.defnode = defnode
 
+def format_error(node, err):
+  '''Error message of a check, prefixed with the line number of the node
+     (if the node has a lineno attribute)'''
+  if hasattr(node, "lineno"):
+    err = "Line " + str(node.lineno) + ": " + err
+  return err
+
+def walk_tree(node, before_func=None, after_func=None, semdata=None):
+  '''Visit the tree like visit_tree, but with an explicit stack instead of
+     recursion (so the depth of the tree is not limited by Python's recursion
+     limit). A generator: yields (node, error message) for every error returned
+     by before_func or after_func, and continues the traversal when resumed.'''
+
+  # Entries are (node, children_visited)
+  stack = [(node, False)]
+  while stack:
+    node, children_visited = stack.pop()
+    if children_visited:
+      err = after_func(node, semdata)
+      if not err is None:
+        yield node, err
+      continue
+
+    if before_func:
+      err = before_func(node, semdata)
+      if not err is None:
+        yield node, err
+
+    if after_func:
+      stack.append((node, True))
+    # Push in reverse, so that children are visited in their order
+    children = child_nodes(node)
+    for child in reversed(children):
+      stack.append((child, False))
+
 # The function is given the root of the tree 
 def visit_tree(node, before_func=None, after_func=None, semdata=None):
-  '''A generic visitor (which uses tree_print.get_childvars)
+  '''A generic visitor (which uses tree_print.child_nodes)
   
      Parameters:
      node: root of the (sub)tree to be traversed
@@ -42,24 +77,65 @@ def visit_tree(node, before_func=None, after_func=None, semdata=None):
                 that's included in the error message.
      semdata: optional data that is passed to all functions'''
 
-  if before_func:
-    err = before_func(node, semdata)
-    if not err is None:
-      if hasattr(node, "lineno"):
-        err = "Line " + str(node.lineno) + ": " + err
-      print(err)
-      sys.exit()
-
-  children = get_childvars(node)
-
-  for name,child in children:
-    if child:
-      visit_tree(child, before_func, after_func, semdata)
-
-  if after_func:
-    err = after_func(node, semdata)
-    if not err is None:
-      if hasattr(node, "lineno"):
-        err = "Line " + str(node.lineno) + ": " + err
-      print(err)
-      sys.exit()
+  for node, err in walk_tree(node, before_func, after_func, semdata):
+    print(format_error(node, err))
+    sys.exit()
+
+def collect_errors(node, before_func=None, after_func=None, semdata=None):
+  '''Like visit_tree, but does not stop at the first error.
+
+     The whole tree is visited, and all errors returned by before_func and
+     after_func are returned as a list of pairs (line number, message), in the
+     order they were found. The line number is None if the node has no
+     attribute 'lineno'. Nothing is printed.'''
+
+  return [(getattr(node, "lineno", None), err)
+          for node, err in walk_tree(node, before_func, after_func, semdata)]
+
+class CheckRegistry:
+  '''A collection of semantic checks that are all run during ONE traversal
+     of the tree (instead of one visit_tree call per check).
+
+     Each check is registered with the node types it cares about, and is
+     called only for nodes of those types. A check is a function
+     check(node, semdata) returning None or an error message, like the
+     functions given to visit_tree.'''
+
+  def __init__(self):
+    self.before_checks = dict()
+    self.after_checks = dict()
+
+  def add(self, nodetypes, before=None, after=None):
+    '''Register a check
+
+       nodetypes: node types (nodetype attribute) the check is called for
+       before: called when the node is found, before its children
+       after: called after the children of the node have been visited'''
+    for nodetype in nodetypes:
+      if before:
+        self.before_checks.setdefault(nodetype, []).append(before)
+      if after:
+        self.after_checks.setdefault(nodetype, []).append(after)
+
+  @staticmethod
+  def dispatcher(checks):
+    def dispatch(node, semdata):
+      for check in checks.get(getattr(node, "nodetype", None), ()):
+        err = check(node, semdata)
+        if not err is None:
+          return err
+      return None
+    return dispatch
+
+  def run(self, tree, semdata):
+    '''Run all registered checks on the tree. The checks of a node are called
+       in their registration order, errors are handled like in visit_tree.'''
+    visit_tree(tree, self.dispatcher(self.before_checks),
+               self.dispatcher(self.after_checks), semdata)
+
+  def collect(self, tree, semdata):
+    '''Run all registered checks on the tree, and return all errors found
+       (see collect_errors). For each node, only the first failing check of
+       the node is reported.'''
+    return collect_errors(tree, self.dispatcher(self.before_checks),
+                          self.dispatcher(self.after_checks), semdata)
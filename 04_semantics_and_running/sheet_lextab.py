@@ -0,0 +1,11 @@
+# sheet_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'COLON', 'COMMA', 'COORDINATE_IDENT', 'DECIMAL_LITERAL', 'DIV', 'DO', 'DOLLAR', 'DONE', 'DOTDOT', 'ELSE', 'END', 'ENDIF', 'EQ', 'FOR', 'FUNCTION', 'FUNC_IDENT', 'GT', 'GTEQ', 'ID', 'IDENT', 'IF', 'INFO_STRING', 'INT_LITERAL', 'IS', 'LCURLY', 'LPAREN', 'LSQUARE', 'LT', 'LTEQ', 'MINUS', 'MULT', 'NOTEQ', 'NUMBER_SIGN', 'PLUS', 'PRINT_RANGE', 'PRINT_SCALAR', 'PRINT_SHEET', 'RANGE', 'RANGE_IDENT', 'RCURLY', 'RETURN', 'RPAREN', 'RSQUARE', 'SCALAR', 'SHEET', 'SHEET_IDENT', 'SQUOTE', 'SUBROUTINE', 'THEN', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_ID>[a-z_]+)|(?P<t_INFO_STRING>!.*?!)|(?P<t_COORDINATE_IDENT>([A-Z]{1,2}[0-9]{1,3}))|(?P<t_DECIMAL_LITERAL>-?\\d+\\.\\d)|(?P<t_INT_LITERAL>-?\\d+)|(?P<t_IDENT>[a-z][a-zA-Z0-9_]+)|(?P<t_RANGE_IDENT>\\_[a-zA-Z0-9_]+\\s)|(?P<t_FUNC_IDENT>[A-Z][a-z0-9_]+)|(?P<t_SHEET_IDENT>[A-Z]+)|(?P<t_newline>\\n+)|(?P<t_COMMENT>\\.{3,3}([\\s\\S]*?)\\.{3,3})|(?P<t_DOTDOT>\\.\\.)|(?P<t_ASSIGN>:=)|(?P<t_DOLLAR>\\$)|(?P<t_GTEQ>>=)|(?P<t_LPAREN>\\()|(?P<t_LSQUARE>\\[)|(?P<t_LTEQ><=)|(?P<t_MULT>\\*)|(?P<t_NOTEQ>!=)|(?P<t_NUMBER_SIGN>\\#)|(?P<t_PLUS>\\+)|(?P<t_RPAREN>\\))|(?P<t_RSQUARE>\\])|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIV>/)|(?P<t_EQ>=)|(?P<t_GT>>)|(?P<t_LCURLY>{)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_RCURLY>})|(?P<t_SQUOTE>')", [None, ('t_ID', 'ID'), ('t_INFO_STRING', 'INFO_STRING'), ('t_COORDINATE_IDENT', 'COORDINATE_IDENT'), None, ('t_DECIMAL_LITERAL', 'DECIMAL_LITERAL'), ('t_INT_LITERAL', 'INT_LITERAL'), ('t_IDENT', 'IDENT'), ('t_RANGE_IDENT', 'RANGE_IDENT'), ('t_FUNC_IDENT', 'FUNC_IDENT'), ('t_SHEET_IDENT', 'SHEET_IDENT'), ('t_newline', 'newline'), ('t_COMMENT', 'COMMENT'), None, (None, 'DOTDOT'), (None, 'ASSIGN'), (None, 'DOLLAR'), (None, 'GTEQ'), (None, 'LPAREN'), (None, 'LSQUARE'), (None, 'LTEQ'), (None, 'MULT'), (None, 'NOTEQ'), (None, 'NUMBER_SIGN'), (None, 'PLUS'), (None, 'RPAREN'), (None, 'RSQUARE'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIV'), (None, 'EQ'), (None, 'GT'), (None, 'LCURLY'), (None, 'LT'), (None, 'MINUS'), (None, 'RCURLY'), (None, 'SQUOTE')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_sheet_signature = '6a875b8975dd51bc0a73b5f76f3aba2d5742d74028a36e5b0091e587972e733f'
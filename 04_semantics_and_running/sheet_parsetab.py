@@ -0,0 +1,125 @@
+
+# sheet_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ASSIGN COLON COMMA COORDINATE_IDENT DECIMAL_LITERAL DIV DO DOLLAR DONE DOTDOT ELSE END ENDIF EQ FOR FUNCTION FUNC_IDENT GT GTEQ ID IDENT IF INFO_STRING INT_LITERAL IS LCURLY LPAREN LSQUARE LT LTEQ MINUS MULT NOTEQ NUMBER_SIGN PLUS PRINT_RANGE PRINT_SCALAR PRINT_SHEET RANGE RANGE_IDENT RCURLY RETURN RPAREN RSQUARE SCALAR SHEET SHEET_IDENT SQUOTE SUBROUTINE THEN WHILE program : function_or_variable_definition_star statement_listfunction_or_variable_definition_star  : function_or_variable_definition_star function_or_variable_definition\n                                            | emptyfunction_or_variable_definition   : variable_definition \n                                        | function_definition \n                                        | subroutine_definitionvariable_definition_star : variable_definition_star variable_definition\n                                | emptyvariable_definition : scalar_definition \n                            | range_definition \n                            | sheet_definitionfunction_definition : FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN SCALAR IS                             variable_definition_star                             statement_list                             END \n                            | FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN RANGE IS                             variable_definition_star                             statement_list                             ENDsubroutine_definition : SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS                                 variable_definition_star                                 statement_list                                 ENDformals_opt : formals\n                    | emptyformals : formals COMMA formal_arg\n                | formal_argformal_arg :  IDENT COLON SCALAR\n                    | RANGE_IDENT COLON RANGE\n                    | SHEET_IDENT COLON SHEETsheet_definition : SHEET SHEET_IDENT sheet_init_optsheet_init_opt : sheet_init\n                        | emptysheet_init : EQ sheet_init_list \n                    | EQ INT_LITERAL MULT INT_LITERALsheet_init_list : LCURLY sheet_row_plus RCURLYsheet_row_plus : sheet_row_plus sheet_row\n                        | sheet_rowsheet_row : sheet_row COMMA simple_expr\n                | simple_exprrange_definition : RANGE RANGE_IDENT \n                        | RANGE RANGE_IDENT EQ range_exprscalar_definition : SCALAR IDENT  \n                            | SCALAR IDENT EQ scalar_exprstatement_list : statement_list statement\n                        | statementstatement : PRINT_SHEET info_string_opt SHEET_IDENT\n                    | PRINT_RANGE info_string_opt range_expr\n                    | PRINT_SCALAR info_string_opt scalar_expr\n                    | IF scalar_expr THEN statement_list ENDIF\n                    | IF scalar_expr THEN statement_list ELSE statement_list ENDIF\n                    | WHILE scalar_expr DO statement_list DONE\n                    | FOR range_list DO statement_list DONE\n                    | subroutine_call\n                    | RETURN scalar_expr\n                    | RETURN range_expr\n                    | assignmentinfo_string_opt : INFO_STRING\n                        | emptyrange_list : range_list COMMA range_expr\n                    | range_exprarguments : arguments COMMA arg_expr\n                    | arg_exprarg_expr : scalar_expr \n                | range_expr \n                | SHEET_IDENTsubroutine_call : FUNC_IDENT LSQUARE RSQUARE\n                        | FUNC_IDENT LSQUARE arguments RSQUAREassignment : IDENT ASSIGN scalar_expr\n                    | cell_ref ASSIGN scalar_expr\n                    | RANGE_IDENT ASSIGN range_expr\n                    | SHEET_IDENT ASSIGN SHEET_IDENTrange_expr : RANGE_IDENT\n                    | RANGE cell_ref DOTDOT cell_ref\n                    | LSQUARE function_call RSQUARE\n                    | range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUAREcell_ref : SHEET_IDENT SQUOTE COORDINATE_IDENT\n                | DOLLAR \n                | DOLLAR  COLON RANGE_IDENTscalar_expr : simple_expr\n                    | scalar_expr compare simple_exprcompare : EQ \n                | NOTEQ \n                | LT \n                | LTEQ \n                | GT \n                | GTEQsimple_expr : simple_expr PLUS term\n                    | simple_expr MINUS term\n                    | termterm : term MULT factor\n            | term DIV factor\n            | factorfactor : atom\n                | MINUS atomatom : IDENT \n            | DECIMAL_LITERAL \n            | function_call\n            | cell_ref \n            | NUMBER_SIGN range_expr\n            | LPAREN scalar_expr RPARENfunction_call : FUNC_IDENT LSQUARE arguments RSQUARE\n                        | FUNC_IDENT LSQUARE RSQUAREempty :'
+    
+_lr_action_items = {'PRINT_SHEET':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,10,-3,10,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,10,-86,-91,10,10,-58,-60,-61,-62,-22,-23,-24,-70,10,-72,-79,-80,-82,-83,-92,-94,10,10,-66,-59,-35,-33,-25,-41,10,-93,-43,-44,-65,10,-95,-26,-27,-42,-67,10,-8,-95,-95,10,-7,10,10,-14,10,10,-12,-13,]),'PRINT_RANGE':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,12,-3,12,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,12,-86,-91,12,12,-58,-60,-61,-62,-22,-23,-24,-70,12,-72,-79,-80,-82,-83,-92,-94,12,12,-66,-59,-35,-33,-25,-41,12,-93,-43,-44,-65,12,-95,-26,-27,-42,-67,12,-8,-95,-95,12,-7,12,12,-14,12,12,-12,-13,]),'PRINT_SCALAR':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,13,-3,13,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,13,-86,-91,13,13,-58,-60,-61,-62,-22,-23,-24,-70,13,-72,-79,-80,-82,-83,-92,-94,13,13,-66,-59,-35,-33,-25,-41,13,-93,-43,-44,-65,13,-95,-26,-27,-42,-67,13,-8,-95,-95,13,-7,13,13,-14,13,13,-12,-13,]),'IF':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,14,-3,14,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,14,-86,-91,14,14,-58,-60,-61,-62,-22,-23,-24,-70,14,-72,-79,-80,-82,-83,-92,-94,14,14,-66,-59,-35,-33,-25,-41,14,-93,-43,-44,-65,14,-95,-26,-27,-42,-67,14,-8,-95,-95,14,-7,14,14,-14,14,14,-12,-13,]),'WHILE':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,15,-3,15,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,15,-86,-91,15,15,-58,-60,-61,-62,-22,-23,-24,-70,15,-72,-79,-80,-82,-83,-92,-94,15,15,-66,-59,-35,-33,-25,-41,15,-93,-43,-44,-65,15,-95,-26,-27,-42,-67,15,-8,-95,-95,15,-7,15,15,-14,15,15,-12,-13,]),'FOR':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,16,-3,16,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,16,-86,-91,16,16,-58,-60,-61,-62,-22,-23,-24,-70,16,-72,-79,-80,-82,-83,-92,-94,16,16,-66,-59,-35,-33,-25,-41,16,-93,-43,-44,-65,16,-95,-26,-27,-42,-67,16,-8,-95,-95,16,-7,16,16,-14,16,16,-12,-13,]),'RETURN':([0,2,3,4,5,6,7,8,9,17,19,20,21,22,32,33,42,43,45,46,47,48,49,50,58,61,62,65,66,71,73,74,75,76,77,78,90,91,94,95,101,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,142,143,145,148,149,150,151,152,154,155,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,18,-3,18,-2,-37,-4,-5,-6,-45,-48,-9,-10,-11,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-34,-32,-95,-38,-63,-68,-39,-40,18,-86,-91,18,18,-58,-60,-61,-62,-22,-23,-24,-70,18,-72,-79,-80,-82,-83,-92,-94,18,18,-66,-59,-35,-33,-25,-41,18,-93,-43,-44,-65,168,18,-95,-26,-27,-42,-67,18,-8,-95,-95,18,-7,18,18,-14,18,18,-12,-13,]),'FUNCTION':([0,2,3,5,7,8,9,20,21,22,32,42,43,45,46,47,48,49,50,58,65,66,71,75,90,91,113,114,115,117,119,120,121,122,123,124,126,132,142,143,145,150,154,174,175,179,191,194,195,],[-95,23,-3,-2,-4,-5,-6,-9,-10,-11,-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-34,-32,-95,-68,-86,-91,-22,-23,-24,-70,-72,-79,-80,-82,-83,-92,-94,-66,-35,-33,-25,-93,-65,-26,-27,-67,-14,-12,-13,]),'SUBROUTINE':([0,2,3,5,7,8,9,20,21,22,32,42,43,45,46,47,48,49,50,58,65,66,71,75,90,91,113,114,115,117,119,120,121,122,123,124,126,132,142,143,145,150,154,174,175,179,191,194,195,],[-95,27,-3,-2,-4,-5,-6,-9,-10,-11,-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-34,-32,-95,-68,-86,-91,-22,-23,-24,-70,-72,-79,-80,-82,-83,-92,-94,-66,-35,-33,-25,-93,-65,-26,-27,-67,-14,-12,-13,]),'FUNC_IDENT':([0,2,3,4,5,6,7,8,9,13,14,15,17,18,19,20,21,22,23,27,32,33,35,36,40,42,43,44,45,46,47,48,49,50,52,58,60,61,62,64,65,66,68,69,71,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,93,94,95,101,107,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,141,142,143,145,147,148,149,150,151,152,154,163,164,165,166,173,174,175,176,177,178,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,],[-95,24,-3,24,-2,-37,-4,-5,-6,-95,53,53,-45,53,-48,-9,-10,-11,63,67,-69,-36,-49,-50,53,-71,-81,53,-84,-85,-87,-88,-89,-90,53,-64,53,-46,-47,53,-34,-32,53,53,-95,-38,-63,-68,-39,-40,24,53,-73,-74,-75,-76,-77,-78,53,53,53,53,-86,-91,53,24,24,-58,53,-60,-61,-62,-22,-23,-24,-70,24,-72,-79,-80,-82,-83,-92,-94,24,24,-66,-59,53,-35,-33,-25,53,-41,24,-93,-43,-44,-65,53,-29,-31,24,-95,-26,-27,-28,53,-42,-67,24,-8,-30,-95,-95,24,-7,24,24,-14,24,24,-12,-13,]),'IDENT':([0,2,3,4,5,6,7,8,9,13,14,15,17,18,19,20,21,22,25,32,33,35,36,40,42,43,44,45,46,47,48,49,50,52,58,61,62,64,65,66,68,69,71,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,93,94,95,100,101,107,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,141,142,143,145,147,148,149,150,151,152,154,156,163,164,165,166,173,174,175,176,177,178,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,],[-95,28,-3,28,-2,-37,-4,-5,-6,-95,47,47,-45,47,-48,-9,-10,-11,65,-69,-36,-49,-50,47,-71,-81,47,-84,-85,-87,-88,-89,-90,47,-64,-46,-47,47,-34,-32,47,47,-95,-38,-63,-68,-39,-40,28,47,-73,-74,-75,-76,-77,-78,47,47,47,47,-86,-91,47,28,28,137,-58,47,137,-60,-61,-62,-22,-23,-24,-70,28,-72,-79,-80,-82,-83,-92,-94,28,28,-66,-59,47,-35,-33,-25,47,-41,28,-93,-43,-44,-65,137,47,-29,-31,28,-95,-26,-27,-28,47,-42,-67,28,-8,-30,-95,-95,28,-7,28,28,-14,28,28,-12,-13,]),'RANGE_IDENT':([0,2,3,4,5,6,7,8,9,12,16,17,18,19,20,21,22,26,32,33,35,36,39,42,43,45,46,47,48,49,50,51,58,61,62,64,65,66,70,71,72,73,74,75,76,77,78,90,91,93,94,95,96,100,101,108,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,132,140,141,142,143,145,148,149,150,151,152,154,156,166,173,174,175,178,179,182,183,185,186,187,188,189,190,191,192,193,194,195,],[-95,30,-3,30,-2,-37,-4,-5,-6,-95,58,-45,58,-48,-9,-10,-11,66,-69,-36,-49,-50,58,-71,-81,-84,-85,-87,-88,-89,-90,58,-64,-46,-47,58,-34,-32,58,-95,117,-38,-63,-68,-39,-40,30,-86,-91,58,30,30,58,138,-58,58,138,-60,-61,-62,-22,-23,-24,-70,30,-72,-79,-80,-82,-83,-92,-94,30,30,-66,-59,58,-35,-33,-25,-41,30,-93,-43,-44,-65,138,30,-95,-26,-27,-42,-67,30,-8,-95,-95,30,-7,30,30,-14,30,30,-12,-13,]),'SHEET_IDENT':([0,2,3,4,5,6,7,8,9,10,13,14,15,17,18,19,20,21,22,31,32,33,34,35,36,37,40,42,43,44,45,46,47,48,49,50,52,58,59,61,62,64,65,66,68,69,71,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,93,94,95,100,101,107,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,131,132,140,141,142,143,145,147,148,149,150,151,152,154,156,163,164,165,166,173,174,175,176,177,178,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,],[-95,11,-3,11,-2,-37,-4,-5,-6,-95,-95,54,54,-45,54,-48,-9,-10,-11,71,-69,-36,73,-49,-50,74,54,-71,-81,54,-84,-85,-87,-88,-89,-90,54,-64,54,-46,-47,106,-34,-32,54,54,-95,-38,-63,-68,-39,-40,11,54,-73,-74,-75,-76,-77,-78,54,54,54,54,-86,-91,106,11,11,139,-58,54,139,-60,-61,-62,-22,-23,-24,-70,11,-72,-79,-80,-82,-83,-92,-94,11,11,54,-66,-59,106,-35,-33,-25,54,-41,11,-93,-43,-44,-65,139,54,-29,-31,11,-95,-26,-27,-28,54,-42,-67,11,-8,-30,-95,-95,11,-7,11,11,-14,11,11,-12,-13,]),'SCALAR':([0,2,3,5,7,8,9,20,21,22,32,42,43,45,46,47,48,49,50,58,65,66,71,75,90,91,113,114,115,117,119,120,121,122,123,124,126,132,142,143,145,150,154,157,168,173,174,175,179,182,183,185,186,188,189,190,191,194,195,],[-95,25,-3,-2,-4,-5,-6,-9,-10,-11,-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-34,-32,-95,-68,-86,-91,-22,-23,-24,-70,-72,-79,-80,-82,-83,-92,-94,-66,-35,-33,-25,-93,-65,170,180,-95,-26,-27,-67,25,-8,-95,-95,-7,25,25,-14,-12,-13,]),'RANGE':([0,2,3,5,7,8,9,12,16,18,20,21,22,32,35,36,39,42,43,45,46,47,48,49,50,51,58,64,65,66,70,71,75,90,91,93,96,108,113,114,115,117,119,120,121,122,123,124,126,132,141,142,143,145,150,154,158,168,173,174,175,179,182,183,185,186,188,189,190,191,194,195,],[-95,26,-3,-2,-4,-5,-6,-95,59,59,-9,-10,-11,-69,-49,-50,59,-71,-81,-84,-85,-87,-88,-89,-90,59,-64,59,-34,-32,59,-95,-68,-86,-91,59,59,59,-22,-23,-24,-70,-72,-79,-80,-82,-83,-92,-94,-66,59,-35,-33,-25,-93,-65,171,181,-95,-26,-27,-67,26,-8,-95,-95,-7,26,26,-14,-12,-13,]),'SHEET':([0,2,3,5,7,8,9,20,21,22,32,42,43,45,46,47,48,49,50,58,65,66,71,75,90,91,113,114,115,117,119,120,121,122,123,124,126,132,142,143,145,150,154,159,173,174,175,179,182,183,185,186,188,189,190,191,194,195,],[-95,31,-3,-2,-4,-5,-6,-9,-10,-11,-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-34,-32,-95,-68,-86,-91,-22,-23,-24,-70,-72,-79,-80,-82,-83,-92,-94,-66,-35,-33,-25,-93,-65,172,-95,-26,-27,-67,31,-8,-95,-95,-7,31,31,-14,-12,-13,]),'DOLLAR':([0,2,3,4,5,6,7,8,9,13,14,15,17,18,19,20,21,22,32,33,35,36,40,42,43,44,45,46,47,48,49,50,52,58,59,61,62,64,65,66,68,69,71,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,93,94,95,101,107,110,111,112,113,114,115,117,118,119,120,121,122,123,124,126,127,128,131,132,140,141,142,143,145,147,148,149,150,151,152,154,163,164,165,166,173,174,175,176,177,178,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,],[-95,32,-3,32,-2,-37,-4,-5,-6,-95,32,32,-45,32,-48,-9,-10,-11,-69,-36,-49,-50,32,-71,-81,32,-84,-85,-87,-88,-89,-90,32,-64,32,-46,-47,32,-34,-32,32,32,-95,-38,-63,-68,-39,-40,32,32,-73,-74,-75,-76,-77,-78,32,32,32,32,-86,-91,32,32,32,-58,32,-60,-61,-62,-22,-23,-24,-70,32,-72,-79,-80,-82,-83,-92,-94,32,32,32,-66,-59,32,-35,-33,-25,32,-41,32,-93,-43,-44,-65,32,-29,-31,32,-95,-26,-27,-28,32,-42,-67,32,-8,-30,-95,-95,32,-7,32,32,-14,32,32,-12,-13,]),'$end':([1,4,6,17,19,32,33,42,43,45,46,47,48,49,50,58,61,62,73,74,75,76,77,90,91,101,110,111,112,117,119,120,121,122,123,124,126,132,140,148,150,151,152,154,178,179,],[0,-1,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'ENDIF':([6,17,19,32,33,42,43,45,46,47,48,49,50,58,61,62,73,74,75,76,77,90,91,101,110,111,112,117,118,119,120,121,122,123,124,126,132,140,148,150,151,152,154,166,178,179,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,148,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,178,-42,-67,]),'ELSE':([6,17,19,32,33,42,43,45,46,47,48,49,50,58,61,62,73,74,75,76,77,90,91,101,110,111,112,117,118,119,120,121,122,123,124,126,132,140,148,150,151,152,154,178,179,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,149,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'DONE':([6,17,19,32,33,42,43,45,46,47,48,49,50,58,61,62,73,74,75,76,77,90,91,101,110,111,112,117,119,120,121,122,123,124,126,127,128,132,140,148,150,151,152,154,178,179,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,-72,-79,-80,-82,-83,-92,-94,151,152,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'END':([6,17,19,32,33,42,43,45,46,47,48,49,50,58,61,62,73,74,75,76,77,90,91,101,110,111,112,117,119,120,121,122,123,124,126,132,140,148,150,151,152,154,178,179,187,192,193,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,-42,-67,191,194,195,]),'INFO_STRING':([10,12,13,],[35,35,35,]),'ASSIGN':([11,28,29,30,32,75,117,],[37,68,69,70,-69,-68,-70,]),'SQUOTE':([11,54,106,],[38,38,38,]),'LSQUARE':([12,16,18,24,32,35,36,39,51,53,57,58,62,63,64,67,70,75,76,91,93,96,105,108,112,117,129,132,141,143,154,179,],[-95,60,60,64,-69,-49,-50,60,60,93,97,-64,97,100,60,109,60,-68,97,97,60,60,97,60,97,-70,97,-66,60,97,-65,-67,]),'MINUS':([13,14,15,18,32,35,36,40,42,43,45,46,47,48,49,50,52,58,64,68,69,75,79,80,81,82,83,84,85,86,87,88,89,90,91,93,107,117,119,120,121,122,123,124,126,132,141,147,150,154,163,164,165,176,177,179,184,],[-95,44,44,44,-69,-49,-50,44,87,-81,-84,-85,-87,-88,-89,-90,44,-64,44,44,44,-68,44,-73,-74,-75,-76,-77,-78,44,44,44,44,-86,-91,44,44,-70,87,-79,-80,-82,-83,-92,-94,-66,44,44,-93,-65,44,-29,87,-28,44,-67,87,]),'DECIMAL_LITERAL':([13,14,15,18,32,35,36,40,43,44,45,46,47,48,49,50,52,58,64,68,69,75,79,80,81,82,83,84,85,86,87,88,89,90,91,93,107,117,120,121,122,123,124,126,132,141,147,150,154,163,164,165,176,177,179,184,],[-95,48,48,48,-69,-49,-50,48,-81,48,-84,-85,-87,-88,-89,-90,48,-64,48,48,48,-68,48,-73,-74,-75,-76,-77,-78,48,48,48,48,-86,-91,48,48,-70,-79,-80,-82,-83,-92,-94,-66,48,48,-93,-65,48,-29,-31,-28,48,-67,-30,]),'NUMBER_SIGN':([13,14,15,18,32,35,36,40,43,44,45,46,47,48,49,50,52,58,64,68,69,75,79,80,81,82,83,84,85,86,87,88,89,90,91,93,107,117,120,121,122,123,124,126,132,141,147,150,154,163,164,165,176,177,179,184,],[-95,51,51,51,-69,-49,-50,51,-81,51,-84,-85,-87,-88,-89,-90,51,-64,51,51,51,-68,51,-73,-74,-75,-76,-77,-78,51,51,51,51,-86,-91,51,51,-70,-79,-80,-82,-83,-92,-94,-66,51,51,-93,-65,51,-29,-31,-28,51,-67,-30,]),'LPAREN':([13,14,15,18,32,35,36,40,43,44,45,46,47,48,49,50,52,58,64,68,69,75,79,80,81,82,83,84,85,86,87,88,89,90,91,93,107,117,120,121,122,123,124,126,132,141,147,150,154,163,164,165,176,177,179,184,],[-95,52,52,52,-69,-49,-50,52,-81,52,-84,-85,-87,-88,-89,-90,52,-64,52,52,52,-68,52,-73,-74,-75,-76,-77,-78,52,52,52,52,-86,-91,52,52,-70,-79,-80,-82,-83,-92,-94,-66,52,52,-93,-65,52,-29,-31,-28,52,-67,-30,]),'MULT':([32,43,45,46,47,48,49,50,58,75,90,91,117,120,121,122,123,124,126,132,146,150,154,179,],[-69,88,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,88,88,-82,-83,-92,-94,-66,162,-93,-65,-67,]),'DIV':([32,43,45,46,47,48,49,50,58,75,90,91,117,120,121,122,123,124,126,132,150,154,179,],[-69,89,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,89,89,-82,-83,-92,-94,-66,-93,-65,-67,]),'PLUS':([32,42,43,45,46,47,48,49,50,58,75,90,91,117,119,120,121,122,123,124,126,132,150,154,165,179,184,],[-69,86,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,86,-79,-80,-82,-83,-92,-94,-66,-93,-65,86,-67,86,]),'THEN':([32,41,42,43,45,46,47,48,49,50,58,75,90,91,117,119,120,121,122,123,124,126,132,150,154,179,],[-69,78,-71,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'EQ':([32,41,42,43,45,46,47,48,49,50,55,58,61,65,66,71,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,80,-71,-81,-84,-85,-87,-88,-89,-90,80,-64,80,107,108,116,-68,80,-86,-91,80,80,80,80,-70,-72,-79,-80,-82,-83,-92,-94,-66,80,-93,-65,-67,]),'NOTEQ':([32,41,42,43,45,46,47,48,49,50,55,58,61,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,81,-71,-81,-84,-85,-87,-88,-89,-90,81,-64,81,-68,81,-86,-91,81,81,81,81,-70,-72,-79,-80,-82,-83,-92,-94,-66,81,-93,-65,-67,]),'LT':([32,41,42,43,45,46,47,48,49,50,55,58,61,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,82,-71,-81,-84,-85,-87,-88,-89,-90,82,-64,82,-68,82,-86,-91,82,82,82,82,-70,-72,-79,-80,-82,-83,-92,-94,-66,82,-93,-65,-67,]),'LTEQ':([32,41,42,43,45,46,47,48,49,50,55,58,61,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,83,-71,-81,-84,-85,-87,-88,-89,-90,83,-64,83,-68,83,-86,-91,83,83,83,83,-70,-72,-79,-80,-82,-83,-92,-94,-66,83,-93,-65,-67,]),'GT':([32,41,42,43,45,46,47,48,49,50,55,58,61,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,84,-71,-81,-84,-85,-87,-88,-89,-90,84,-64,84,-68,84,-86,-91,84,84,84,84,-70,-72,-79,-80,-82,-83,-92,-94,-66,84,-93,-65,-67,]),'GTEQ':([32,41,42,43,45,46,47,48,49,50,55,58,61,75,77,90,91,92,104,110,111,117,119,120,121,122,123,124,126,132,142,150,154,179,],[-69,85,-71,-81,-84,-85,-87,-88,-89,-90,85,-64,85,-68,85,-86,-91,85,85,85,85,-70,-72,-79,-80,-82,-83,-92,-94,-66,85,-93,-65,-67,]),'DO':([32,42,43,45,46,47,48,49,50,55,56,57,58,75,90,91,117,119,120,121,122,123,124,126,129,132,150,154,179,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,94,95,-52,-64,-68,-86,-91,-70,-72,-79,-80,-82,-83,-92,-94,-51,-66,-93,-65,-67,]),'RPAREN':([32,42,43,45,46,47,48,49,50,58,75,90,91,92,117,119,120,121,122,123,124,126,132,150,154,179,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,124,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'RSQUARE':([32,42,43,45,46,47,48,49,50,58,64,75,90,91,93,99,100,102,103,104,105,106,109,117,119,120,121,122,123,124,125,126,132,133,134,135,136,144,150,154,160,167,169,170,171,172,179,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,101,-68,-86,-91,126,132,-95,140,-54,-55,-56,-57,-95,-70,-72,-79,-80,-82,-83,-92,150,-94,-66,155,-15,-16,-18,161,-93,-65,-53,179,-17,-19,-20,-21,-67,]),'COMMA':([32,42,43,45,46,47,48,49,50,56,57,58,75,90,91,102,103,104,105,106,117,119,120,121,122,123,124,125,126,129,130,132,134,136,150,154,160,164,165,169,170,171,172,176,179,184,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,96,-52,-64,-68,-86,-91,141,-54,-55,-56,-57,-70,-72,-79,-80,-82,-83,-92,141,-94,-51,153,-66,156,-18,-93,-65,-53,177,-31,-17,-19,-20,-21,177,-67,-30,]),'RCURLY':([32,43,45,46,47,48,49,50,58,75,90,91,117,120,121,122,123,124,126,132,150,154,163,164,165,176,179,184,],[-69,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,-79,-80,-82,-83,-92,-94,-66,-93,-65,175,-29,-31,-28,-67,-30,]),'DOTDOT':([32,75,98,117,],[-69,-68,131,-70,]),'COLON':([32,137,138,139,],[72,157,158,159,]),'COORDINATE_IDENT':([38,],[75,]),'INT_LITERAL':([97,116,153,162,],[130,146,167,174,]),'LCURLY':([116,],[147,]),'IS':([161,180,181,],[173,185,186,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'function_or_variable_definition_star':([0,],[2,]),'empty':([0,10,12,13,71,100,109,173,185,186,],[3,36,36,36,115,135,135,183,183,183,]),'statement_list':([2,78,94,95,149,182,189,190,],[4,118,127,128,166,187,192,193,]),'function_or_variable_definition':([2,],[5,]),'statement':([2,4,78,94,95,118,127,128,149,166,182,187,189,190,192,193,],[6,33,6,6,6,33,33,33,6,33,6,33,6,6,33,33,]),'variable_definition':([2,182,189,190,],[7,188,188,188,]),'function_definition':([2,],[8,]),'subroutine_definition':([2,],[9,]),'subroutine_call':([2,4,78,94,95,118,127,128,149,166,182,187,189,190,192,193,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'assignment':([2,4,78,94,95,118,127,128,149,166,182,187,189,190,192,193,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'scalar_definition':([2,182,189,190,],[20,20,20,20,]),'range_definition':([2,182,189,190,],[21,21,21,21,]),'sheet_definition':([2,182,189,190,],[22,22,22,22,]),'cell_ref':([2,4,14,15,18,40,44,52,59,64,68,69,78,79,86,87,88,89,93,94,95,107,118,127,128,131,141,147,149,163,166,177,182,187,189,190,192,193,],[29,29,50,50,50,50,50,50,98,50,50,50,29,50,50,50,50,50,50,29,29,50,29,29,29,154,50,50,29,50,29,50,29,29,29,29,29,29,]),'info_string_opt':([10,12,13,],[34,39,40,]),'scalar_expr':([14,15,18,40,52,64,68,69,93,107,141,],[41,55,61,77,92,104,110,111,104,142,104,]),'simple_expr':([14,15,18,40,52,64,68,69,79,93,107,141,147,163,177,],[42,42,42,42,42,42,42,42,119,42,42,42,165,165,184,]),'term':([14,15,18,40,52,64,68,69,79,86,87,93,107,141,147,163,177,],[43,43,43,43,43,43,43,43,43,120,121,43,43,43,43,43,43,]),'factor':([14,15,18,40,52,64,68,69,79,86,87,88,89,93,107,141,147,163,177,],[45,45,45,45,45,45,45,45,45,45,45,122,123,45,45,45,45,45,45,]),'atom':([14,15,18,40,44,52,64,68,69,79,86,87,88,89,93,107,141,147,163,177,],[46,46,46,46,90,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'function_call':([14,15,18,40,44,52,60,64,68,69,79,86,87,88,89,93,107,141,147,163,177,],[49,49,49,49,49,49,99,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'range_list':([16,],[56,]),'range_expr':([16,18,39,51,64,70,93,96,108,141,],[57,62,76,91,105,112,105,129,143,105,]),'compare':([41,55,61,77,92,104,110,111,142,],[79,79,79,79,79,79,79,79,79,]),'arguments':([64,93,],[102,125,]),'arg_expr':([64,93,141,],[103,103,160,]),'sheet_init_opt':([71,],[113,]),'sheet_init':([71,],[114,]),'formals_opt':([100,109,],[133,144,]),'formals':([100,109,],[134,134,]),'formal_arg':([100,109,156,],[136,136,169,]),'sheet_init_list':([116,],[145,]),'sheet_row_plus':([147,],[163,]),'sheet_row':([147,163,],[164,176,]),'variable_definition_star':([173,185,186,],[182,189,190,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> function_or_variable_definition_star statement_list','program',2,'p_program','main.py',179),
+  ('function_or_variable_definition_star -> function_or_variable_definition_star function_or_variable_definition','function_or_variable_definition_star',2,'p_function_or_variable_definition_star','main.py',185),
+  ('function_or_variable_definition_star -> empty','function_or_variable_definition_star',1,'p_function_or_variable_definition_star','main.py',186),
+  ('function_or_variable_definition -> variable_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',193),
+  ('function_or_variable_definition -> function_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',194),
+  ('function_or_variable_definition -> subroutine_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',195),
+  ('variable_definition_star -> variable_definition_star variable_definition','variable_definition_star',2,'p_variable_definition_star','main.py',199),
+  ('variable_definition_star -> empty','variable_definition_star',1,'p_variable_definition_star','main.py',200),
+  ('variable_definition -> scalar_definition','variable_definition',1,'p_variable_definition','main.py',209),
+  ('variable_definition -> range_definition','variable_definition',1,'p_variable_definition','main.py',210),
+  ('variable_definition -> sheet_definition','variable_definition',1,'p_variable_definition','main.py',211),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN SCALAR IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',216),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN RANGE IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',217),
+  ('subroutine_definition -> SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS variable_definition_star statement_list END','subroutine_definition',9,'p_subroutine_definition','main.py',234),
+  ('formals_opt -> formals','formals_opt',1,'p_formals_opt','main.py',246),
+  ('formals_opt -> empty','formals_opt',1,'p_formals_opt','main.py',247),
+  ('formals -> formals COMMA formal_arg','formals',3,'p_formals','main.py',251),
+  ('formals -> formal_arg','formals',1,'p_formals','main.py',252),
+  ('formal_arg -> IDENT COLON SCALAR','formal_arg',3,'p_formal_arg','main.py',261),
+  ('formal_arg -> RANGE_IDENT COLON RANGE','formal_arg',3,'p_formal_arg','main.py',262),
+  ('formal_arg -> SHEET_IDENT COLON SHEET','formal_arg',3,'p_formal_arg','main.py',263),
+  ('sheet_definition -> SHEET SHEET_IDENT sheet_init_opt','sheet_definition',3,'p_sheet_definition','main.py',274),
+  ('sheet_init_opt -> sheet_init','sheet_init_opt',1,'p_sheet_init_opt','main.py',281),
+  ('sheet_init_opt -> empty','sheet_init_opt',1,'p_sheet_init_opt','main.py',282),
+  ('sheet_init -> EQ sheet_init_list','sheet_init',2,'p_sheet_init','main.py',286),
+  ('sheet_init -> EQ INT_LITERAL MULT INT_LITERAL','sheet_init',4,'p_sheet_init','main.py',287),
+  ('sheet_init_list -> LCURLY sheet_row_plus RCURLY','sheet_init_list',3,'p_sheet_init_list','main.py',295),
+  ('sheet_row_plus -> sheet_row_plus sheet_row','sheet_row_plus',2,'p_sheet_row_plus','main.py',299),
+  ('sheet_row_plus -> sheet_row','sheet_row_plus',1,'p_sheet_row_plus','main.py',300),
+  ('sheet_row -> sheet_row COMMA simple_expr','sheet_row',3,'p_sheet_row','main.py',309),
+  ('sheet_row -> simple_expr','sheet_row',1,'p_sheet_row','main.py',310),
+  ('range_definition -> RANGE RANGE_IDENT','range_definition',2,'p_range_definition','main.py',319),
+  ('range_definition -> RANGE RANGE_IDENT EQ range_expr','range_definition',4,'p_range_definition','main.py',320),
+  ('scalar_definition -> SCALAR IDENT','scalar_definition',2,'p_scalar_definition','main.py',330),
+  ('scalar_definition -> SCALAR IDENT EQ scalar_expr','scalar_definition',4,'p_scalar_definition','main.py',331),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','main.py',341),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','main.py',342),
+  ('statement -> PRINT_SHEET info_string_opt SHEET_IDENT','statement',3,'p_statement','main.py',353),
+  ('statement -> PRINT_RANGE info_string_opt range_expr','statement',3,'p_statement','main.py',354),
+  ('statement -> PRINT_SCALAR info_string_opt scalar_expr','statement',3,'p_statement','main.py',355),
+  ('statement -> IF scalar_expr THEN statement_list ENDIF','statement',5,'p_statement','main.py',356),
+  ('statement -> IF scalar_expr THEN statement_list ELSE statement_list ENDIF','statement',7,'p_statement','main.py',357),
+  ('statement -> WHILE scalar_expr DO statement_list DONE','statement',5,'p_statement','main.py',358),
+  ('statement -> FOR range_list DO statement_list DONE','statement',5,'p_statement','main.py',359),
+  ('statement -> subroutine_call','statement',1,'p_statement','main.py',360),
+  ('statement -> RETURN scalar_expr','statement',2,'p_statement','main.py',361),
+  ('statement -> RETURN range_expr','statement',2,'p_statement','main.py',362),
+  ('statement -> assignment','statement',1,'p_statement','main.py',363),
+  ('info_string_opt -> INFO_STRING','info_string_opt',1,'p_info_string_opt','main.py',407),
+  ('info_string_opt -> empty','info_string_opt',1,'p_info_string_opt','main.py',408),
+  ('range_list -> range_list COMMA range_expr','range_list',3,'p_range_list','main.py',412),
+  ('range_list -> range_expr','range_list',1,'p_range_list','main.py',413),
+  ('arguments -> arguments COMMA arg_expr','arguments',3,'p_arguments','main.py',422),
+  ('arguments -> arg_expr','arguments',1,'p_arguments','main.py',423),
+  ('arg_expr -> scalar_expr','arg_expr',1,'p_arg_expr','main.py',434),
+  ('arg_expr -> range_expr','arg_expr',1,'p_arg_expr','main.py',435),
+  ('arg_expr -> SHEET_IDENT','arg_expr',1,'p_arg_expr','main.py',436),
+  ('subroutine_call -> FUNC_IDENT LSQUARE RSQUARE','subroutine_call',3,'p_subroutine_call','main.py',443),
+  ('subroutine_call -> FUNC_IDENT LSQUARE arguments RSQUARE','subroutine_call',4,'p_subroutine_call','main.py',444),
+  ('assignment -> IDENT ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',451),
+  ('assignment -> cell_ref ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',452),
+  ('assignment -> RANGE_IDENT ASSIGN range_expr','assignment',3,'p_assignment','main.py',453),
+  ('assignment -> SHEET_IDENT ASSIGN SHEET_IDENT','assignment',3,'p_assignment','main.py',454),
+  ('range_expr -> RANGE_IDENT','range_expr',1,'p_range_expr','main.py',477),
+  ('range_expr -> RANGE cell_ref DOTDOT cell_ref','range_expr',4,'p_range_expr','main.py',478),
+  ('range_expr -> LSQUARE function_call RSQUARE','range_expr',3,'p_range_expr','main.py',479),
+  ('range_expr -> range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUARE','range_expr',6,'p_range_expr','main.py',480),
+  ('cell_ref -> SHEET_IDENT SQUOTE COORDINATE_IDENT','cell_ref',3,'p_cell_ref','main.py',501),
+  ('cell_ref -> DOLLAR','cell_ref',1,'p_cell_ref','main.py',502),
+  ('cell_ref -> DOLLAR COLON RANGE_IDENT','cell_ref',3,'p_cell_ref','main.py',503),
+  ('scalar_expr -> simple_expr','scalar_expr',1,'p_scalar_expr','main.py',525),
+  ('scalar_expr -> scalar_expr compare simple_expr','scalar_expr',3,'p_scalar_expr','main.py',526),
+  ('compare -> EQ','compare',1,'p_compare','main.py',539),
+  ('compare -> NOTEQ','compare',1,'p_compare','main.py',540),
+  ('compare -> LT','compare',1,'p_compare','main.py',541),
+  ('compare -> LTEQ','compare',1,'p_compare','main.py',542),
+  ('compare -> GT','compare',1,'p_compare','main.py',543),
+  ('compare -> GTEQ','compare',1,'p_compare','main.py',544),
+  ('simple_expr -> simple_expr PLUS term','simple_expr',3,'p_simple_expr','main.py',548),
+  ('simple_expr -> simple_expr MINUS term','simple_expr',3,'p_simple_expr','main.py',549),
+  ('simple_expr -> term','simple_expr',1,'p_simple_expr','main.py',550),
+  ('term -> term MULT factor','term',3,'p_term','main.py',563),
+  ('term -> term DIV factor','term',3,'p_term','main.py',564),
+  ('term -> factor','term',1,'p_term','main.py',565),
+  ('factor -> atom','factor',1,'p_factor','main.py',579),
+  ('factor -> MINUS atom','factor',2,'p_factor','main.py',580),
+  ('atom -> IDENT','atom',1,'p_atom','main.py',588),
+  ('atom -> DECIMAL_LITERAL','atom',1,'p_atom','main.py',589),
+  ('atom -> function_call','atom',1,'p_atom','main.py',590),
+  ('atom -> cell_ref','atom',1,'p_atom','main.py',591),
+  ('atom -> NUMBER_SIGN range_expr','atom',2,'p_atom','main.py',592),
+  ('atom -> LPAREN scalar_expr RPAREN','atom',3,'p_atom','main.py',593),
+  ('function_call -> FUNC_IDENT LSQUARE arguments RSQUARE','function_call',4,'p_function_call','main.py',619),
+  ('function_call -> FUNC_IDENT LSQUARE RSQUARE','function_call',3,'p_function_call','main.py',620),
+  ('empty -> <empty>','empty',0,'p_empty','main.py',628),
+]
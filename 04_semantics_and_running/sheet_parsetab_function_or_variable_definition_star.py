@@ -0,0 +1,125 @@
+
+# sheet_parsetab_function_or_variable_definition_star.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'function_or_variable_definition_starASSIGN COLON COMMA COORDINATE_IDENT DECIMAL_LITERAL DIV DO DOLLAR DONE DOTDOT ELSE END ENDIF EQ FOR FUNCTION FUNC_IDENT GT GTEQ ID IDENT IF INFO_STRING INT_LITERAL IS LCURLY LPAREN LSQUARE LT LTEQ MINUS MULT NOTEQ NUMBER_SIGN PLUS PRINT_RANGE PRINT_SCALAR PRINT_SHEET RANGE RANGE_IDENT RCURLY RETURN RPAREN RSQUARE SCALAR SHEET SHEET_IDENT SQUOTE SUBROUTINE THEN WHILE program : function_or_variable_definition_star statement_listfunction_or_variable_definition_star  : function_or_variable_definition_star function_or_variable_definition\n                                            | emptyfunction_or_variable_definition   : variable_definition \n                                        | function_definition \n                                        | subroutine_definitionvariable_definition_star : variable_definition_star variable_definition\n                                | emptyvariable_definition : scalar_definition \n                            | range_definition \n                            | sheet_definitionfunction_definition : FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN SCALAR IS                             variable_definition_star                             statement_list                             END \n                            | FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN RANGE IS                             variable_definition_star                             statement_list                             ENDsubroutine_definition : SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS                                 variable_definition_star                                 statement_list                                 ENDformals_opt : formals\n                    | emptyformals : formals COMMA formal_arg\n                | formal_argformal_arg :  IDENT COLON SCALAR\n                    | RANGE_IDENT COLON RANGE\n                    | SHEET_IDENT COLON SHEETsheet_definition : SHEET SHEET_IDENT sheet_init_optsheet_init_opt : sheet_init\n                        | emptysheet_init : EQ sheet_init_list \n                    | EQ INT_LITERAL MULT INT_LITERALsheet_init_list : LCURLY sheet_row_plus RCURLYsheet_row_plus : sheet_row_plus sheet_row\n                        | sheet_rowsheet_row : sheet_row COMMA simple_expr\n                | simple_exprrange_definition : RANGE RANGE_IDENT \n                        | RANGE RANGE_IDENT EQ range_exprscalar_definition : SCALAR IDENT  \n                            | SCALAR IDENT EQ scalar_exprstatement_list : statement_list statement\n                        | statementstatement : PRINT_SHEET info_string_opt SHEET_IDENT\n                    | PRINT_RANGE info_string_opt range_expr\n                    | PRINT_SCALAR info_string_opt scalar_expr\n                    | IF scalar_expr THEN statement_list ENDIF\n                    | IF scalar_expr THEN statement_list ELSE statement_list ENDIF\n                    | WHILE scalar_expr DO statement_list DONE\n                    | FOR range_list DO statement_list DONE\n                    | subroutine_call\n                    | RETURN scalar_expr\n                    | RETURN range_expr\n                    | assignmentinfo_string_opt : INFO_STRING\n                        | emptyrange_list : range_list COMMA range_expr\n                    | range_exprarguments : arguments COMMA arg_expr\n                    | arg_exprarg_expr : scalar_expr \n                | range_expr \n                | SHEET_IDENTsubroutine_call : FUNC_IDENT LSQUARE RSQUARE\n                        | FUNC_IDENT LSQUARE arguments RSQUAREassignment : IDENT ASSIGN scalar_expr\n                    | cell_ref ASSIGN scalar_expr\n                    | RANGE_IDENT ASSIGN range_expr\n                    | SHEET_IDENT ASSIGN SHEET_IDENTrange_expr : RANGE_IDENT\n                    | RANGE cell_ref DOTDOT cell_ref\n                    | LSQUARE function_call RSQUARE\n                    | range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUAREcell_ref : SHEET_IDENT SQUOTE COORDINATE_IDENT\n                | DOLLAR \n                | DOLLAR  COLON RANGE_IDENTscalar_expr : simple_expr\n                    | scalar_expr compare simple_exprcompare : EQ \n                | NOTEQ \n                | LT \n                | LTEQ \n                | GT \n                | GTEQsimple_expr : simple_expr PLUS term\n                    | simple_expr MINUS term\n                    | termterm : term MULT factor\n            | term DIV factor\n            | factorfactor : atom\n                | MINUS atomatom : IDENT \n            | DECIMAL_LITERAL \n            | function_call\n            | cell_ref \n            | NUMBER_SIGN range_expr\n            | LPAREN scalar_expr RPARENfunction_call : FUNC_IDENT LSQUARE arguments RSQUARE\n                        | FUNC_IDENT LSQUARE RSQUAREempty :'
+    
+_lr_action_items = {'FUNCTION':([0,1,2,3,4,5,6,7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,111,112,117,119,147,149,181,182,],[-95,10,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-26,-27,-93,-65,-67,-14,-12,-13,]),'SUBROUTINE':([0,1,2,3,4,5,6,7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,111,112,117,119,147,149,181,182,],[-95,13,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-26,-27,-93,-65,-67,-14,-12,-13,]),'SCALAR':([0,1,2,3,4,5,6,7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,60,74,75,88,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,130,145,146,147,149,181,182,],[-95,11,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,90,-86,-91,115,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,11,-8,-95,-95,-7,11,11,-67,-14,-12,-13,]),'RANGE':([0,1,2,3,4,5,6,7,8,9,16,17,19,22,24,25,26,35,36,37,38,40,41,42,43,44,45,49,51,52,55,61,74,75,77,88,93,94,95,96,97,98,100,105,106,109,110,111,112,117,118,119,121,122,124,125,130,134,138,140,145,146,147,148,149,152,153,155,164,177,181,182,],[-95,12,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,50,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,50,-69,-64,-33,-25,91,-86,-91,50,116,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,50,-65,12,-8,-95,-95,-7,-95,50,50,12,12,-67,50,-14,-49,-50,50,50,50,-12,-13,]),'SHEET':([0,1,2,3,4,5,6,7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,62,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,130,145,146,147,149,181,182,],[-95,14,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,92,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,14,-8,-95,-95,-7,14,14,-67,-14,-12,-13,]),'$end':([0,1,2,3,4,5,6,7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,111,112,117,119,147,149,181,182,],[-95,0,-3,-2,-4,-5,-6,-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-26,-27,-93,-65,-67,-14,-12,-13,]),'PRINT_SHEET':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,132,-8,-95,-95,132,-7,-37,-45,-48,132,132,-67,-36,-46,-47,132,132,-58,-38,-63,-39,-40,132,132,132,-60,-62,-61,-59,132,132,132,-41,132,-43,-44,132,-42,]),'PRINT_RANGE':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,134,-8,-95,-95,134,-7,-37,-45,-48,134,134,-67,-36,-46,-47,134,134,-58,-38,-63,-39,-40,134,134,134,-60,-62,-61,-59,134,134,134,-41,134,-43,-44,134,-42,]),'PRINT_SCALAR':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,135,-8,-95,-95,135,-7,-37,-45,-48,135,135,-67,-36,-46,-47,135,135,-58,-38,-63,-39,-40,135,135,135,-60,-62,-61,-59,135,135,135,-41,135,-43,-44,135,-42,]),'IF':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,136,-8,-95,-95,136,-7,-37,-45,-48,136,136,-67,-36,-46,-47,136,136,-58,-38,-63,-39,-40,136,136,136,-60,-62,-61,-59,136,136,136,-41,136,-43,-44,136,-42,]),'WHILE':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,137,-8,-95,-95,137,-7,-37,-45,-48,137,137,-67,-36,-46,-47,137,137,-58,-38,-63,-39,-40,137,137,137,-60,-62,-61,-59,137,137,137,-41,137,-43,-44,137,-42,]),'FOR':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,138,-8,-95,-95,138,-7,-37,-45,-48,138,138,-67,-36,-46,-47,138,138,-58,-38,-63,-39,-40,138,138,138,-60,-62,-61,-59,138,138,138,-41,138,-43,-44,138,-42,]),'RETURN':([7,8,9,16,17,19,24,25,26,35,36,37,38,40,41,42,43,44,49,51,52,55,58,74,75,93,94,95,96,97,98,100,105,106,109,110,111,112,117,119,121,122,124,125,129,130,131,139,141,145,146,147,150,161,162,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,-69,-64,-33,-25,88,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,-65,140,-8,-95,-95,140,-7,-37,-45,-48,140,140,-67,-36,-46,-47,140,140,-58,-38,-63,-39,-40,140,140,140,-60,-62,-61,-59,140,140,140,-41,140,-43,-44,140,-42,]),'FUNC_IDENT':([7,8,9,10,13,16,17,19,21,24,25,26,35,36,37,38,39,40,41,42,43,44,46,49,51,52,53,55,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,93,94,95,96,97,98,100,105,106,109,110,111,112,113,114,117,118,119,121,122,123,124,125,129,130,131,135,136,137,139,140,141,145,146,147,148,150,152,153,156,161,162,163,165,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,15,18,-34,-32,-95,47,-22,-23,-24,-87,-35,-71,-81,47,-84,-85,-88,-89,-90,47,-69,-64,-33,47,-25,47,-73,47,-74,-75,-76,-77,-78,47,47,47,47,-86,-91,47,47,-29,-31,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-28,47,-93,47,-65,128,-8,-30,-95,-95,128,-7,-37,-95,47,47,-45,47,-48,128,128,-67,47,-36,-49,-50,47,-46,-47,47,47,128,128,-58,-38,-63,-39,-40,128,128,128,-60,-62,-61,-59,128,128,128,-41,128,-43,-44,128,-42,]),'IDENT':([7,8,9,11,16,17,19,20,21,23,24,25,26,35,36,37,38,39,40,41,42,43,44,46,49,51,52,55,57,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,93,94,95,96,97,98,100,105,106,109,110,111,112,113,114,117,118,119,121,122,123,124,125,129,130,131,135,136,137,139,140,141,145,146,147,148,150,152,153,156,161,162,163,165,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,16,-34,-32,-95,32,35,32,-22,-23,-24,-87,-35,-71,-81,35,-84,-85,-88,-89,-90,35,-69,-64,-33,-25,35,32,-73,35,-74,-75,-76,-77,-78,35,35,35,35,-86,-91,35,35,-29,-31,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-28,35,-93,35,-65,142,-8,-30,-95,-95,142,-7,-37,-95,35,35,-45,35,-48,142,142,-67,35,-36,-49,-50,35,-46,-47,35,35,142,142,-58,-38,-63,-39,-40,142,142,142,-60,-62,-61,-59,142,142,142,-41,142,-43,-44,142,-42,]),'RANGE_IDENT':([7,8,9,12,16,17,19,20,22,23,24,25,26,35,36,37,38,40,41,42,43,44,45,49,51,52,55,59,74,75,77,79,93,94,95,96,97,98,100,105,106,109,110,111,112,117,118,119,121,122,124,125,129,130,131,134,138,139,140,141,145,146,147,148,150,152,153,155,161,162,164,166,167,168,170,171,172,173,174,175,176,177,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,17,-34,-32,-95,33,51,33,-22,-23,-24,-87,-35,-71,-81,-84,-85,-88,-89,-90,51,-69,-64,-33,-25,33,-86,-91,51,106,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-95,-26,-27,-93,51,-65,143,-8,-95,-95,143,-7,-37,-95,51,-45,51,-48,143,143,-67,51,-36,-49,-50,51,-46,-47,51,143,143,-58,-38,-63,-39,-40,143,143,143,51,-60,-62,-61,-59,143,143,143,-41,143,-43,-44,143,-42,]),'SHEET_IDENT':([7,8,9,14,16,17,19,20,21,23,24,25,26,35,36,37,38,39,40,41,42,43,44,46,49,50,51,52,55,57,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,93,94,95,96,97,98,100,105,106,107,109,110,111,112,113,114,117,118,119,121,122,123,124,125,129,130,131,132,135,136,137,139,140,141,145,146,147,148,150,151,152,153,154,156,161,162,163,165,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,19,-34,-32,-95,34,48,34,-22,-23,-24,-87,-35,-71,-81,48,-84,-85,-88,-89,-90,48,-69,48,-64,-33,-25,48,34,-73,48,-74,-75,-76,-77,-78,48,48,48,48,-86,-91,104,48,-29,-31,-72,-79,-80,-82,-83,-92,-94,-68,-70,48,-66,-95,-26,-27,-28,48,-93,104,-65,133,-8,-30,-95,-95,133,-7,-37,-95,-95,48,48,-45,48,-48,133,133,-67,104,-36,170,-49,-50,171,48,-46,-47,48,48,133,133,-58,-38,-63,-39,-40,133,133,133,-60,-62,-61,-59,133,133,133,-41,133,-43,-44,133,-42,]),'DOLLAR':([7,8,9,16,17,19,21,24,25,26,35,36,37,38,39,40,41,42,43,44,46,49,50,51,52,55,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,93,94,95,96,97,98,100,105,106,107,109,110,111,112,113,114,117,118,119,121,122,123,124,125,129,130,131,135,136,137,139,140,141,145,146,147,148,150,152,153,156,161,162,163,165,166,167,168,170,171,172,173,174,175,176,178,179,180,183,184,185,186,188,189,190,191,192,193,],[-9,-10,-11,-34,-32,-95,49,-22,-23,-24,-87,-35,-71,-81,49,-84,-85,-88,-89,-90,49,-69,49,-64,-33,-25,49,-73,49,-74,-75,-76,-77,-78,49,49,49,49,-86,-91,49,49,-29,-31,-72,-79,-80,-82,-83,-92,-94,-68,-70,49,-66,-95,-26,-27,-28,49,-93,49,-65,49,-8,-30,-95,-95,49,-7,-37,-95,49,49,-45,49,-48,49,49,-67,49,-36,-49,-50,49,-46,-47,49,49,49,49,-58,-38,-63,-39,-40,49,49,49,-60,-62,-61,-59,49,49,49,-41,49,-43,-44,49,-42,]),'LSQUARE':([15,18,22,45,47,49,51,52,75,77,103,105,106,109,118,119,128,134,138,140,147,148,152,153,155,160,162,164,172,177,179,187,],[20,23,53,53,77,-69,-64,81,81,53,81,-68,-70,-66,53,-65,148,-95,53,53,-67,53,-49,-50,53,81,81,53,81,53,81,81,]),'EQ':([16,17,19,35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[21,22,27,-87,63,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,63,-72,-79,-80,-82,-83,-92,-94,63,-68,-70,-66,-93,-65,-67,63,63,63,63,63,63,]),'RSQUARE':([20,23,28,29,30,31,35,37,38,40,41,42,43,44,49,51,54,74,75,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,109,117,119,126,127,147,148,169,],[-95,-95,58,-15,-16,-18,-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,83,-86,-91,100,109,-17,-19,-20,-21,-72,-79,-80,-82,-83,-92,117,-94,-54,-55,-56,-57,-68,-70,-66,-93,-65,-53,147,-67,168,183,]),'MINUS':([21,35,37,38,40,41,42,43,44,46,49,51,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,93,94,95,96,97,98,100,105,106,109,113,114,117,118,119,123,135,136,137,140,147,148,152,153,156,163,165,],[39,-87,71,-81,-84,-85,-88,-89,-90,39,-69,-64,39,-73,39,-74,-75,-76,-77,-78,39,39,39,39,-86,-91,39,39,-29,71,71,-79,-80,-82,-83,-92,-94,-68,-70,-66,-28,39,-93,39,-65,71,-95,39,39,39,-67,39,-49,-50,39,39,39,]),'DECIMAL_LITERAL':([21,35,38,39,40,41,42,43,44,46,49,51,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,94,95,96,97,98,100,105,106,109,113,114,117,118,119,123,135,136,137,140,147,148,152,153,156,163,165,],[42,-87,-81,42,-84,-85,-88,-89,-90,42,-69,-64,42,-73,42,-74,-75,-76,-77,-78,42,42,42,42,-86,-91,42,42,-29,-31,-79,-80,-82,-83,-92,-94,-68,-70,-66,-28,42,-93,42,-65,-30,-95,42,42,42,-67,42,-49,-50,42,42,42,]),'NUMBER_SIGN':([21,35,38,39,40,41,42,43,44,46,49,51,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,94,95,96,97,98,100,105,106,109,113,114,117,118,119,123,135,136,137,140,147,148,152,153,156,163,165,],[45,-87,-81,45,-84,-85,-88,-89,-90,45,-69,-64,45,-73,45,-74,-75,-76,-77,-78,45,45,45,45,-86,-91,45,45,-29,-31,-79,-80,-82,-83,-92,-94,-68,-70,-66,-28,45,-93,45,-65,-30,-95,45,45,45,-67,45,-49,-50,45,45,45,]),'LPAREN':([21,35,38,39,40,41,42,43,44,46,49,51,57,63,64,65,66,67,68,69,70,71,72,73,74,75,77,85,86,87,94,95,96,97,98,100,105,106,109,113,114,117,118,119,123,135,136,137,140,147,148,152,153,156,163,165,],[46,-87,-81,46,-84,-85,-88,-89,-90,46,-69,-64,46,-73,46,-74,-75,-76,-77,-78,46,46,46,46,-86,-91,46,46,-29,-31,-79,-80,-82,-83,-92,-94,-68,-70,-66,-28,46,-93,46,-65,-30,-95,46,46,46,-67,46,-49,-50,46,46,46,]),'INT_LITERAL':([27,81,84,120,],[56,108,111,127,]),'LCURLY':([27,],[57,]),'COMMA':([29,31,35,37,38,40,41,42,43,44,49,51,74,75,86,87,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,113,117,119,123,126,147,159,160,169,187,],[59,-18,-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,114,-31,-17,-19,-20,-21,-72,-79,-80,-82,-83,-92,118,-94,-54,-55,-56,-57,-68,-70,120,-66,114,-93,-65,-30,-53,-67,177,-52,118,-51,]),'COLON':([32,33,34,49,],[60,61,62,79,]),'MULT':([35,38,40,41,42,43,44,49,51,56,74,75,94,95,96,97,98,100,105,106,109,117,119,147,],[-87,72,-84,-85,-88,-89,-90,-69,-64,84,-86,-91,72,72,-82,-83,-92,-94,-68,-70,-66,-93,-65,-67,]),'DIV':([35,38,40,41,42,43,44,49,51,74,75,94,95,96,97,98,100,105,106,109,117,119,147,],[-87,73,-84,-85,-88,-89,-90,-69,-64,-86,-91,73,73,-82,-83,-92,-94,-68,-70,-66,-93,-65,-67,]),'PLUS':([35,37,38,40,41,42,43,44,49,51,74,75,87,93,94,95,96,97,98,100,105,106,109,117,119,123,147,],[-87,70,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,70,70,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,70,-67,]),'NOTEQ':([35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[-87,65,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,65,-72,-79,-80,-82,-83,-92,-94,65,-68,-70,-66,-93,-65,-67,65,65,65,65,65,65,]),'LT':([35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[-87,66,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,66,-72,-79,-80,-82,-83,-92,-94,66,-68,-70,-66,-93,-65,-67,66,66,66,66,66,66,]),'LTEQ':([35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[-87,67,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,67,-72,-79,-80,-82,-83,-92,-94,67,-68,-70,-66,-93,-65,-67,67,67,67,67,67,67,]),'GT':([35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[-87,68,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,68,-72,-79,-80,-82,-83,-92,-94,68,-68,-70,-66,-93,-65,-67,68,68,68,68,68,68,]),'GTEQ':([35,36,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,102,105,106,109,117,119,147,157,158,161,173,178,180,],[-87,69,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,69,-72,-79,-80,-82,-83,-92,-94,69,-68,-70,-66,-93,-65,-67,69,69,69,69,69,69,]),'RPAREN':([35,37,38,40,41,42,43,44,49,51,74,75,76,93,94,95,96,97,98,100,105,106,109,117,119,147,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,98,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-67,]),'RCURLY':([35,38,40,41,42,43,44,49,51,74,75,85,86,87,94,95,96,97,98,100,105,106,109,113,117,119,123,147,],[-87,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,112,-29,-31,-79,-80,-82,-83,-92,-94,-68,-70,-66,-28,-93,-65,-30,-67,]),'THEN':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,147,157,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-67,174,]),'DO':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,147,158,159,160,187,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-67,175,176,-52,-51,]),'END':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,129,131,139,141,147,150,161,162,166,167,168,170,171,172,173,178,179,180,183,188,190,191,193,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,149,-37,-45,-48,-67,-36,-46,-47,181,182,-58,-38,-63,-39,-40,-60,-62,-61,-59,-41,-43,-44,-42,]),'ENDIF':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,131,139,141,147,150,161,162,168,170,171,172,173,178,179,180,183,184,188,190,191,192,193,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-37,-45,-48,-67,-36,-46,-47,-58,-38,-63,-39,-40,-60,-62,-61,-59,188,-41,-43,-44,193,-42,]),'ELSE':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,131,139,141,147,150,161,162,168,170,171,172,173,178,179,180,183,184,188,190,191,193,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-37,-45,-48,-67,-36,-46,-47,-58,-38,-63,-39,-40,-60,-62,-61,-59,189,-41,-43,-44,-42,]),'DONE':([35,37,38,40,41,42,43,44,49,51,74,75,93,94,95,96,97,98,100,105,106,109,117,119,131,139,141,147,150,161,162,168,170,171,172,173,178,179,180,183,185,186,188,190,191,193,],[-87,-71,-81,-84,-85,-88,-89,-90,-69,-64,-86,-91,-72,-79,-80,-82,-83,-92,-94,-68,-70,-66,-93,-65,-37,-45,-48,-67,-36,-46,-47,-58,-38,-63,-39,-40,-60,-62,-61,-59,190,191,-41,-43,-44,-42,]),'SQUOTE':([48,104,133,],[78,78,78,]),'DOTDOT':([49,80,105,106,],[-69,107,-68,-70,]),'ASSIGN':([49,105,106,133,142,143,144,],[-69,-68,-70,154,163,164,165,]),'COORDINATE_IDENT':([78,],[105,]),'IS':([83,115,116,],[110,124,125,]),'INFO_STRING':([132,134,135,],[152,152,152,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'function_or_variable_definition_star':([0,],[1,]),'empty':([0,19,20,23,110,124,125,132,134,135,],[2,26,30,30,122,122,122,153,153,153,]),'function_or_variable_definition':([1,],[3,]),'variable_definition':([1,121,145,146,],[4,130,130,130,]),'function_definition':([1,],[5,]),'subroutine_definition':([1,],[6,]),'scalar_definition':([1,121,145,146,],[7,7,7,7,]),'range_definition':([1,121,145,146,],[8,8,8,8,]),'sheet_definition':([1,121,145,146,],[9,9,9,9,]),'sheet_init_opt':([19,],[24,]),'sheet_init':([19,],[25,]),'formals_opt':([20,23,],[28,54,]),'formals':([20,23,],[29,29,]),'formal_arg':([20,23,59,],[31,31,89,]),'scalar_expr':([21,46,77,118,136,137,140,148,156,163,165,],[36,76,102,102,157,158,161,102,173,178,180,]),'simple_expr':([21,46,57,64,77,85,114,118,136,137,140,148,156,163,165,],[37,37,87,93,37,87,123,37,37,37,37,37,37,37,37,]),'term':([21,46,57,64,70,71,77,85,114,118,136,137,140,148,156,163,165,],[38,38,38,38,94,95,38,38,38,38,38,38,38,38,38,38,38,]),'factor':([21,46,57,64,70,71,72,73,77,85,114,118,136,137,140,148,156,163,165,],[40,40,40,40,40,40,96,97,40,40,40,40,40,40,40,40,40,40,40,]),'atom':([21,39,46,57,64,70,71,72,73,77,85,114,118,136,137,140,148,156,163,165,],[41,74,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'function_call':([21,39,46,53,57,64,70,71,72,73,77,85,114,118,136,137,140,148,156,163,165,],[43,43,43,82,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'cell_ref':([21,39,46,50,57,64,70,71,72,73,77,85,107,114,118,121,129,136,137,140,145,146,148,156,163,165,166,167,174,175,176,184,185,186,189,192,],[44,44,44,80,44,44,44,44,44,44,44,44,119,44,44,144,144,44,44,44,144,144,44,44,44,44,144,144,144,144,144,144,144,144,144,144,]),'range_expr':([22,45,77,118,138,140,148,155,164,177,],[52,75,103,103,160,162,103,172,179,187,]),'sheet_init_list':([27,],[55,]),'compare':([36,76,102,157,158,161,173,178,180,],[64,64,64,64,64,64,64,64,64,]),'sheet_row_plus':([57,],[85,]),'sheet_row':([57,85,],[86,113,]),'arguments':([77,148,],[99,169,]),'arg_expr':([77,118,148,],[101,126,101,]),'variable_definition_star':([110,124,125,],[121,145,146,]),'statement_list':([121,145,146,174,175,176,189,],[129,166,167,184,185,186,192,]),'statement':([121,129,145,146,166,167,174,175,176,184,185,186,189,192,],[131,150,131,131,150,150,131,131,131,150,150,150,131,150,]),'subroutine_call':([121,129,145,146,166,167,174,175,176,184,185,186,189,192,],[139,139,139,139,139,139,139,139,139,139,139,139,139,139,]),'assignment':([121,129,145,146,166,167,174,175,176,184,185,186,189,192,],[141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'info_string_opt':([132,134,135,],[151,155,156,]),'range_list':([138,],[159,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> function_or_variable_definition_star","S'",1,None,None,None),
+  ('program -> function_or_variable_definition_star statement_list','program',2,'p_program','main.py',179),
+  ('function_or_variable_definition_star -> function_or_variable_definition_star function_or_variable_definition','function_or_variable_definition_star',2,'p_function_or_variable_definition_star','main.py',185),
+  ('function_or_variable_definition_star -> empty','function_or_variable_definition_star',1,'p_function_or_variable_definition_star','main.py',186),
+  ('function_or_variable_definition -> variable_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',193),
+  ('function_or_variable_definition -> function_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',194),
+  ('function_or_variable_definition -> subroutine_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',195),
+  ('variable_definition_star -> variable_definition_star variable_definition','variable_definition_star',2,'p_variable_definition_star','main.py',199),
+  ('variable_definition_star -> empty','variable_definition_star',1,'p_variable_definition_star','main.py',200),
+  ('variable_definition -> scalar_definition','variable_definition',1,'p_variable_definition','main.py',209),
+  ('variable_definition -> range_definition','variable_definition',1,'p_variable_definition','main.py',210),
+  ('variable_definition -> sheet_definition','variable_definition',1,'p_variable_definition','main.py',211),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN SCALAR IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',216),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN RANGE IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',217),
+  ('subroutine_definition -> SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS variable_definition_star statement_list END','subroutine_definition',9,'p_subroutine_definition','main.py',234),
+  ('formals_opt -> formals','formals_opt',1,'p_formals_opt','main.py',246),
+  ('formals_opt -> empty','formals_opt',1,'p_formals_opt','main.py',247),
+  ('formals -> formals COMMA formal_arg','formals',3,'p_formals','main.py',251),
+  ('formals -> formal_arg','formals',1,'p_formals','main.py',252),
+  ('formal_arg -> IDENT COLON SCALAR','formal_arg',3,'p_formal_arg','main.py',261),
+  ('formal_arg -> RANGE_IDENT COLON RANGE','formal_arg',3,'p_formal_arg','main.py',262),
+  ('formal_arg -> SHEET_IDENT COLON SHEET','formal_arg',3,'p_formal_arg','main.py',263),
+  ('sheet_definition -> SHEET SHEET_IDENT sheet_init_opt','sheet_definition',3,'p_sheet_definition','main.py',274),
+  ('sheet_init_opt -> sheet_init','sheet_init_opt',1,'p_sheet_init_opt','main.py',281),
+  ('sheet_init_opt -> empty','sheet_init_opt',1,'p_sheet_init_opt','main.py',282),
+  ('sheet_init -> EQ sheet_init_list','sheet_init',2,'p_sheet_init','main.py',286),
+  ('sheet_init -> EQ INT_LITERAL MULT INT_LITERAL','sheet_init',4,'p_sheet_init','main.py',287),
+  ('sheet_init_list -> LCURLY sheet_row_plus RCURLY','sheet_init_list',3,'p_sheet_init_list','main.py',295),
+  ('sheet_row_plus -> sheet_row_plus sheet_row','sheet_row_plus',2,'p_sheet_row_plus','main.py',299),
+  ('sheet_row_plus -> sheet_row','sheet_row_plus',1,'p_sheet_row_plus','main.py',300),
+  ('sheet_row -> sheet_row COMMA simple_expr','sheet_row',3,'p_sheet_row','main.py',309),
+  ('sheet_row -> simple_expr','sheet_row',1,'p_sheet_row','main.py',310),
+  ('range_definition -> RANGE RANGE_IDENT','range_definition',2,'p_range_definition','main.py',319),
+  ('range_definition -> RANGE RANGE_IDENT EQ range_expr','range_definition',4,'p_range_definition','main.py',320),
+  ('scalar_definition -> SCALAR IDENT','scalar_definition',2,'p_scalar_definition','main.py',330),
+  ('scalar_definition -> SCALAR IDENT EQ scalar_expr','scalar_definition',4,'p_scalar_definition','main.py',331),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','main.py',341),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','main.py',342),
+  ('statement -> PRINT_SHEET info_string_opt SHEET_IDENT','statement',3,'p_statement','main.py',353),
+  ('statement -> PRINT_RANGE info_string_opt range_expr','statement',3,'p_statement','main.py',354),
+  ('statement -> PRINT_SCALAR info_string_opt scalar_expr','statement',3,'p_statement','main.py',355),
+  ('statement -> IF scalar_expr THEN statement_list ENDIF','statement',5,'p_statement','main.py',356),
+  ('statement -> IF scalar_expr THEN statement_list ELSE statement_list ENDIF','statement',7,'p_statement','main.py',357),
+  ('statement -> WHILE scalar_expr DO statement_list DONE','statement',5,'p_statement','main.py',358),
+  ('statement -> FOR range_list DO statement_list DONE','statement',5,'p_statement','main.py',359),
+  ('statement -> subroutine_call','statement',1,'p_statement','main.py',360),
+  ('statement -> RETURN scalar_expr','statement',2,'p_statement','main.py',361),
+  ('statement -> RETURN range_expr','statement',2,'p_statement','main.py',362),
+  ('statement -> assignment','statement',1,'p_statement','main.py',363),
+  ('info_string_opt -> INFO_STRING','info_string_opt',1,'p_info_string_opt','main.py',407),
+  ('info_string_opt -> empty','info_string_opt',1,'p_info_string_opt','main.py',408),
+  ('range_list -> range_list COMMA range_expr','range_list',3,'p_range_list','main.py',412),
+  ('range_list -> range_expr','range_list',1,'p_range_list','main.py',413),
+  ('arguments -> arguments COMMA arg_expr','arguments',3,'p_arguments','main.py',422),
+  ('arguments -> arg_expr','arguments',1,'p_arguments','main.py',423),
+  ('arg_expr -> scalar_expr','arg_expr',1,'p_arg_expr','main.py',434),
+  ('arg_expr -> range_expr','arg_expr',1,'p_arg_expr','main.py',435),
+  ('arg_expr -> SHEET_IDENT','arg_expr',1,'p_arg_expr','main.py',436),
+  ('subroutine_call -> FUNC_IDENT LSQUARE RSQUARE','subroutine_call',3,'p_subroutine_call','main.py',443),
+  ('subroutine_call -> FUNC_IDENT LSQUARE arguments RSQUARE','subroutine_call',4,'p_subroutine_call','main.py',444),
+  ('assignment -> IDENT ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',451),
+  ('assignment -> cell_ref ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',452),
+  ('assignment -> RANGE_IDENT ASSIGN range_expr','assignment',3,'p_assignment','main.py',453),
+  ('assignment -> SHEET_IDENT ASSIGN SHEET_IDENT','assignment',3,'p_assignment','main.py',454),
+  ('range_expr -> RANGE_IDENT','range_expr',1,'p_range_expr','main.py',477),
+  ('range_expr -> RANGE cell_ref DOTDOT cell_ref','range_expr',4,'p_range_expr','main.py',478),
+  ('range_expr -> LSQUARE function_call RSQUARE','range_expr',3,'p_range_expr','main.py',479),
+  ('range_expr -> range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUARE','range_expr',6,'p_range_expr','main.py',480),
+  ('cell_ref -> SHEET_IDENT SQUOTE COORDINATE_IDENT','cell_ref',3,'p_cell_ref','main.py',501),
+  ('cell_ref -> DOLLAR','cell_ref',1,'p_cell_ref','main.py',502),
+  ('cell_ref -> DOLLAR COLON RANGE_IDENT','cell_ref',3,'p_cell_ref','main.py',503),
+  ('scalar_expr -> simple_expr','scalar_expr',1,'p_scalar_expr','main.py',525),
+  ('scalar_expr -> scalar_expr compare simple_expr','scalar_expr',3,'p_scalar_expr','main.py',526),
+  ('compare -> EQ','compare',1,'p_compare','main.py',539),
+  ('compare -> NOTEQ','compare',1,'p_compare','main.py',540),
+  ('compare -> LT','compare',1,'p_compare','main.py',541),
+  ('compare -> LTEQ','compare',1,'p_compare','main.py',542),
+  ('compare -> GT','compare',1,'p_compare','main.py',543),
+  ('compare -> GTEQ','compare',1,'p_compare','main.py',544),
+  ('simple_expr -> simple_expr PLUS term','simple_expr',3,'p_simple_expr','main.py',548),
+  ('simple_expr -> simple_expr MINUS term','simple_expr',3,'p_simple_expr','main.py',549),
+  ('simple_expr -> term','simple_expr',1,'p_simple_expr','main.py',550),
+  ('term -> term MULT factor','term',3,'p_term','main.py',563),
+  ('term -> term DIV factor','term',3,'p_term','main.py',564),
+  ('term -> factor','term',1,'p_term','main.py',565),
+  ('factor -> atom','factor',1,'p_factor','main.py',579),
+  ('factor -> MINUS atom','factor',2,'p_factor','main.py',580),
+  ('atom -> IDENT','atom',1,'p_atom','main.py',588),
+  ('atom -> DECIMAL_LITERAL','atom',1,'p_atom','main.py',589),
+  ('atom -> function_call','atom',1,'p_atom','main.py',590),
+  ('atom -> cell_ref','atom',1,'p_atom','main.py',591),
+  ('atom -> NUMBER_SIGN range_expr','atom',2,'p_atom','main.py',592),
+  ('atom -> LPAREN scalar_expr RPAREN','atom',3,'p_atom','main.py',593),
+  ('function_call -> FUNC_IDENT LSQUARE arguments RSQUARE','function_call',4,'p_function_call','main.py',619),
+  ('function_call -> FUNC_IDENT LSQUARE RSQUARE','function_call',3,'p_function_call','main.py',620),
+  ('empty -> <empty>','empty',0,'p_empty','main.py',628),
+]
@@ -0,0 +1,125 @@
+
+# sheet_parsetab_statement_list.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'statement_listASSIGN COLON COMMA COORDINATE_IDENT DECIMAL_LITERAL DIV DO DOLLAR DONE DOTDOT ELSE END ENDIF EQ FOR FUNCTION FUNC_IDENT GT GTEQ ID IDENT IF INFO_STRING INT_LITERAL IS LCURLY LPAREN LSQUARE LT LTEQ MINUS MULT NOTEQ NUMBER_SIGN PLUS PRINT_RANGE PRINT_SCALAR PRINT_SHEET RANGE RANGE_IDENT RCURLY RETURN RPAREN RSQUARE SCALAR SHEET SHEET_IDENT SQUOTE SUBROUTINE THEN WHILE program : function_or_variable_definition_star statement_listfunction_or_variable_definition_star  : function_or_variable_definition_star function_or_variable_definition\n                                            | emptyfunction_or_variable_definition   : variable_definition \n                                        | function_definition \n                                        | subroutine_definitionvariable_definition_star : variable_definition_star variable_definition\n                                | emptyvariable_definition : scalar_definition \n                            | range_definition \n                            | sheet_definitionfunction_definition : FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN SCALAR IS                             variable_definition_star                             statement_list                             END \n                            | FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE                             RETURN RANGE IS                             variable_definition_star                             statement_list                             ENDsubroutine_definition : SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS                                 variable_definition_star                                 statement_list                                 ENDformals_opt : formals\n                    | emptyformals : formals COMMA formal_arg\n                | formal_argformal_arg :  IDENT COLON SCALAR\n                    | RANGE_IDENT COLON RANGE\n                    | SHEET_IDENT COLON SHEETsheet_definition : SHEET SHEET_IDENT sheet_init_optsheet_init_opt : sheet_init\n                        | emptysheet_init : EQ sheet_init_list \n                    | EQ INT_LITERAL MULT INT_LITERALsheet_init_list : LCURLY sheet_row_plus RCURLYsheet_row_plus : sheet_row_plus sheet_row\n                        | sheet_rowsheet_row : sheet_row COMMA simple_expr\n                | simple_exprrange_definition : RANGE RANGE_IDENT \n                        | RANGE RANGE_IDENT EQ range_exprscalar_definition : SCALAR IDENT  \n                            | SCALAR IDENT EQ scalar_exprstatement_list : statement_list statement\n                        | statementstatement : PRINT_SHEET info_string_opt SHEET_IDENT\n                    | PRINT_RANGE info_string_opt range_expr\n                    | PRINT_SCALAR info_string_opt scalar_expr\n                    | IF scalar_expr THEN statement_list ENDIF\n                    | IF scalar_expr THEN statement_list ELSE statement_list ENDIF\n                    | WHILE scalar_expr DO statement_list DONE\n                    | FOR range_list DO statement_list DONE\n                    | subroutine_call\n                    | RETURN scalar_expr\n                    | RETURN range_expr\n                    | assignmentinfo_string_opt : INFO_STRING\n                        | emptyrange_list : range_list COMMA range_expr\n                    | range_exprarguments : arguments COMMA arg_expr\n                    | arg_exprarg_expr : scalar_expr \n                | range_expr \n                | SHEET_IDENTsubroutine_call : FUNC_IDENT LSQUARE RSQUARE\n                        | FUNC_IDENT LSQUARE arguments RSQUAREassignment : IDENT ASSIGN scalar_expr\n                    | cell_ref ASSIGN scalar_expr\n                    | RANGE_IDENT ASSIGN range_expr\n                    | SHEET_IDENT ASSIGN SHEET_IDENTrange_expr : RANGE_IDENT\n                    | RANGE cell_ref DOTDOT cell_ref\n                    | LSQUARE function_call RSQUARE\n                    | range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUAREcell_ref : SHEET_IDENT SQUOTE COORDINATE_IDENT\n                | DOLLAR \n                | DOLLAR  COLON RANGE_IDENTscalar_expr : simple_expr\n                    | scalar_expr compare simple_exprcompare : EQ \n                | NOTEQ \n                | LT \n                | LTEQ \n                | GT \n                | GTEQsimple_expr : simple_expr PLUS term\n                    | simple_expr MINUS term\n                    | termterm : term MULT factor\n            | term DIV factor\n            | factorfactor : atom\n                | MINUS atomatom : IDENT \n            | DECIMAL_LITERAL \n            | function_call\n            | cell_ref \n            | NUMBER_SIGN range_expr\n            | LPAREN scalar_expr RPARENfunction_call : FUNC_IDENT LSQUARE arguments RSQUARE\n                        | FUNC_IDENT LSQUARE RSQUAREempty :'
+    
+_lr_action_items = {'PRINT_SHEET':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[3,3,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,3,-86,-91,3,3,-58,-60,-61,-62,-70,3,-72,-79,-80,-82,-83,-92,-94,3,3,-66,-59,-41,3,-93,-43,-44,-65,3,-42,-67,]),'PRINT_RANGE':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[5,5,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,5,-86,-91,5,5,-58,-60,-61,-62,-70,5,-72,-79,-80,-82,-83,-92,-94,5,5,-66,-59,-41,5,-93,-43,-44,-65,5,-42,-67,]),'PRINT_SCALAR':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[6,6,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,6,-86,-91,6,6,-58,-60,-61,-62,-70,6,-72,-79,-80,-82,-83,-92,-94,6,6,-66,-59,-41,6,-93,-43,-44,-65,6,-42,-67,]),'IF':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[7,7,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,7,-86,-91,7,7,-58,-60,-61,-62,-70,7,-72,-79,-80,-82,-83,-92,-94,7,7,-66,-59,-41,7,-93,-43,-44,-65,7,-42,-67,]),'WHILE':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[8,8,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,8,-86,-91,8,8,-58,-60,-61,-62,-70,8,-72,-79,-80,-82,-83,-92,-94,8,8,-66,-59,-41,8,-93,-43,-44,-65,8,-42,-67,]),'FOR':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[9,9,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,9,-86,-91,9,9,-58,-60,-61,-62,-70,9,-72,-79,-80,-82,-83,-92,-94,9,9,-66,-59,-41,9,-93,-43,-44,-65,9,-42,-67,]),'RETURN':([0,1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,58,70,71,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,107,108,109,110,111,113,115,117,118,],[11,11,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,11,-86,-91,11,11,-58,-60,-61,-62,-70,11,-72,-79,-80,-82,-83,-92,-94,11,11,-66,-59,-41,11,-93,-43,-44,-65,11,-42,-67,]),'FUNC_IDENT':([0,1,2,6,7,8,10,11,12,17,18,20,21,25,27,28,29,30,31,32,33,34,35,37,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,106,107,108,109,110,111,113,115,117,118,],[13,13,-37,-95,38,38,-45,38,-48,-69,-36,-49,-50,38,-71,-81,38,-84,-85,-87,-88,-89,-90,38,-64,38,-46,-47,38,38,38,-38,-63,-68,-39,-40,13,38,-73,-74,-75,-76,-77,-78,38,38,38,38,-86,-91,38,13,13,-58,-60,-61,-62,-70,13,-72,-79,-80,-82,-83,-92,-94,13,13,-66,-59,38,-41,13,-93,-43,-44,-65,13,-42,-67,]),'IDENT':([0,1,2,6,7,8,10,11,12,17,18,20,21,25,27,28,29,30,31,32,33,34,35,37,43,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,106,107,108,109,110,111,113,115,117,118,],[14,14,-37,-95,32,32,-45,32,-48,-69,-36,-49,-50,32,-71,-81,32,-84,-85,-87,-88,-89,-90,32,-64,-46,-47,32,32,32,-38,-63,-68,-39,-40,14,32,-73,-74,-75,-76,-77,-78,32,32,32,32,-86,-91,32,14,14,-58,-60,-61,-62,-70,14,-72,-79,-80,-82,-83,-92,-94,14,14,-66,-59,32,-41,14,-93,-43,-44,-65,14,-42,-67,]),'RANGE_IDENT':([0,1,2,5,9,10,11,12,17,18,20,21,24,27,28,30,31,32,33,34,35,36,43,46,47,48,51,52,53,54,55,56,57,58,70,71,73,74,75,76,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,104,105,106,107,108,109,110,111,113,115,117,118,],[16,16,-37,-95,43,-45,43,-48,-69,-36,-49,-50,43,-71,-81,-84,-85,-87,-88,-89,-90,43,-64,-46,-47,43,43,89,-38,-63,-68,-39,-40,16,-86,-91,43,16,16,43,-58,-60,-61,-62,-70,16,-72,-79,-80,-82,-83,-92,-94,16,16,-66,-59,43,-41,16,-93,-43,-44,-65,16,-42,-67,]),'SHEET_IDENT':([0,1,2,3,6,7,8,10,11,12,17,18,19,20,21,22,25,27,28,29,30,31,32,33,34,35,37,43,44,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,103,104,105,106,107,108,109,110,111,113,115,117,118,],[4,4,-37,-95,-95,39,39,-45,39,-48,-69,-36,53,-49,-50,54,39,-71,-81,39,-84,-85,-87,-88,-89,-90,39,-64,39,-46,-47,85,39,39,-38,-63,-68,-39,-40,4,39,-73,-74,-75,-76,-77,-78,39,39,39,39,-86,-91,85,4,4,-58,-60,-61,-62,-70,4,-72,-79,-80,-82,-83,-92,-94,4,4,39,-66,-59,85,-41,4,-93,-43,-44,-65,4,-42,-67,]),'DOLLAR':([0,1,2,6,7,8,10,11,12,17,18,20,21,25,27,28,29,30,31,32,33,34,35,37,43,44,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,80,86,87,88,89,90,91,92,93,94,95,96,98,99,100,103,104,105,106,107,108,109,110,111,113,115,117,118,],[17,17,-37,-95,17,17,-45,17,-48,-69,-36,-49,-50,17,-71,-81,17,-84,-85,-87,-88,-89,-90,17,-64,17,-46,-47,17,17,17,-38,-63,-68,-39,-40,17,17,-73,-74,-75,-76,-77,-78,17,17,17,17,-86,-91,17,17,17,-58,-60,-61,-62,-70,17,-72,-79,-80,-82,-83,-92,-94,17,17,17,-66,-59,17,-41,17,-93,-43,-44,-65,17,-42,-67,]),'$end':([1,2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,70,71,80,86,87,88,89,91,92,93,94,95,96,98,104,105,107,109,110,111,113,117,118,],[0,-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'ENDIF':([2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,70,71,80,86,87,88,89,90,91,92,93,94,95,96,98,104,105,107,109,110,111,113,115,117,118,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,107,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,117,-42,-67,]),'ELSE':([2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,70,71,80,86,87,88,89,90,91,92,93,94,95,96,98,104,105,107,109,110,111,113,117,118,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,108,-72,-79,-80,-82,-83,-92,-94,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'DONE':([2,10,12,17,18,27,28,30,31,32,33,34,35,43,46,47,53,54,55,56,57,70,71,80,86,87,88,89,91,92,93,94,95,96,98,99,100,104,105,107,109,110,111,113,117,118,],[-37,-45,-48,-69,-36,-71,-81,-84,-85,-87,-88,-89,-90,-64,-46,-47,-38,-63,-68,-39,-40,-86,-91,-58,-60,-61,-62,-70,-72,-79,-80,-82,-83,-92,-94,110,111,-66,-59,-41,-93,-43,-44,-65,-42,-67,]),'INFO_STRING':([3,5,6,],[20,20,20,]),'ASSIGN':([4,14,15,16,17,55,89,],[22,49,50,51,-69,-68,-70,]),'SQUOTE':([4,39,85,],[23,23,23,]),'RANGE':([5,9,11,20,21,24,36,48,51,73,76,106,],[-95,44,44,-49,-50,44,44,44,44,44,44,44,]),'LSQUARE':([5,9,11,13,17,20,21,24,36,38,42,43,47,48,51,55,56,71,73,76,84,88,89,101,104,106,113,118,],[-95,45,45,48,-69,-49,-50,45,45,73,77,-64,77,45,45,-68,77,77,45,45,77,77,-70,77,-66,45,-65,-67,]),'MINUS':([6,7,8,11,17,20,21,25,27,28,30,31,32,33,34,35,37,43,48,49,50,55,59,60,61,62,63,64,65,66,67,68,69,70,71,73,89,91,92,93,94,95,96,98,104,106,109,113,118,],[-95,29,29,29,-69,-49,-50,29,67,-81,-84,-85,-87,-88,-89,-90,29,-64,29,29,29,-68,29,-73,-74,-75,-76,-77,-78,29,29,29,29,-86,-91,29,-70,67,-79,-80,-82,-83,-92,-94,-66,29,-93,-65,-67,]),'DECIMAL_LITERAL':([6,7,8,11,20,21,25,29,37,48,49,50,59,60,61,62,63,64,65,66,67,68,69,73,106,],[-95,33,33,33,-49,-50,33,33,33,33,33,33,33,-73,-74,-75,-76,-77,-78,33,33,33,33,33,33,]),'NUMBER_SIGN':([6,7,8,11,20,21,25,29,37,48,49,50,59,60,61,62,63,64,65,66,67,68,69,73,106,],[-95,36,36,36,-49,-50,36,36,36,36,36,36,36,-73,-74,-75,-76,-77,-78,36,36,36,36,36,36,]),'LPAREN':([6,7,8,11,20,21,25,29,37,48,49,50,59,60,61,62,63,64,65,66,67,68,69,73,106,],[-95,37,37,37,-49,-50,37,37,37,37,37,37,37,-73,-74,-75,-76,-77,-78,37,37,37,37,37,37,]),'MULT':([17,28,30,31,32,33,34,35,43,55,70,71,89,92,93,94,95,96,98,104,109,113,118,],[-69,68,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,68,68,-82,-83,-92,-94,-66,-93,-65,-67,]),'DIV':([17,28,30,31,32,33,34,35,43,55,70,71,89,92,93,94,95,96,98,104,109,113,118,],[-69,69,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,69,69,-82,-83,-92,-94,-66,-93,-65,-67,]),'PLUS':([17,27,28,30,31,32,33,34,35,43,55,70,71,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,66,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,66,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'THEN':([17,26,27,28,30,31,32,33,34,35,43,55,70,71,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,58,-71,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'EQ':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,60,-71,-81,-84,-85,-87,-88,-89,-90,60,-64,60,-68,60,-86,-91,60,60,60,60,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'NOTEQ':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,61,-71,-81,-84,-85,-87,-88,-89,-90,61,-64,61,-68,61,-86,-91,61,61,61,61,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'LT':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,62,-71,-81,-84,-85,-87,-88,-89,-90,62,-64,62,-68,62,-86,-91,62,62,62,62,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'LTEQ':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,63,-71,-81,-84,-85,-87,-88,-89,-90,63,-64,63,-68,63,-86,-91,63,63,63,63,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'GT':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,64,-71,-81,-84,-85,-87,-88,-89,-90,64,-64,64,-68,64,-86,-91,64,64,64,64,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'GTEQ':([17,26,27,28,30,31,32,33,34,35,40,43,46,55,57,70,71,72,83,86,87,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,65,-71,-81,-84,-85,-87,-88,-89,-90,65,-64,65,-68,65,-86,-91,65,65,65,65,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'DO':([17,27,28,30,31,32,33,34,35,40,41,42,43,55,70,71,89,91,92,93,94,95,96,98,101,104,109,113,118,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,74,75,-52,-64,-68,-86,-91,-70,-72,-79,-80,-82,-83,-92,-94,-51,-66,-93,-65,-67,]),'RPAREN':([17,27,28,30,31,32,33,34,35,43,55,70,71,72,89,91,92,93,94,95,96,98,104,109,113,118,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,-68,-86,-91,96,-70,-72,-79,-80,-82,-83,-92,-94,-66,-93,-65,-67,]),'RSQUARE':([17,27,28,30,31,32,33,34,35,43,48,55,70,71,73,79,81,82,83,84,85,89,91,92,93,94,95,96,97,98,104,109,113,114,116,118,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,-64,80,-68,-86,-91,98,104,105,-54,-55,-56,-57,-70,-72,-79,-80,-82,-83,-92,109,-94,-66,-93,-65,-53,118,-67,]),'COMMA':([17,27,28,30,31,32,33,34,35,41,42,43,55,70,71,81,82,83,84,85,89,91,92,93,94,95,96,97,98,101,102,104,109,113,114,118,],[-69,-71,-81,-84,-85,-87,-88,-89,-90,76,-52,-64,-68,-86,-91,106,-54,-55,-56,-57,-70,-72,-79,-80,-82,-83,-92,106,-94,-51,112,-66,-93,-65,-53,-67,]),'DOTDOT':([17,55,78,89,],[-69,-68,103,-70,]),'COLON':([17,],[52,]),'COORDINATE_IDENT':([23,],[55,]),'INT_LITERAL':([77,112,],[102,116,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'statement_list':([0,58,74,75,108,],[1,90,99,100,115,]),'statement':([0,1,58,74,75,90,99,100,108,115,],[2,18,2,2,2,18,18,18,2,18,]),'subroutine_call':([0,1,58,74,75,90,99,100,108,115,],[10,10,10,10,10,10,10,10,10,10,]),'assignment':([0,1,58,74,75,90,99,100,108,115,],[12,12,12,12,12,12,12,12,12,12,]),'cell_ref':([0,1,7,8,11,25,29,37,44,48,49,50,58,59,66,67,68,69,73,74,75,90,99,100,103,106,108,115,],[15,15,35,35,35,35,35,35,78,35,35,35,15,35,35,35,35,35,35,15,15,15,15,15,113,35,15,15,]),'info_string_opt':([3,5,6,],[19,24,25,]),'empty':([3,5,6,],[21,21,21,]),'scalar_expr':([7,8,11,25,37,48,49,50,73,106,],[26,40,46,57,72,83,86,87,83,83,]),'simple_expr':([7,8,11,25,37,48,49,50,59,73,106,],[27,27,27,27,27,27,27,27,91,27,27,]),'term':([7,8,11,25,37,48,49,50,59,66,67,73,106,],[28,28,28,28,28,28,28,28,28,92,93,28,28,]),'factor':([7,8,11,25,37,48,49,50,59,66,67,68,69,73,106,],[30,30,30,30,30,30,30,30,30,30,30,94,95,30,30,]),'atom':([7,8,11,25,29,37,48,49,50,59,66,67,68,69,73,106,],[31,31,31,31,70,31,31,31,31,31,31,31,31,31,31,31,]),'function_call':([7,8,11,25,29,37,45,48,49,50,59,66,67,68,69,73,106,],[34,34,34,34,34,34,79,34,34,34,34,34,34,34,34,34,34,]),'range_list':([9,],[41,]),'range_expr':([9,11,24,36,48,51,73,76,106,],[42,47,56,71,84,88,84,101,84,]),'compare':([26,40,46,57,72,83,86,87,],[59,59,59,59,59,59,59,59,]),'arguments':([48,73,],[81,97,]),'arg_expr':([48,73,106,],[82,82,114,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> statement_list","S'",1,None,None,None),
+  ('program -> function_or_variable_definition_star statement_list','program',2,'p_program','main.py',179),
+  ('function_or_variable_definition_star -> function_or_variable_definition_star function_or_variable_definition','function_or_variable_definition_star',2,'p_function_or_variable_definition_star','main.py',185),
+  ('function_or_variable_definition_star -> empty','function_or_variable_definition_star',1,'p_function_or_variable_definition_star','main.py',186),
+  ('function_or_variable_definition -> variable_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',193),
+  ('function_or_variable_definition -> function_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',194),
+  ('function_or_variable_definition -> subroutine_definition','function_or_variable_definition',1,'p_function_or_variable_definition','main.py',195),
+  ('variable_definition_star -> variable_definition_star variable_definition','variable_definition_star',2,'p_variable_definition_star','main.py',199),
+  ('variable_definition_star -> empty','variable_definition_star',1,'p_variable_definition_star','main.py',200),
+  ('variable_definition -> scalar_definition','variable_definition',1,'p_variable_definition','main.py',209),
+  ('variable_definition -> range_definition','variable_definition',1,'p_variable_definition','main.py',210),
+  ('variable_definition -> sheet_definition','variable_definition',1,'p_variable_definition','main.py',211),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN SCALAR IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',216),
+  ('function_definition -> FUNCTION FUNC_IDENT LSQUARE formals_opt RSQUARE RETURN RANGE IS variable_definition_star statement_list END','function_definition',11,'p_function_definition','main.py',217),
+  ('subroutine_definition -> SUBROUTINE FUNC_IDENT LSQUARE formals_opt RSQUARE IS variable_definition_star statement_list END','subroutine_definition',9,'p_subroutine_definition','main.py',234),
+  ('formals_opt -> formals','formals_opt',1,'p_formals_opt','main.py',246),
+  ('formals_opt -> empty','formals_opt',1,'p_formals_opt','main.py',247),
+  ('formals -> formals COMMA formal_arg','formals',3,'p_formals','main.py',251),
+  ('formals -> formal_arg','formals',1,'p_formals','main.py',252),
+  ('formal_arg -> IDENT COLON SCALAR','formal_arg',3,'p_formal_arg','main.py',261),
+  ('formal_arg -> RANGE_IDENT COLON RANGE','formal_arg',3,'p_formal_arg','main.py',262),
+  ('formal_arg -> SHEET_IDENT COLON SHEET','formal_arg',3,'p_formal_arg','main.py',263),
+  ('sheet_definition -> SHEET SHEET_IDENT sheet_init_opt','sheet_definition',3,'p_sheet_definition','main.py',274),
+  ('sheet_init_opt -> sheet_init','sheet_init_opt',1,'p_sheet_init_opt','main.py',281),
+  ('sheet_init_opt -> empty','sheet_init_opt',1,'p_sheet_init_opt','main.py',282),
+  ('sheet_init -> EQ sheet_init_list','sheet_init',2,'p_sheet_init','main.py',286),
+  ('sheet_init -> EQ INT_LITERAL MULT INT_LITERAL','sheet_init',4,'p_sheet_init','main.py',287),
+  ('sheet_init_list -> LCURLY sheet_row_plus RCURLY','sheet_init_list',3,'p_sheet_init_list','main.py',295),
+  ('sheet_row_plus -> sheet_row_plus sheet_row','sheet_row_plus',2,'p_sheet_row_plus','main.py',299),
+  ('sheet_row_plus -> sheet_row','sheet_row_plus',1,'p_sheet_row_plus','main.py',300),
+  ('sheet_row -> sheet_row COMMA simple_expr','sheet_row',3,'p_sheet_row','main.py',309),
+  ('sheet_row -> simple_expr','sheet_row',1,'p_sheet_row','main.py',310),
+  ('range_definition -> RANGE RANGE_IDENT','range_definition',2,'p_range_definition','main.py',319),
+  ('range_definition -> RANGE RANGE_IDENT EQ range_expr','range_definition',4,'p_range_definition','main.py',320),
+  ('scalar_definition -> SCALAR IDENT','scalar_definition',2,'p_scalar_definition','main.py',330),
+  ('scalar_definition -> SCALAR IDENT EQ scalar_expr','scalar_definition',4,'p_scalar_definition','main.py',331),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','main.py',341),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','main.py',342),
+  ('statement -> PRINT_SHEET info_string_opt SHEET_IDENT','statement',3,'p_statement','main.py',353),
+  ('statement -> PRINT_RANGE info_string_opt range_expr','statement',3,'p_statement','main.py',354),
+  ('statement -> PRINT_SCALAR info_string_opt scalar_expr','statement',3,'p_statement','main.py',355),
+  ('statement -> IF scalar_expr THEN statement_list ENDIF','statement',5,'p_statement','main.py',356),
+  ('statement -> IF scalar_expr THEN statement_list ELSE statement_list ENDIF','statement',7,'p_statement','main.py',357),
+  ('statement -> WHILE scalar_expr DO statement_list DONE','statement',5,'p_statement','main.py',358),
+  ('statement -> FOR range_list DO statement_list DONE','statement',5,'p_statement','main.py',359),
+  ('statement -> subroutine_call','statement',1,'p_statement','main.py',360),
+  ('statement -> RETURN scalar_expr','statement',2,'p_statement','main.py',361),
+  ('statement -> RETURN range_expr','statement',2,'p_statement','main.py',362),
+  ('statement -> assignment','statement',1,'p_statement','main.py',363),
+  ('info_string_opt -> INFO_STRING','info_string_opt',1,'p_info_string_opt','main.py',407),
+  ('info_string_opt -> empty','info_string_opt',1,'p_info_string_opt','main.py',408),
+  ('range_list -> range_list COMMA range_expr','range_list',3,'p_range_list','main.py',412),
+  ('range_list -> range_expr','range_list',1,'p_range_list','main.py',413),
+  ('arguments -> arguments COMMA arg_expr','arguments',3,'p_arguments','main.py',422),
+  ('arguments -> arg_expr','arguments',1,'p_arguments','main.py',423),
+  ('arg_expr -> scalar_expr','arg_expr',1,'p_arg_expr','main.py',434),
+  ('arg_expr -> range_expr','arg_expr',1,'p_arg_expr','main.py',435),
+  ('arg_expr -> SHEET_IDENT','arg_expr',1,'p_arg_expr','main.py',436),
+  ('subroutine_call -> FUNC_IDENT LSQUARE RSQUARE','subroutine_call',3,'p_subroutine_call','main.py',443),
+  ('subroutine_call -> FUNC_IDENT LSQUARE arguments RSQUARE','subroutine_call',4,'p_subroutine_call','main.py',444),
+  ('assignment -> IDENT ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',451),
+  ('assignment -> cell_ref ASSIGN scalar_expr','assignment',3,'p_assignment','main.py',452),
+  ('assignment -> RANGE_IDENT ASSIGN range_expr','assignment',3,'p_assignment','main.py',453),
+  ('assignment -> SHEET_IDENT ASSIGN SHEET_IDENT','assignment',3,'p_assignment','main.py',454),
+  ('range_expr -> RANGE_IDENT','range_expr',1,'p_range_expr','main.py',477),
+  ('range_expr -> RANGE cell_ref DOTDOT cell_ref','range_expr',4,'p_range_expr','main.py',478),
+  ('range_expr -> LSQUARE function_call RSQUARE','range_expr',3,'p_range_expr','main.py',479),
+  ('range_expr -> range_expr LSQUARE INT_LITERAL COMMA INT_LITERAL RSQUARE','range_expr',6,'p_range_expr','main.py',480),
+  ('cell_ref -> SHEET_IDENT SQUOTE COORDINATE_IDENT','cell_ref',3,'p_cell_ref','main.py',501),
+  ('cell_ref -> DOLLAR','cell_ref',1,'p_cell_ref','main.py',502),
+  ('cell_ref -> DOLLAR COLON RANGE_IDENT','cell_ref',3,'p_cell_ref','main.py',503),
+  ('scalar_expr -> simple_expr','scalar_expr',1,'p_scalar_expr','main.py',525),
+  ('scalar_expr -> scalar_expr compare simple_expr','scalar_expr',3,'p_scalar_expr','main.py',526),
+  ('compare -> EQ','compare',1,'p_compare','main.py',539),
+  ('compare -> NOTEQ','compare',1,'p_compare','main.py',540),
+  ('compare -> LT','compare',1,'p_compare','main.py',541),
+  ('compare -> LTEQ','compare',1,'p_compare','main.py',542),
+  ('compare -> GT','compare',1,'p_compare','main.py',543),
+  ('compare -> GTEQ','compare',1,'p_compare','main.py',544),
+  ('simple_expr -> simple_expr PLUS term','simple_expr',3,'p_simple_expr','main.py',548),
+  ('simple_expr -> simple_expr MINUS term','simple_expr',3,'p_simple_expr','main.py',549),
+  ('simple_expr -> term','simple_expr',1,'p_simple_expr','main.py',550),
+  ('term -> term MULT factor','term',3,'p_term','main.py',563),
+  ('term -> term DIV factor','term',3,'p_term','main.py',564),
+  ('term -> factor','term',1,'p_term','main.py',565),
+  ('factor -> atom','factor',1,'p_factor','main.py',579),
+  ('factor -> MINUS atom','factor',2,'p_factor','main.py',580),
+  ('atom -> IDENT','atom',1,'p_atom','main.py',588),
+  ('atom -> DECIMAL_LITERAL','atom',1,'p_atom','main.py',589),
+  ('atom -> function_call','atom',1,'p_atom','main.py',590),
+  ('atom -> cell_ref','atom',1,'p_atom','main.py',591),
+  ('atom -> NUMBER_SIGN range_expr','atom',2,'p_atom','main.py',592),
+  ('atom -> LPAREN scalar_expr RPAREN','atom',3,'p_atom','main.py',593),
+  ('function_call -> FUNC_IDENT LSQUARE arguments RSQUARE','function_call',4,'p_function_call','main.py',619),
+  ('function_call -> FUNC_IDENT LSQUARE RSQUARE','function_call',3,'p_function_call','main.py',620),
+  ('empty -> <empty>','empty',0,'p_empty','main.py',628),
+]
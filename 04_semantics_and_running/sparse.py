@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+#
+# Sparse sheets: huge sheets of which a program only uses a few cells.
+#
+# sheet X = 10000 * 10000 is 800 MB as a dense array of floats. A
+# SparseSheet keeps its cells in square blocks of BLOCK * BLOCK cells, in a
+# dict by block coordinates, and allocates a block when a cell of it is first
+# written; cells of missing blocks are zero. When the blocks cover more than
+# DENSE_FRACTION of the cells, the sheet moves its cells into one dense NumPy
+# array and works like one from then on.
+#
+# The engines use a sheet through indexing, so a SparseSheet has the
+# operations of a 2 dimensional array they use: sheet[row, col] to read and
+# write a cell, sheet[rows, cols] (slices) for the cells of a range, and
+# iteration over rows (print_sheet). A range of a sparse sheet is a
+# SparseRange, a window into the sheet (reads and writes go to the sheet,
+# like through a NumPy view), which runtime.shift_range moves with shift().
+# Reductions (the built-in functions) and printing read a window as a dense
+# array, through __array__.
+
+import hashlib
+
+import numpy
+
+# Width and height of a block
+BLOCK = 64
+
+# A sparse sheet becomes dense when its blocks hold this part of its cells
+DENSE_FRACTION = 0.25
+
+class SparseSheet:
+    '''A sheet of shape (rows, columns) of dtype whose cells are zero
+       until written
+
+       zero: the value of the cells not written (of dtype)'''
+
+    ndim = 2
+
+    def __init__(self, shape, dtype, zero):
+        self.shape = shape
+        self.dtype = numpy.dtype(dtype)
+        self.size = shape[0] * shape[1]
+        self.zero = zero
+        self.blocks = {}
+        # the cells, once the sheet is dense
+        self.dense = None
+
+    def __repr__(self):
+        state = "dense" if self.dense is not None else f"{len(self.blocks)} blocks"
+        return f"<sparse sheet {self.shape[0]} * {self.shape[1]}, {state}>"
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def nbytes(self):
+        if self.dense is not None:
+            return self.dense.nbytes
+        return sum(block.nbytes for block in self.blocks.values())
+
+    def check(self, row, col):
+        if not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]):
+            raise IndexError(f"cell ({row}, {col}) is outside of a sheet of shape {self.shape}")
+
+    def get(self, row, col):
+        '''Cell (row, col)'''
+        if self.dense is not None:
+            return self.dense[row, col]
+        self.check(row, col)
+        block = self.blocks.get((row // BLOCK, col // BLOCK))
+        if block is None:
+            return self.zero
+        return block[row % BLOCK, col % BLOCK]
+
+    def set(self, row, col, value):
+        '''Write cell (row, col)'''
+        if self.dense is not None:
+            self.dense[row, col] = value
+            return
+        self.check(row, col)
+        key = (row // BLOCK, col // BLOCK)
+        block = self.blocks.get(key)
+        if block is None:
+            block = self.blocks[key] = numpy.full((BLOCK, BLOCK), self.zero, dtype=self.dtype)
+            block[row % BLOCK, col % BLOCK] = value
+            if len(self.blocks) * BLOCK * BLOCK > DENSE_FRACTION * self.size:
+                self.densify()
+            return
+        block[row % BLOCK, col % BLOCK] = value
+
+    def write(self, row, col, values):
+        '''Write the cells of the 2 dimensional array values from cell
+           (row, col) on'''
+        if self.dense is not None:
+            self.dense[row:row + values.shape[0], col:col + values.shape[1]] = values
+            return
+        bottom, right = row + values.shape[0], col + values.shape[1]
+        self.check(row, col)
+        self.check(bottom - 1, right - 1)
+        for i in range(row // BLOCK, (bottom - 1) // BLOCK + 1):
+            for j in range(col // BLOCK, (right - 1) // BLOCK + 1):
+                block = self.blocks.get((i, j))
+                if block is None:
+                    block = self.blocks[i, j] = numpy.full((BLOCK, BLOCK), self.zero, dtype=self.dtype)
+                top, left = max(row, i * BLOCK), max(col, j * BLOCK)
+                end, last = min(bottom, (i + 1) * BLOCK), min(right, (j + 1) * BLOCK)
+                block[top - i * BLOCK:end - i * BLOCK, left - j * BLOCK:last - j * BLOCK] = \
+                    values[top - row:end - row, left - col:last - col]
+        if len(self.blocks) * BLOCK * BLOCK > DENSE_FRACTION * self.size:
+            self.densify()
+
+    def densify(self):
+        '''Move the cells into one dense array'''
+        dense = numpy.full(self.shape, self.zero, dtype=self.dtype)
+        for (i, j), block in self.blocks.items():
+            part = dense[i * BLOCK:(i + 1) * BLOCK, j * BLOCK:(j + 1) * BLOCK]
+            part[...] = block[:part.shape[0], :part.shape[1]]
+        self.dense = dense
+        self.blocks = {}
+
+    def window(self, rows, cols):
+        '''The cells of rows (start, stop) and cols as a dense copy'''
+        if self.dense is not None:
+            return self.dense[rows[0]:rows[1], cols[0]:cols[1]].copy()
+        result = numpy.full((rows[1] - rows[0], cols[1] - cols[0]), self.zero, dtype=self.dtype)
+        for i in range(rows[0] // BLOCK, (rows[1] - 1) // BLOCK + 1):
+            for j in range(cols[0] // BLOCK, (cols[1] - 1) // BLOCK + 1):
+                block = self.blocks.get((i, j))
+                if block is None:
+                    continue
+                top, left = max(rows[0], i * BLOCK), max(cols[0], j * BLOCK)
+                bottom, right = min(rows[1], (i + 1) * BLOCK), min(cols[1], (j + 1) * BLOCK)
+                result[top - rows[0]:bottom - rows[0], left - cols[0]:right - cols[0]] = \
+                    block[top - i * BLOCK:bottom - i * BLOCK, left - j * BLOCK:right - j * BLOCK]
+        return result
+
+    def __getitem__(self, index):
+        row, col = index
+        if isinstance(row, slice):
+            if self.dense is not None:
+                return self.dense[index]
+            rows = range(*row.indices(self.shape[0]))
+            cols = range(*col.indices(self.shape[1]))
+            return SparseRange(self, rows.start, cols.start, (len(rows), len(cols)))
+        return self.get(row, col)
+
+    def __setitem__(self, index, value):
+        self.set(index[0], index[1], value)
+
+    def __iter__(self):
+        columns = self.shape[1]
+        for row in range(self.shape[0]):
+            yield self.window((row, row + 1), (0, columns))[0]
+
+    def __array__(self, dtype=None, copy=None):
+        result = self.window((0, self.shape[0]), (0, self.shape[1]))
+        return result if dtype is None else result.astype(dtype)
+
+    def key(self):
+        '''A hashable key of the cells (for memo.argument_key), without
+           making them dense'''
+        digest = hashlib.blake2b(digest_size=16)
+        if self.dense is not None:
+            blocks = [((), self.dense)]
+        else:
+            blocks = sorted(self.blocks.items(), key=lambda item: item[0])
+        for position, block in blocks:
+            digest.update(repr(position).encode())
+            if self.dtype == object:
+                digest.update(repr(block.tolist()).encode())
+            else:
+                digest.update(block.tobytes())
+        return (self.shape, self.dtype.str, digest.digest())
+
+class SparseRange:
+    '''The cells of a range of a SparseSheet: shape (rows, columns) from
+       cell (row, col) on, or, if flat, the same cells one dimensional'''
+
+    def __init__(self, sheet, row, col, shape, flat=False):
+        self.sheet = sheet
+        self.row, self.col = row, col
+        self.shape2 = shape
+        self.flat1 = flat
+        self.dtype = sheet.dtype
+        self.size = shape[0] * shape[1]
+
+    def __repr__(self):
+        return f"<range of {self.shape2[0]} * {self.shape2[1]} at ({self.row}, {self.col}) of {self.sheet!r}>"
+
+    @property
+    def shape(self):
+        return (self.size,) if self.flat1 else self.shape2
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def position(self, index):
+        '''The (row, col) in the sheet of index'''
+        if self.flat1:
+            # a range has one row or one column
+            if not 0 <= index < self.size:
+                raise IndexError(f"index {index} is outside of a range of {self.size} cells")
+            return (self.row, self.col + index) if self.shape2[0] == 1 else (self.row + index, self.col)
+        row, col = index
+        if not (0 <= row < self.shape2[0] and 0 <= col < self.shape2[1]):
+            raise IndexError(f"cell ({row}, {col}) is outside of a range of shape {self.shape2}")
+        return self.row + row, self.col + col
+
+    def __getitem__(self, index):
+        return self.sheet.get(*self.position(index))
+
+    def __setitem__(self, index, value):
+        self.sheet.set(*self.position(index), value)
+
+    def reshape(self, shape):
+        '''The cells one dimensional (reshape(-1)), still in the sheet'''
+        return SparseRange(self.sheet, self.row, self.col, self.shape2, True)
+
+    def shift(self, columns, rows):
+        '''The range moved by columns to the right and rows down'''
+        row, col = self.row + rows, self.col + columns
+        height, width = self.shape2
+        if row < 0 or col < 0 or row + height > self.sheet.shape[0] or col + width > self.sheet.shape[1]:
+            raise IndexError(f"range shifted by [{columns}, {rows}] is outside of its sheet")
+        return SparseRange(self.sheet, row, col, self.shape2, self.flat1)
+
+    def __array__(self, dtype=None, copy=None):
+        result = self.sheet.window((self.row, self.row + self.shape2[0]), (self.col, self.col + self.shape2[1]))
+        if self.flat1:
+            result = result.reshape(-1)
+        return result if dtype is None else result.astype(dtype)
+
+    def ravel(self):
+        return numpy.asarray(self).ravel()
+
+    @property
+    def flat(self):
+        return numpy.asarray(self).flat
+
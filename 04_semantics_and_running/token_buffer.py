@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+#
+# A compact store of the tokens of a program.
+#
+# PLY makes a LexToken object (with an attribute dictionary) per token. A
+# TokenBuffer keeps the tokens in arrays instead: the token type as a small
+# int, the line and the position, and a value index. Identifiers, info
+# strings and other names are interned in a string table (one str object per
+# distinct name), number literals are kept in a side array of integers.
+#
+# BufferLexer feeds the tokens of a buffer to the PLY parser, making
+# LexTokens one at a time. The values are the interned strings of the
+# table, so the names in the syntax tree, and the keys of the symbol tables
+# made from them, are shared objects too.
+
+from array import array
+from decimal import Decimal
+import sys
+
+from ply.lex import LexToken
+
+# Number literal types, kept in the numbers array: INT_LITERAL as is and
+# DECIMAL_LITERAL (one decimal) in tenths
+INT_LITERAL = 'INT_LITERAL'
+DECIMAL_LITERAL = 'DECIMAL_LITERAL'
+
+# The range of the numbers array, other literals (and -0.0) are kept as text
+NUMBER_MIN, NUMBER_MAX = -2**63, 2**63 - 1
+
+class TokenBuffer:
+    '''The tokens of a program in arrays
+
+       types: all token types of the lexer (main.tokens)'''
+
+    def __init__(self, types):
+        self.types = tuple(types)
+        self.type_index = {type: i for i, type in enumerate(self.types)}
+        self.kind = array('B')
+        self.value = array('l')
+        self.lineno = array('l')
+        self.lexpos = array('q')
+        self.strings = []
+        self.string_index = {}
+        self.numbers = array('q')
+
+    def __len__(self):
+        return len(self.kind)
+
+    def intern(self, text):
+        '''Index of text in the string table'''
+        index = self.string_index.get(text)
+        if index is None:
+            index = self.string_index[text] = len(self.strings)
+            self.strings.append(sys.intern(text))
+        return index
+
+    def append(self, type, value, lineno, lexpos):
+        '''Add a token'''
+        self.kind.append(self.type_index[type])
+        self.lineno.append(lineno)
+        self.lexpos.append(lexpos)
+        if type == INT_LITERAL or type == DECIMAL_LITERAL:
+            if type == INT_LITERAL:
+                number = value
+                exact = NUMBER_MIN <= number <= NUMBER_MAX
+            else:
+                number = int(value.scaleb(1))
+                exact = (NUMBER_MIN <= number <= NUMBER_MAX
+                         and str(Decimal(number).scaleb(-1)) == str(value))
+            if exact:
+                self.value.append(len(self.numbers))
+                self.numbers.append(number)
+            else:
+                # a negative index refers to the text of the literal
+                self.value.append(~self.intern(str(value)))
+        else:
+            self.value.append(self.intern(value))
+
+    def extend(self, lexer):
+        '''Add all tokens of a lexer (anything with a PLY style token())'''
+        append = self.append
+        for token in iter(lexer.token, None):
+            append(token.type, token.value, token.lineno, token.lexpos)
+        return self
+
+    def token_value(self, i):
+        '''The value of token i as the lexer gave it'''
+        type = self.types[self.kind[i]]
+        index = self.value[i]
+        if type == INT_LITERAL:
+            return int(self.strings[~index]) if index < 0 else self.numbers[index]
+        if type == DECIMAL_LITERAL:
+            if index < 0:
+                return Decimal(self.strings[~index])
+            return Decimal(self.numbers[index]).scaleb(-1)
+        return self.strings[index]
+
+    def token(self, i):
+        '''Token i as a LexToken'''
+        token = LexToken()
+        token.type = self.types[self.kind[i]]
+        token.value = self.token_value(i)
+        token.lineno = self.lineno[i]
+        token.lexpos = self.lexpos[i]
+        return token
+
+    def fragment(self):
+        '''An empty buffer sharing the string and number tables of this one,
+           for tokens to splice into it'''
+        fragment = TokenBuffer.__new__(TokenBuffer)
+        fragment.types, fragment.type_index = self.types, self.type_index
+        fragment.strings, fragment.string_index = self.strings, self.string_index
+        fragment.numbers = self.numbers
+        fragment.kind, fragment.value = array('B'), array('l')
+        fragment.lineno, fragment.lexpos = array('l'), array('q')
+        return fragment
+
+    def splice(self, start, end, fragment):
+        '''Replace tokens start..end-1 by the tokens of a fragment. (The numbers
+           of the replaced tokens stay in the number table.)'''
+        for column, new in zip(self.columns(), fragment.columns()):
+            column[start:end] = new
+
+    def columns(self):
+        return (self.kind, self.value, self.lineno, self.lexpos)
+
+    def nbytes(self):
+        '''Bytes used by the arrays (not the string table)'''
+        return sum(column.itemsize * len(column) for column in
+                   (self.kind, self.value, self.lineno, self.lexpos, self.numbers))
+
+class BufferLexer:
+    '''Gives the tokens of a TokenBuffer to the PLY parser (input, token)'''
+
+    def __init__(self, buffer, start=0, end=None):
+        self.buffer = buffer
+        self.position = start
+        self.end = len(buffer) if end is None else end
+        self.lineno = 1
+        # read by parsers with tracking=True for empty productions
+        self.lexpos = 0
+
+    def input(self, data):
+        '''The text is already in the buffer'''
+
+    def token(self):
+        position = self.position
+        if position >= self.end:
+            return None
+        self.position = position + 1
+        return self.buffer.token(position)
@@ -8,10 +8,63 @@
 child_prefix_default = "child_"
 children_prefix_default = "children_"
 value_attr = "value"
+sign_attr = "negative"
 type_attr = "nodetype"
 
 # Finding and creating a list of all children nodes of a node, based on
-# attribute names of a node
+# attribute names of a node.
+#
+# Which attributes of a node hold children only depends on the class of the
+# node and the names of its attributes, so that "child schema" is computed
+# once per class and attribute layout and cached: a tuple of
+# (attribute name, label, is_list) for each child attribute. Nodes can store
+# their attributes in a __dict__ or in __slots__ (then the layout is fixed
+# by the class).
+
+_schema_cache = dict()
+
+def slot_names(cls):
+  '''Names of all __slots__ of a class and its base classes'''
+  names = []
+  for klass in reversed(cls.__mro__):
+    slots = klass.__dict__.get("__slots__", ())
+    names.extend([slots] if isinstance(slots, str) else slots)
+  return names
+
+def child_schema(node, child_prefix=child_prefix_default,
+                 children_prefix=children_prefix_default):
+  '''Return the (cached) child schema of a node, or () for non-objects'''
+  try:
+    names = node.__dict__.keys()
+    key = (type(node), tuple(names), child_prefix, children_prefix)
+  except AttributeError:
+    key = (type(node), child_prefix, children_prefix)
+    names = None
+  schema = _schema_cache.get(key)
+  if schema is None:
+    if names is None:
+      names = slot_names(type(node))
+    schema = []
+    for name in names:
+      # An attribute containing one child node
+      if name.startswith(child_prefix):
+        schema.append((name, name[len(child_prefix):], False))
+      # An attribute containing a child list
+      elif name.startswith(children_prefix):
+        schema.append((name, name[len(children_prefix):], True))
+    schema = _schema_cache[key] = tuple(schema)
+  return schema
+
+# Labels of the elements of child lists, "label[0]", "label[1]", ...
+_item_labels = dict()
+
+def item_labels(label, count):
+  labels = _item_labels.get(label)
+  if labels is None:
+    labels = _item_labels[label] = []
+  while len(labels) < count:
+    labels.append(label+"["+str(len(labels))+"]")
+  return labels
 
 def get_childvars(node, child_prefix=child_prefix_default,
                   children_prefix=children_prefix_default):
@@ -27,32 +80,38 @@ def get_childvars(node, child_prefix=child_prefix_default,
   (in which case None is used as the second element, as there is no child).'''
 
   childvars = []
-  # Only search for attributes if we have an object
-  if hasattr(node, "__dict__"):
-    # Iterate though all attributes of the node object
-    for name,val in vars(node).items():
-      # An attribute containing one child node
-      if name.startswith(child_prefix):
-        label = name[len(child_prefix):]
-        childvars.append((label, val))
-      # An attribute containing a child list
-      elif name.startswith(children_prefix):
-        label = name[len(children_prefix):]
-        # Make sure contents is not None and is a list (or actually, can
-        # be iterated through
-        if val is None:
-          childvars.append((label+"[NONE stored instead of a list!!!]", None))
-        else:
-          assert not val is None, "'None' passed as children list!"
-          assert hasattr(val, "__iter__"), "Children list is not a list!!!"
-          # An empty list/iterable (no nodes)
-          if not val:
-            childvars.append((label+"[EMPTY]", None))
-          # A non-empty list/iterable
-          else:
-            childvars.extend([(label+"["+str(i)+"]", child) for (i, child) in enumerate(val)])
+  for name,label,is_list in child_schema(node, child_prefix, children_prefix):
+    val = getattr(node, name)
+    if not is_list:
+      childvars.append((label, val))
+    # Make sure contents is not None and is a list (or actually, can
+    # be iterated through
+    elif val is None:
+      childvars.append((label+"[NONE stored instead of a list!!!]", None))
+    else:
+      assert hasattr(val, "__iter__"), "Children list is not a list!!!"
+      # An empty list/iterable (no nodes)
+      if not val:
+        childvars.append((label+"[EMPTY]", None))
+      # A non-empty list/iterable
+      else:
+        childvars.extend(zip(item_labels(label, len(val)), val))
   return childvars
 
+def child_nodes(node):
+  '''Fast path of get_childvars for traversals that don't need labels:
+     return a list of the children of a node in the same order, without
+     the missing (None) children'''
+  children = []
+  for name,label,is_list in child_schema(node):
+    val = getattr(node, name)
+    if not is_list:
+      if val:
+        children.append(val)
+    elif val:
+      children.extend([child for child in val if child])
+  return children
+
 
 # Printing the syntax tree (AST)
 
@@ -100,86 +159,105 @@ def treeprint_indent(node, outtype="unicode", label="", first_indent="", indent=
   outtype = unicode/ascii
   label = the "role" of the subtree on the parent node (from attribute name)
   first_indent = what to print at the beginning of the first line (indentation)
-  indent = what to print at the beginning of the rest of the lines (indentation)'''
+  indent = what to print at the beginning of the rest of the lines (indentation)
   
-  # Add label (if any) to the first line after the indentation
-  if label:
-    first_indent += label + ": "
-  if not node:
-    # If node is None, just print NONE
-    print(first_indent + "NONE")
+  The subtrees still to print are kept on a stack instead of the Python
+  call stack, so that deep trees (long else if chains, ...) print too.'''
+
+  if outtype == "unicode":
+    child_indent, rest_indent = child_indent_uni, normal_indent_uni
+    last_child_indent, last_rest_indent = last_child_indent_uni, last_normal_indent_uni
   else:
+    child_indent, rest_indent = child_indent_asc, normal_indent_asc
+    last_child_indent, last_rest_indent = last_child_indent_asc, last_normal_indent_asc
+  # (node, label, first_indent, indent) of the subtrees to print, the next
+  # one last
+  stack = [(node, label, first_indent, indent)]
+  while stack:
+    node, label, first_indent, indent = stack.pop()
+    # Add label (if any) to the first line after the indentation
+    if label:
+      first_indent += label + ": "
+    if not node:
+      # If node is None, just print NONE
+      print(first_indent + "NONE")
+      continue
     # If node has node type attribute, print that, otherwise try to print the whole
     # node take help in finding the error
     if hasattr(node, type_attr):
-      print(first_indent + getattr(node, type_attr), end="")
+      line = first_indent + getattr(node, type_attr)
     else:
-      print(first_indent + "??? '" + str(node) + "' ???", end="")
+      line = first_indent + "??? '" + str(node) + "' ???"
     # If node has a value attribute, print the value of the node in parenthesis
     if hasattr(node, value_attr):
-      print(" (" + str(node.value) + ")")
-    else:
-      print()
-    # Get all children of the node and iterate through them
+      line += " (" + value_text(node) + ")"
+    print(line)
+    # Get all children of the node and push them last child first, so that
+    # they print in order
     childvars = get_childvars(node)
-    i = len(childvars)
-    for name,value in childvars:
-      i -= 1
-      if i > 0:
+    last = len(childvars) - 1
+    for i in range(last, -1, -1):
+      name, value = childvars[i]
+      if i < last:
         # Not the last child, use normal indentation
-        if outtype == "unicode":
-          first_indent = child_indent_uni
-          rest_indent = normal_indent_uni
-        else:
-          first_indent = child_indent_asc
-          rest_indent = normal_indent_asc
+        stack.append((value, name, indent+child_indent, indent+rest_indent))
       else:
         # The last child, use indentation for that case
-        if outtype == "unicode":
-          first_indent = last_child_indent_uni
-          rest_indent = last_normal_indent_uni
-        else:
-          first_indent = last_child_indent_asc
-          rest_indent = last_normal_indent_asc
-      # Recursively print the child subtrees, adding indentation
-      treeprint_indent(value, outtype, name, indent+first_indent,
-                indent+rest_indent)
+        stack.append((value, name, indent+last_child_indent, indent+last_rest_indent))
+
+def value_text(node):
+  '''The value of a node as text, with the sign of a negated node (-x)'''
+  if getattr(node, sign_attr, False):
+    return "-" + str(node.value)
+  return str(node.value)
 
 def treeprint_dot(node, nodenum, nodecount):
   '''Print a subtree in dot format.
   
   nodenum = number of the node (for dot id generation)
-  nodecount = a list containing the maximum used id'''
+  nodecount = a list containing the maximum used id
   
-  nodeline = dotnodeid(nodenum)
-  if not node:
-    # None is output as an ellipse with label NONE
-    nodeline += ' [shape="ellipse", label="NONE"]'
-    print(nodeline)
-  else:
-    # Normal nodes use the default shape
-    nodeline += ' [label="'
-    # If node has node type attribute, print that, otherwise try to print the whole
-    # node take help in finding the error
-    if hasattr(node, type_attr):
-      nodeline += getattr(node, type_attr)
-    else:
-      nodeline += "??? '" + str(node) + "' ???"
-    # If node has a value attribute, output the value in parenthesis
-    if hasattr(node, value_attr):
-      nodeline += " (" + str(node.value) + ")"
-    nodeline += '"]'
-    print(nodeline)
-    # Get all children of the node and iterate through them
-    childvars = get_childvars(node)
-    for name,value in childvars:
+  Like treeprint_indent, this keeps the subtrees to print on a stack. The
+  stack also has the lines of the connections (strings), which are printed
+  after the subtree of the child.'''
+  
+  # (node, number of the parent or None for the root, label)
+  stack = [(node, None, None)]
+  while stack:
+    item = stack.pop()
+    if isinstance(item, str):
+      print(item)
+      continue
+    node, parentnum, name = item
+    if parentnum is not None:
       # Number the child by one more than current maximum (and update maximum)
       nodecount[0] += 1
-      childnum = nodecount[0]
-      # Recursively print the child subtrees
-      treeprint_dot(value, childnum, nodecount)
-      # Output the named connection between parent and child
-      print(dotnodeid(nodenum)+"->"+dotnodeid(childnum)+ ' [label="'+name+'"]')
+      nodenum = nodecount[0]
+    nodeline = dotnodeid(nodenum)
+    if not node:
+      # None is output as an ellipse with label NONE
+      nodeline += ' [shape="ellipse", label="NONE"]'
+    else:
+      # Normal nodes use the default shape
+      nodeline += ' [label="'
+      # If node has node type attribute, print that, otherwise try to print the whole
+      # node take help in finding the error
+      if hasattr(node, type_attr):
+        nodeline += getattr(node, type_attr)
+      else:
+        nodeline += "??? '" + str(node) + "' ???"
+      # If node has a value attribute, output the value in parenthesis
+      if hasattr(node, value_attr):
+        nodeline += " (" + value_text(node) + ")"
+      nodeline += '"]'
+    print(nodeline)
+    # Output the named connection between parent and child after the subtree
+    if parentnum is not None:
+      stack.append(dotnodeid(parentnum)+"->"+dotnodeid(nodenum)+ ' [label="'+name+'"]')
+    if node:
+      # Get all children of the node, the first one is printed next
+      for name,value in reversed(get_childvars(node)):
+        stack.append((value, nodenum, name))
 
 def treeprint(rootnode, outtype="unicode"):
   '''Prints out a tree, given its root.